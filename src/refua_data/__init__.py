@@ -1,11 +1,9 @@
 """refua-data package API."""
 
-import tomllib
-from importlib.metadata import version as _distribution_version
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from .cache import CacheBackend, DataCache
+from .cache import CacheBackend, DataCache, SQLiteCacheBackend, XattrCacheBackend
 from .catalog import DatasetCatalog, get_default_catalog
 from .models import ApiDatasetConfig, DatasetDefinition, FetchResult, MaterializeResult
 from .provenance import (
@@ -18,8 +16,12 @@ if TYPE_CHECKING:
     from .pipeline import DatasetManager as DatasetManager
     from .validation import SourceValidationResult as SourceValidationResult
 
+    __version__: str
+
 
 def _read_version_from_pyproject() -> str | None:
+    import tomllib
+
     pyproject_path = Path(__file__).resolve().parents[2] / "pyproject.toml"
     if not pyproject_path.exists():
         return None
@@ -33,13 +35,17 @@ def _read_version_from_pyproject() -> str | None:
 
 
 def _resolve_version() -> str:
-    local_version = _read_version_from_pyproject()
-    if local_version is not None:
-        return local_version
-    return _distribution_version("refua-data")
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as _distribution_version
 
+    try:
+        return _distribution_version("refua-data")
+    except PackageNotFoundError:
+        local_version = _read_version_from_pyproject()
+        if local_version is not None:
+            return local_version
+        raise
 
-__version__ = _resolve_version()
 
 __all__ = [
     "ApiDatasetConfig",
@@ -50,7 +56,9 @@ __all__ = [
     "DatasetManager",
     "FetchResult",
     "MaterializeResult",
+    "SQLiteCacheBackend",
     "SourceValidationResult",
+    "XattrCacheBackend",
     "__version__",
     "build_data_provenance_record",
     "get_default_catalog",
@@ -60,6 +68,10 @@ __all__ = [
 
 
 def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        global __version__
+        __version__ = _resolve_version()
+        return __version__
     if name == "DatasetManager":
         from .pipeline import DatasetManager as _DatasetManager
 
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import mmap
 import os
+import sqlite3
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, BinaryIO, Protocol
 
-from .config import default_cache_root
+from .config import DEFAULT_CACHE_ENV, default_cache_root
 from .models import DatasetDefinition
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _orjson = None  # type: ignore[assignment]
+
 
 class CacheBackend(Protocol):
     """Protocol for pluggable cache backends used by the pipeline."""
@@ -32,89 +43,362 @@ class CacheBackend(Protocol):
     def write_json(self, path: Path, payload: dict[str, Any]) -> None: ...
 
 
+@dataclass(frozen=True, slots=True)
+class _DatasetPaths:
+    """Per-dataset cache paths, built once per (dataset_id, version, filename)."""
+
+    raw_file: Path
+    raw_meta: Path
+    parquet_dir: Path
+    parquet_manifest: Path
+
+
+_CACHE_LEAF_DIRS = (
+    "raw",
+    "parquet",
+    os.path.join("_meta", "raw"),
+    os.path.join("_meta", "parquet"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_cache_root(root: str | None, env_root: str | None, cwd: str) -> Path:
+    # `env_root` and `cwd` only key the cache so a changed $REFUA_DATA_HOME or
+    # working directory (which relative roots resolve against) is re-resolved.
+    if root is None:
+        return default_cache_root()
+    return Path(root).expanduser().resolve()
+
+
 class DataCache:
     """Filesystem-backed cache backend for raw + parquet artifacts."""
 
-    def __init__(self, root: Path | None = None):
-        self.root = (root or default_cache_root()).expanduser().resolve()
+    def __init__(self, root: Path | None = None, *, durable: bool = False):
+        self.root = _resolve_cache_root(
+            os.fspath(root) if root else None,
+            os.environ.get(DEFAULT_CACHE_ENV),
+            os.getcwd(),
+        )
+        self.durable = durable
+        self._root_str = str(self.root)
+        self._dataset_paths: dict[tuple[str, str, str], _DatasetPaths] = {}
 
     def ensure(self) -> None:
         """Create required cache root directories."""
-        self.root.mkdir(parents=True, exist_ok=True)
-        self.root.joinpath("raw").mkdir(parents=True, exist_ok=True)
-        self.root.joinpath("parquet").mkdir(parents=True, exist_ok=True)
-        self.root.joinpath("_meta", "raw").mkdir(parents=True, exist_ok=True)
-        self.root.joinpath("_meta", "parquet").mkdir(parents=True, exist_ok=True)
+        for leaf in _CACHE_LEAF_DIRS:
+            os.makedirs(os.path.join(self._root_str, leaf), exist_ok=True)
+
+    def _paths(self, dataset: DatasetDefinition) -> _DatasetPaths:
+        key = (dataset.dataset_id, dataset.version, dataset.preferred_filename())
+        paths = self._dataset_paths.get(key)
+        if paths is None:
+            dataset_id, version, filename = key
+            join = os.path.join
+            root = self._root_str
+            paths = _DatasetPaths(
+                raw_file=Path(join(root, "raw", dataset_id, version, filename)),
+                raw_meta=Path(
+                    join(root, "_meta", "raw", dataset_id, version, f"{filename}.json")
+                ),
+                parquet_dir=Path(join(root, "parquet", dataset_id, version)),
+                parquet_manifest=Path(
+                    join(root, "_meta", "parquet", dataset_id, version, "manifest.json")
+                ),
+            )
+            self._dataset_paths[key] = paths
+        return paths
 
     def raw_file(self, dataset: DatasetDefinition) -> Path:
         """Return raw file path for a dataset."""
-        filename = dataset.preferred_filename()
-        return self.root.joinpath("raw", dataset.dataset_id, dataset.version, filename)
+        return self._paths(dataset).raw_file
 
     def raw_meta(self, dataset: DatasetDefinition) -> Path:
         """Return raw metadata path for a dataset."""
-        filename = f"{dataset.preferred_filename()}.json"
-        return self.root.joinpath(
-            "_meta", "raw", dataset.dataset_id, dataset.version, filename
-        )
+        return self._paths(dataset).raw_meta
 
     def parquet_dir(self, dataset: DatasetDefinition) -> Path:
         """Return parquet output directory for a dataset."""
-        return self.root.joinpath("parquet", dataset.dataset_id, dataset.version)
+        return self._paths(dataset).parquet_dir
 
     def parquet_manifest(self, dataset: DatasetDefinition) -> Path:
         """Return parquet manifest metadata path for a dataset."""
-        return self.root.joinpath(
-            "_meta",
-            "parquet",
-            dataset.dataset_id,
-            dataset.version,
-            "manifest.json",
-        )
+        return self._paths(dataset).parquet_manifest
 
     def read_json(self, path: Path) -> dict[str, Any] | None:
         """Read JSON metadata if it exists."""
-        if not path.exists():
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
             return None
-        return json.loads(path.read_text(encoding="utf-8"))
+        return loads_json(data)
 
     def write_json(self, path: Path, payload: dict[str, Any]) -> None:
-        """Write JSON metadata atomically."""
+        """Write JSON metadata atomically.
+
+        With `durable=True` the file and its parent directory are fsynced so the
+        rename cannot outlive the file contents after a crash.
+        """
+        self._replace_json(path, payload)
+        if self.durable:
+            _fsync_directory(path.parent)
+
+    def _replace_json(self, path: Path, payload: dict[str, Any]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = path.with_suffix(path.suffix + ".tmp")
-        tmp_path.write_text(
-            json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8"
-        )
+        with tmp_path.open("wb") as handle:
+            handle.write(dumps_json(payload))
+            if self.durable:
+                handle.flush()
+                os.fsync(handle.fileno())
         os.replace(tmp_path, path)
 
 
+class SQLiteCacheBackend(DataCache):
+    """Cache backend that keeps JSON metadata in one SQLite index.
+
+    Raw files and parquet parts stay on the filesystem layout of `DataCache`;
+    only the `_meta` sidecars move into `_meta/index.sqlite`, keyed by their
+    path relative to the cache root. Existing sidecar files are still read
+    when the index has no entry for them.
+    """
+
+    def __init__(self, root: Path | None = None, *, durable: bool = False):
+        super().__init__(root, durable=durable)
+        self.index_path = self.root.joinpath("_meta", "index.sqlite")
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def ensure(self) -> None:
+        """Create cache directories and the metadata index."""
+        super().ensure()
+        self._connect()
+
+    def read_json(self, path: Path) -> dict[str, Any] | None:
+        """Read JSON metadata from the index, falling back to sidecar files."""
+        key = self._key(path)
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT payload FROM meta WHERE path = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return super().read_json(path)
+        return loads_json(row[0])
+
+    def write_json(self, path: Path, payload: dict[str, Any]) -> None:
+        """Upsert JSON metadata into the index."""
+        row = (self._key(path), dumps_json(payload))
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (path, payload) VALUES (?, ?)",
+                    row,
+                )
+
+    def close(self) -> None:
+        """Close the index connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.index_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "PRAGMA synchronous=FULL" if self.durable else "PRAGMA synchronous=NORMAL"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (path TEXT PRIMARY KEY, payload BLOB NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+
+_XATTR_META_NAME = b"user.refua.meta"
+
+
+class XattrCacheBackend(DataCache):
+    """Cache backend that stores raw metadata as an xattr on the raw file.
+
+    Raw metadata is written to the `user.refua.meta` extended attribute of the
+    cached raw file, so no `_meta/raw` sidecar is needed. Parquet manifests,
+    raw files hard-linked to their source, payloads too large for the
+    filesystem's xattr limit, and filesystems without user xattrs fall back to
+    the JSON sidecars of `DataCache`.
+    """
+
+    def __init__(self, root: Path | None = None, *, durable: bool = False):
+        super().__init__(root, durable=durable)
+        self._meta_targets: dict[Path, Path] = {}
+        self._xattr_supported: bool | None = None
+
+    @property
+    def xattr_supported(self) -> bool:
+        """Return whether the cache root filesystem accepts user xattrs."""
+        if self._xattr_supported is None:
+            self._xattr_supported = self._probe_xattr()
+        return self._xattr_supported
+
+    def raw_meta(self, dataset: DatasetDefinition) -> Path:
+        """Return raw metadata path and remember the raw file it describes."""
+        meta_path = super().raw_meta(dataset)
+        self._meta_targets[meta_path] = self.raw_file(dataset)
+        return meta_path
+
+    def read_json(self, path: Path) -> dict[str, Any] | None:
+        """Read raw metadata from the xattr, falling back to sidecar files."""
+        target = self._xattr_target(path)
+        if target is not None:
+            try:
+                data = os.getxattr(target, _XATTR_META_NAME)
+            except OSError:
+                pass
+            else:
+                return loads_json(data)
+        return super().read_json(path)
+
+    def write_json(self, path: Path, payload: dict[str, Any]) -> None:
+        """Write raw metadata to the xattr when possible, else to a sidecar."""
+        target = self._xattr_target(path)
+        if target is not None:
+            try:
+                os.setxattr(target, _XATTR_META_NAME, dumps_json(payload))
+            except OSError:
+                pass
+            else:
+                path.unlink(missing_ok=True)
+                return
+        super().write_json(path, payload)
+
+    def _xattr_target(self, path: Path) -> Path | None:
+        target = self._meta_targets.get(path)
+        if target is None or not self.xattr_supported:
+            return None
+        try:
+            links = os.stat(target).st_nlink
+        except OSError:
+            return None
+        # A hard-linked raw file (`allow_link`) shares its inode with the user's
+        # source, so its metadata goes to the sidecar instead.
+        return target if links == 1 else None
+
+    def _probe_xattr(self) -> bool:
+        if not hasattr(os, "setxattr"):
+            return False
+        self.root.mkdir(parents=True, exist_ok=True)
+        probe = self.root.joinpath(".xattr-probe")
+        try:
+            probe.touch()
+            os.setxattr(probe, _XATTR_META_NAME, b"{}")
+        except OSError:
+            return False
+        finally:
+            probe.unlink(missing_ok=True)
+        return True
+
+
+def _fsync_directory(path: Path) -> None:
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(
+    payload: Any,
+    *,
+    sort_keys: bool = True,
+    indent: bool = True,
+    default: Callable[[Any], Any] | None = None,
+    stdlib_encoder: bool = False,
+) -> bytes:
+    """Serialize a payload as JSON bytes (indented and key-sorted by default).
+
+    `stdlib_encoder=True` skips orjson, for example to write float NaN as the
+    stdlib `NaN` literal where orjson would write `null`.
+    """
+    if _orjson is not None and not stdlib_encoder:
+        option = _orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        return _orjson.dumps(payload, default=default, option=option)
+    return json.dumps(
+        payload,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        check_circular=False,
+        default=default,
+    ).encode("utf-8")
+
+
 _CHUNK_SIZE = 4 * 1024 * 1024
+_MMAP_MIN_SIZE = 64 * 1024 * 1024
 
 
 def sha256_file(path: Path) -> str:
     """Compute the SHA256 checksum of a file or directory."""
     if path.is_dir():
         digest = hashlib.sha256()
+        view = memoryview(bytearray(_CHUNK_SIZE))
         for child in sorted(
             candidate for candidate in path.rglob("*") if candidate.is_file()
         ):
             relative = child.relative_to(path).as_posix().encode("utf-8")
             digest.update(relative)
             digest.update(b"\0")
-            with child.open("rb") as handle:
-                while True:
-                    chunk = handle.read(_CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    digest.update(chunk)
+            with child.open("rb", buffering=0) as handle:
+                if not _update_digest_mapped(digest, handle):
+                    while size := handle.readinto(view):
+                        digest.update(view[:size])
             digest.update(b"\0")
         return digest.hexdigest()
 
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        while True:
-            chunk = handle.read(_CHUNK_SIZE)
-            if not chunk:
-                break
-            digest.update(chunk)
-    return digest.hexdigest()
+    with path.open("rb", buffering=0) as handle:
+        digest = hashlib.sha256()
+        if _update_digest_mapped(digest, handle):
+            return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def _update_digest_mapped(digest: hashlib._Hash, handle: BinaryIO) -> bool:
+    """Hash a large file through a read-only mmap; return False if not applicable."""
+    if os.name == "nt":
+        return False
+    fileno = handle.fileno()
+    if os.fstat(fileno).st_size < _MMAP_MIN_SIZE:
+        return False
+    try:
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return False
+    with mapped:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        digest.update(mapped)
+    return True
@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
+import functools
 from builtins import list as builtin_list
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .models import ApiDatasetConfig, DatasetDefinition
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class DatasetCatalog:
     """In-memory dataset registry."""
 
     datasets: dict[str, DatasetDefinition]
+    _sorted: tuple[DatasetDefinition, ...] = field(init=False, repr=False, compare=False)
+    _tag_index: dict[str, tuple[DatasetDefinition, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        ordered = tuple(self.datasets[key] for key in sorted(self.datasets))
+        tag_index: dict[str, builtin_list[DatasetDefinition]] = {}
+        for dataset in ordered:
+            for tag in dataset.normalized_tags:
+                tag_index.setdefault(tag, []).append(dataset)
+        object.__setattr__(self, "_sorted", ordered)
+        object.__setattr__(
+            self,
+            "_tag_index",
+            {tag: tuple(entries) for tag, entries in tag_index.items()},
+        )
 
     @classmethod
     def from_entries(cls, entries: list[DatasetDefinition]) -> DatasetCatalog:
@@ -21,42 +39,55 @@ class DatasetCatalog:
             raise ValueError("Dataset IDs must be unique.")
         return cls(datasets=by_id)
 
-    def list(self) -> list[DatasetDefinition]:
+    def list(self) -> tuple[DatasetDefinition, ...]:
         """Return datasets sorted by ID."""
-        return [self.datasets[key] for key in sorted(self.datasets)]
+        return self._sorted
 
     def get(self, dataset_id: str) -> DatasetDefinition:
         """Get a dataset by id."""
         try:
             return self.datasets[dataset_id]
         except KeyError as exc:
-            available = ", ".join(sorted(self.datasets))
+            available = ", ".join(dataset.dataset_id for dataset in self._sorted)
             raise KeyError(
                 f"Unknown dataset '{dataset_id}'. Available datasets: {available}"
             ) from exc
 
-    def filter_by_tag(self, tag: str) -> builtin_list[DatasetDefinition]:
-        """Filter datasets by a tag."""
-        needle = tag.strip().lower()
-        return [
-            dataset
-            for dataset in self.list()
-            if needle in {value.lower() for value in dataset.tags}
-        ]
+    def filter_by_tag(self, tag: str) -> tuple[DatasetDefinition, ...]:
+        """Filter datasets by a tag, sorted by ID."""
+        return self._tag_index.get(tag.strip().lower(), ())
+
 
+# Provenance strings shared by many catalog entries.
+_ZINC_TRANCHE_SOURCE = "ZINC tranche download (multi-tranche)"
+_ZINC_TRANCHE_HOMEPAGE = "https://zinc.docking.org/tranches/home/"
+_ZINC_LICENSE_NAME = "Upstream ZINC terms"
+_ZINC_LICENSE_URL = "https://zinc.docking.org/terms/"
+_MOLECULENET_SOURCE = "MoleculeNet/DeepChem"
+_MOLECULENET_HOMEPAGE = "https://moleculenet.org/datasets-1"
+_MOLECULENET_LICENSE_NAME = "Dataset-specific upstream terms"
+_MOLECULENET_LICENSE_URL = "https://moleculenet.org/"
+_CHEMBL_SOURCE = "ChEMBL REST API"
+_CHEMBL_HOMEPAGE = "https://www.ebi.ac.uk/chembl/"
+_CHEMBL_LICENSE_NAME = "ChEMBL data terms"
+_CHEMBL_LICENSE_URL = "https://www.ebi.ac.uk/chembl/ws"
+_UNIPROT_SOURCE = "UniProt REST API"
+_UNIPROT_HOMEPAGE = "https://www.uniprot.org/help/api_queries"
+_UNIPROT_LICENSE_NAME = "UniProt terms"
+_UNIPROT_LICENSE_URL = "https://www.uniprot.org/help/license"
 
 _ZINC_DRUGLIKE_MWT_BINS = tuple("BCDEFGHIJK")
 _ZINC_DRUGLIKE_LOGP_BINS = tuple("ABCDEFGHIJK")
 _ZINC_DRUGLIKE_REACTIVITY_LEVELS = ("A", "B", "C", "E")
 
 
-def _zinc_druglike_tranche_urls(
-    *,
-    purchasability: str,
+@functools.cache
+def _zinc_druglike_tranche_prefixes(
     reactive_levels: tuple[str, ...] = _ZINC_DRUGLIKE_REACTIVITY_LEVELS,
 ) -> tuple[str, ...]:
+    # Purchasability variants share these prefixes and differ only by `url_suffix`.
     return tuple(
-        f"https://files.docking.org/2D/{mwt}{logp}/{mwt}{logp}{reactive}{purchasability}.txt"
+        f"https://files.docking.org/2D/{mwt}{logp}/{mwt}{logp}{reactive}"
         for mwt in _ZINC_DRUGLIKE_MWT_BINS
         for logp in _ZINC_DRUGLIKE_LOGP_BINS
         for reactive in reactive_levels
@@ -77,1198 +108,1203 @@ def _opentargets_parquet_part_urls(
     )
 
 
-_DEFAULT_DATASETS = [
-    DatasetDefinition(
-        dataset_id="zinc15_250k",
-        name="ZINC15 250K (2D)",
-        description=(
-            "A 250k compound subset from ZINC suitable for virtual "
-            "screening and pretraining."
-        ),
-        source="ZINC via chemical_vae mirror",
-        homepage="https://zinc.docking.org/",
-        license_name="Upstream ZINC terms",
-        license_url="https://zinc.docking.org/terms/",
-        urls=(
-            "https://raw.githubusercontent.com/aspuru-guzik-group/chemical_vae/main/models/zinc_properties/250k_rndm_zinc_drugs_clean_3.csv",
-            "https://raw.githubusercontent.com/aspuru-guzik-group/chemical_vae/master/models/zinc_properties/250k_rndm_zinc_drugs_clean_3.csv",
-        ),
-        file_format="csv",
-        category="compound_library",
-        tags=("zinc", "virtual_screening", "small_molecules"),
-    ),
-    DatasetDefinition(
-        dataset_id="zinc15_tranche_druglike_instock",
-        name="ZINC15 Drug-Like In-Stock (2D, Multi-Tranche)",
-        description=(
-            "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
-            "logP bins A-K with up-to-standard reactivity (A/B/C/E) and in-stock "
-            "purchasability."
-        ),
-        source="ZINC tranche download (multi-tranche)",
-        homepage="https://zinc.docking.org/tranches/home/",
-        license_name="Upstream ZINC terms",
-        license_url="https://zinc.docking.org/terms/",
-        urls=_zinc_druglike_tranche_urls(purchasability="B"),
-        file_format="tsv",
-        category="compound_library",
-        url_mode="concat",
-        tags=(
-            "zinc",
-            "tranche",
-            "multi_tranche",
-            "drug_like",
-            "in_stock",
-            "small_molecules",
-        ),
-    ),
-    DatasetDefinition(
-        dataset_id="zinc15_tranche_druglike_agent",
-        name="ZINC15 Drug-Like Agent (2D, Multi-Tranche)",
-        description=(
-            "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
-            "logP bins A-K with up-to-standard reactivity (A/B/C/E) and "
-            "agent-level "
-            "purchasability."
-        ),
-        source="ZINC tranche download (multi-tranche)",
-        homepage="https://zinc.docking.org/tranches/home/",
-        license_name="Upstream ZINC terms",
-        license_url="https://zinc.docking.org/terms/",
-        urls=_zinc_druglike_tranche_urls(purchasability="C"),
-        file_format="tsv",
-        category="compound_library",
-        url_mode="concat",
-        tags=(
-            "zinc",
-            "tranche",
-            "multi_tranche",
-            "drug_like",
-            "agent",
-            "small_molecules",
-        ),
-    ),
-    DatasetDefinition(
-        dataset_id="zinc15_tranche_druglike_wait_ok",
-        name="ZINC15 Drug-Like Wait-OK (2D, Multi-Tranche)",
-        description=(
-            "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
-            "logP bins A-K with up-to-standard reactivity (A/B/C/E) and wait-ok "
-            "purchasability."
-        ),
-        source="ZINC tranche download (multi-tranche)",
-        homepage="https://zinc.docking.org/tranches/home/",
-        license_name="Upstream ZINC terms",
-        license_url="https://zinc.docking.org/terms/",
-        urls=_zinc_druglike_tranche_urls(purchasability="D"),
-        file_format="tsv",
-        category="compound_library",
-        url_mode="concat",
-        tags=(
-            "zinc",
-            "tranche",
-            "multi_tranche",
-            "drug_like",
-            "wait_ok",
-            "small_molecules",
-        ),
-    ),
-    DatasetDefinition(
-        dataset_id="zinc15_tranche_druglike_boutique",
-        name="ZINC15 Drug-Like Boutique (2D, Multi-Tranche)",
-        description=(
-            "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
-            "logP bins A-K with up-to-standard reactivity (A/B/C/E) and boutique "
-            "purchasability."
-        ),
-        source="ZINC tranche download (multi-tranche)",
-        homepage="https://zinc.docking.org/tranches/home/",
-        license_name="Upstream ZINC terms",
-        license_url="https://zinc.docking.org/terms/",
-        urls=_zinc_druglike_tranche_urls(purchasability="E"),
-        file_format="tsv",
-        category="compound_library",
-        url_mode="concat",
-        tags=(
-            "zinc",
-            "tranche",
-            "multi_tranche",
-            "drug_like",
-            "boutique",
-            "small_molecules",
-        ),
-    ),
-    DatasetDefinition(
-        dataset_id="zinc15_tranche_druglike_annotated",
-        name="ZINC15 Drug-Like Annotated (2D, Multi-Tranche)",
-        description=(
-            "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
-            "logP bins A-K with up-to-standard reactivity (A/B/C/E) and annotated "
-            "purchasability."
-        ),
-        source="ZINC tranche download (multi-tranche)",
-        homepage="https://zinc.docking.org/tranches/home/",
-        license_name="Upstream ZINC terms",
-        license_url="https://zinc.docking.org/terms/",
-        urls=_zinc_druglike_tranche_urls(purchasability="F"),
-        file_format="tsv",
-        category="compound_library",
-        url_mode="concat",
-        tags=(
-            "zinc",
-            "tranche",
-            "multi_tranche",
-            "drug_like",
-            "annotated",
-            "small_molecules",
-        ),
-    ),
-    DatasetDefinition(
-        dataset_id="tox21",
-        name="Tox21",
-        description="Nuclear receptor and stress response toxicity assays.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/tox21.csv.gz",),
-        file_format="csv",
-        category="toxicity",
-        tags=("toxicity", "classification", "admet"),
-    ),
-    DatasetDefinition(
-        dataset_id="bbbp",
-        name="BBBP",
-        description="Blood-brain barrier penetration classification dataset.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/BBBP.csv",),
-        file_format="csv",
-        category="admet",
-        tags=("bbb", "classification", "admet"),
-    ),
-    DatasetDefinition(
-        dataset_id="bace",
-        name="BACE",
-        description="Binding and inhibition labels for beta-secretase 1.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/bace.csv",),
-        file_format="csv",
-        category="target_activity",
-        tags=("target", "activity", "classification", "regression"),
-    ),
-    DatasetDefinition(
-        dataset_id="clintox",
-        name="ClinTox",
-        description="Clinical toxicity labels for marketed and failed compounds.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=(
-            "https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/clintox.csv.gz",
-        ),
-        file_format="csv",
-        category="toxicity",
-        tags=("toxicity", "clinical", "admet"),
-    ),
-    DatasetDefinition(
-        dataset_id="sider",
-        name="SIDER",
-        description="Side effect labels curated from marketed drugs.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/sider.csv.gz",),
-        file_format="csv",
-        category="safety",
-        tags=("side_effects", "safety", "multitask"),
-    ),
-    DatasetDefinition(
-        dataset_id="hiv",
-        name="HIV",
-        description="HIV replication inhibition activity labels.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/HIV.csv",),
-        file_format="csv",
-        category="target_activity",
-        tags=("hiv", "classification", "bioactivity"),
-    ),
-    DatasetDefinition(
-        dataset_id="muv",
-        name="MUV",
-        description="Maximum unbiased validation benchmark for virtual screening tasks.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/muv.csv.gz",),
-        file_format="csv",
-        category="virtual_screening",
-        tags=("virtual_screening", "classification", "hts"),
-    ),
-    DatasetDefinition(
-        dataset_id="esol",
-        name="ESOL",
-        description="Aqueous solubility regression benchmark.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=(
-            "https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/delaney-processed.csv",
-        ),
-        file_format="csv",
-        category="physchem",
-        tags=("solubility", "regression", "admet"),
-    ),
-    DatasetDefinition(
-        dataset_id="freesolv",
-        name="FreeSolv",
-        description="Hydration free energy regression set for small molecules.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/SAMPL.csv",),
-        file_format="csv",
-        category="physchem",
-        tags=("solvation", "regression", "qm"),
-    ),
-    DatasetDefinition(
-        dataset_id="lipophilicity",
-        name="Lipophilicity",
-        description="Octanol/water distribution coefficient (logD) regression dataset.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=(
-            "https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/Lipophilicity.csv",
-            "https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/lipo.csv",
-        ),
-        file_format="csv",
-        category="physchem",
-        tags=("logd", "regression", "admet"),
-    ),
-    DatasetDefinition(
-        dataset_id="pcba",
-        name="PCBA",
-        description="PubChem BioAssay multitask virtual screening benchmark.",
-        source="MoleculeNet/DeepChem",
-        homepage="https://moleculenet.org/datasets-1",
-        license_name="Dataset-specific upstream terms",
-        license_url="https://moleculenet.org/",
-        urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/pcba.csv.gz",),
-        file_format="csv",
-        category="virtual_screening",
-        tags=("pcba", "hts", "multitask"),
-    ),
-    DatasetDefinition(
-        dataset_id="bindingdb_articles_affinity",
-        name="BindingDB Article-Curated Affinity",
-        description=(
-            "BindingDB article-curated protein-ligand affinity measurements with "
-            "SMILES, target annotations, and assay values for SAR and "
-            "cross-target modeling."
-        ),
-        source="BindingDB downloadable TSV",
-        homepage="https://www.bindingdb.org/rwd/bind/chemsearch/marvin/Download.jsp",
-        license_name="CC BY 3.0 (BindingDB-curated data)",
-        license_url="https://creativecommons.org/licenses/by/3.0/",
-        urls=(
-            "https://www.bindingdb.org/rwd/bind/downloads/BindingDB_BindingDB_Articles_202604_tsv.zip",
-        ),
-        file_format="tsv",
-        category="target_activity",
-        compression="zip",
-        version="202604",
-        usage_notes=(
-            "Use for protein-ligand affinity modeling, literature-derived SAR "
-            "mining, and transfer learning across medicinal chemistry programs.",
-        ),
-        tags=("bindingdb", "affinity", "protein_ligand", "sar", "training"),
-    ),
-    DatasetDefinition(
-        dataset_id="openfda_drug_event_serious",
-        name="openFDA Drug Event Serious Reports",
-        description=(
-            "Serious adverse event reports from openFDA/FAERS for "
-            "post-marketing safety surveillance and pharmacovigilance analyses."
-        ),
-        source="openFDA Drug Adverse Event API (FAERS)",
-        homepage="https://open.fda.gov/apis/drug/event/",
-        license_name="CC0 1.0 (openFDA)",
-        license_url="https://open.fda.gov/license/",
-        file_format="jsonl",
-        category="safety",
-        api=ApiDatasetConfig(
-            endpoint="https://api.fda.gov/drug/event.json",
-            params={"search": "serious:1"},
-            pagination="link_header",
-            items_path="results",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=30,
-            max_rows=30_000,
-        ),
-        tags=(
-            "api",
-            "openfda",
-            "faers",
-            "adverse_events",
-            "post_marketing",
-            "safety",
-        ),
-    ),
-    DatasetDefinition(
-        dataset_id="proteinatlas_human_proteome",
-        name="Human Protein Atlas Proteome Table",
-        description=(
-            "Gene/protein-centric atlas table with tissue expression, "
-            "subcellular localization, secretome, and disease-related "
-            "annotations for human target biology workflows."
-        ),
-        source="Human Protein Atlas downloadable data",
-        homepage="https://www.proteinatlas.org/about/download",
-        license_name="CC BY-SA 4.0 (Human Protein Atlas)",
-        license_url="https://www.proteinatlas.org/about/licence",
-        urls=("https://www.proteinatlas.org/download/proteinatlas.tsv.zip",),
-        file_format="tsv",
-        category="targets",
-        tags=(
-            "human",
-            "proteomics",
-            "expression",
-            "target_annotation",
-            "subcellular_localization",
-        ),
-    ),
-    DatasetDefinition(
-        dataset_id="opentargets_target_prioritisation",
-        name="Open Targets Target Prioritisation",
-        description=(
-            "Open Targets target prioritisation features spanning tractability, "
-            "safety, novelty, and evidence-linked attributes for therapeutic "
-            "target ranking."
-        ),
-        source="Open Targets Platform downloadable parquet",
-        homepage="https://platform-docs.opentargets.org/data-access/datasets",
-        license_name="CC0 1.0 (Open Targets Platform data)",
-        license_url="https://platform-docs.opentargets.org/licence",
-        urls=_opentargets_parquet_part_urls(
-            release="25.03",
-            dataset="target_prioritisation",
-            part_token="9647e5c1-fd87-47e0-8c5d-3b1429e19b9a",
-            part_count=16,
-        ),
-        file_format="parquet",
-        category="targets",
-        version="25.03",
-        filename="target_prioritisation",
-        url_mode="bundle",
-        usage_notes=(
-            "Use for target ranking, tractability-aware portfolio construction, "
-            "and feature generation for target prioritisation models.",
-        ),
-        tags=(
-            "opentargets",
-            "target_prioritisation",
-            "tractability",
-            "safety",
-            "target_ranking",
-        ),
-    ),
-    DatasetDefinition(
-        dataset_id="gdsc2_fitted_dose_response",
-        name="GDSC2 Fitted Dose Response",
-        description=(
-            "CancerRxGene GDSC2 fitted dose-response measurements across cancer "
-            "cell lines for biomarker discovery, sensitivity modeling, and "
-            "translational pharmacology."
-        ),
-        source="CancerRxGene bulk download",
-        homepage="https://www.cancerrxgene.org/downloads/bulk_download",
-        license_name="CancerRxGene data terms",
-        license_url="https://www.cancerrxgene.org/legal",
-        urls=(
-            "https://cog.sanger.ac.uk/cancerrxgene/GDSC_release8.5/GDSC2_fitted_dose_response_27Oct23.xlsx",
-        ),
-        file_format="xlsx",
-        category="cell_response",
-        version="8.5-20231027",
-        usage_notes=(
-            "Use for cell-line drug sensitivity prediction, pharmacogenomic "
-            "biomarker discovery, and translational response modeling.",
-        ),
-        tags=(
-            "gdsc",
-            "cancerrxgene",
-            "dose_response",
-            "cell_lines",
-            "pharmacogenomics",
-        ),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_activity_ki_human",
-        name="ChEMBL Human Ki Activities",
-        description=(
-            "ChEMBL activity records for human targets with Ki and pChEMBL "
-            "values, useful for potency modeling."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="target_activity",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
-            params={
-                "target_organism": "Homo sapiens",
-                "standard_type": "Ki",
-                "pchembl_value__isnull": "false",
-            },
-            pagination="chembl",
-            items_path="activities",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=40,
-            max_rows=25_000,
-        ),
-        tags=("api", "chembl", "human", "ki", "potency"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_activity_ic50_human",
-        name="ChEMBL Human IC50 Activities",
-        description=(
-            "ChEMBL activity records for human targets with IC50 and pChEMBL "
-            "values, useful for activity modeling."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="target_activity",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
-            params={
-                "target_organism": "Homo sapiens",
-                "standard_type": "IC50",
-                "pchembl_value__isnull": "false",
-            },
-            pagination="chembl",
-            items_path="activities",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=40,
-            max_rows=25_000,
-        ),
-        tags=("api", "chembl", "human", "ic50", "potency"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_activity_kd_human",
-        name="ChEMBL Human Kd Activities",
-        description=(
-            "ChEMBL activity records for human targets with Kd and pChEMBL "
-            "values, useful for affinity modeling."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="target_activity",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
-            params={
-                "target_organism": "Homo sapiens",
-                "standard_type": "Kd",
-                "pchembl_value__isnull": "false",
-            },
-            pagination="chembl",
-            items_path="activities",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=40,
-            max_rows=25_000,
-        ),
-        tags=("api", "chembl", "human", "kd", "affinity"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_activity_ec50_human",
-        name="ChEMBL Human EC50 Activities",
-        description=(
-            "ChEMBL activity records for human targets with EC50 and pChEMBL "
-            "values, useful for functional potency modeling."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="target_activity",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
-            params={
-                "target_organism": "Homo sapiens",
-                "standard_type": "EC50",
-                "pchembl_value__isnull": "false",
-            },
-            pagination="chembl",
-            items_path="activities",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=40,
-            max_rows=25_000,
-        ),
-        tags=("api", "chembl", "human", "ec50", "potency"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_activity_ac50_human",
-        name="ChEMBL Human AC50 Activities",
-        description=(
-            "ChEMBL activity records for human targets with AC50 and pChEMBL "
-            "values, useful for concentration-response modeling."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="target_activity",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
-            params={
-                "target_organism": "Homo sapiens",
-                "standard_type": "AC50",
-                "pchembl_value__isnull": "false",
-            },
-            pagination="chembl",
-            items_path="activities",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=40,
-            max_rows=25_000,
-        ),
-        tags=("api", "chembl", "human", "ac50", "potency"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_assays_binding_human",
-        name="ChEMBL Human Binding Assays",
-        description=(
-            "Binding-type ChEMBL assays for human targets, useful for assay "
-            "context and panel design."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="assays",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/assay.json",
-            params={
-                "assay_type": "B",
-                "target_organism": "Homo sapiens",
-            },
-            pagination="chembl",
-            items_path="assays",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=20,
-            max_rows=12_000,
-        ),
-        tags=("api", "chembl", "human", "assays", "binding"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_assays_functional_human",
-        name="ChEMBL Human Functional Assays",
-        description=(
-            "Functional-type ChEMBL assays for human targets, useful for "
-            "phenotypic and pathway-relevant assay context."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="assays",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/assay.json",
-            params={
-                "assay_type": "F",
-                "target_organism": "Homo sapiens",
-            },
-            pagination="chembl",
-            items_path="assays",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=20,
-            max_rows=12_000,
-        ),
-        tags=("api", "chembl", "human", "assays", "functional"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_assays_adme_human",
-        name="ChEMBL Human ADME Assays",
-        description=(
-            "ADME-type ChEMBL assays linked to human targets, useful for "
-            "pharmacokinetic assay landscape analysis."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="assays",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/assay.json",
-            params={
-                "assay_type": "A",
-                "target_organism": "Homo sapiens",
-            },
-            pagination="chembl",
-            items_path="assays",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=20,
-            max_rows=12_000,
-        ),
-        tags=("api", "chembl", "human", "assays", "adme"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_targets_human_single_protein",
-        name="ChEMBL Human Single-Protein Targets",
-        description=(
-            "ChEMBL target records restricted to human single proteins for "
-            "target universe definition."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="targets",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/target.json",
-            params={
-                "target_type": "SINGLE PROTEIN",
-                "organism": "Homo sapiens",
-            },
-            pagination="chembl",
-            items_path="targets",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=10,
-            max_rows=8_000,
-        ),
-        tags=("api", "chembl", "human", "targets"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_targets_human_protein_complex",
-        name="ChEMBL Human Protein Complex Targets",
-        description=(
-            "ChEMBL target records restricted to human protein complexes for "
-            "multi-subunit target-space definition."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="targets",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/target.json",
-            params={
-                "target_type": "PROTEIN COMPLEX",
-                "organism": "Homo sapiens",
-            },
-            pagination="chembl",
-            items_path="targets",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=10,
-            max_rows=8_000,
-        ),
-        tags=("api", "chembl", "human", "targets", "protein_complex"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_molecules_phase3plus",
-        name="ChEMBL Molecules Phase 3+",
-        description=(
-            "ChEMBL molecules with max clinical phase >= 3, useful for "
-            "late-stage scaffold and property priors."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="compound_library",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/molecule.json",
-            params={"max_phase__gte": "3"},
-            pagination="chembl",
-            items_path="molecules",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=30,
-            max_rows=20_000,
-        ),
-        tags=("api", "chembl", "clinical", "phase3plus"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_molecules_phase4",
-        name="ChEMBL Molecules Phase 4",
-        description=(
-            "ChEMBL molecules with max clinical phase >= 4, useful for "
-            "marketed-drug priors and late-stage benchmark sets."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="compound_library",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/molecule.json",
-            params={"max_phase__gte": "4"},
-            pagination="chembl",
-            items_path="molecules",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=30,
-            max_rows=20_000,
-        ),
-        tags=("api", "chembl", "clinical", "phase4"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_molecules_black_box_warning",
-        name="ChEMBL Molecules with Black Box Warning",
-        description=(
-            "ChEMBL molecules flagged with FDA boxed warning metadata for "
-            "safety-aware filtering and risk modeling."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="safety",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/molecule.json",
-            params={"black_box_warning": "1"},
-            pagination="chembl",
-            items_path="molecules",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=20,
-            max_rows=20_000,
-        ),
-        tags=("api", "chembl", "molecules", "safety", "black_box_warning"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_mechanism_phase2plus",
-        name="ChEMBL Mechanisms Phase 2+",
-        description=(
-            "ChEMBL mechanism-of-action records for compounds with max phase >= 2, "
-            "useful for target-mechanism mapping."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="targets",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/mechanism.json",
-            params={"max_phase__gte": "2"},
-            pagination="chembl",
-            items_path="mechanisms",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=20,
-            max_rows=20_000,
-        ),
-        tags=("api", "chembl", "mechanism_of_action", "clinical", "phase2plus"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_drug_indications_phase2plus",
-        name="ChEMBL Drug Indications Phase 2+",
-        description=(
-            "ChEMBL drug indication records for compounds with indication max phase >= 2, "
-            "useful for translational and disease-area annotation."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="targets",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/drug_indication.json",
-            params={"max_phase_for_ind__gte": "2"},
-            pagination="chembl",
-            items_path="drug_indications",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=20,
-            max_rows=20_000,
-        ),
-        tags=("api", "chembl", "indications", "clinical", "phase2plus"),
-    ),
-    DatasetDefinition(
-        dataset_id="chembl_drug_indications_phase3plus",
-        name="ChEMBL Drug Indications Phase 3+",
-        description=(
-            "ChEMBL drug indication records for compounds with indication max phase >= 3, "
-            "useful for late-stage translational and disease-area annotation."
-        ),
-        source="ChEMBL REST API",
-        homepage="https://www.ebi.ac.uk/chembl/",
-        license_name="ChEMBL data terms",
-        license_url="https://www.ebi.ac.uk/chembl/ws",
-        file_format="jsonl",
-        category="targets",
-        api=ApiDatasetConfig(
-            endpoint="https://www.ebi.ac.uk/chembl/api/data/drug_indication.json",
-            params={"max_phase_for_ind__gte": "3"},
-            pagination="chembl",
-            items_path="drug_indications",
-            page_size_param="limit",
-            page_size=1000,
-            max_pages=20,
-            max_rows=20_000,
-        ),
-        tags=("api", "chembl", "indications", "clinical", "phase3plus"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_reviewed",
-        name="UniProt Human Reviewed Proteome",
-        description=(
-            "Reviewed human UniProtKB entries (Swiss-Prot) for baseline target "
-            "annotation and sequence features."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="targets",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": "organism_id:9606 AND reviewed:true",
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=40,
-            max_rows=20_000,
-        ),
-        tags=("api", "uniprot", "human", "reviewed", "targets"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_receptors",
-        name="UniProt Human Receptors",
-        description=(
-            "Reviewed human proteins annotated as receptors for receptor-family "
-            "mapping beyond GPCR-focused subsets."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": "organism_id:9606 AND reviewed:true AND keyword:Receptor",
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "receptors", "target_family"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_membrane",
-        name="UniProt Human Membrane Proteins",
-        description=(
-            "Reviewed human proteins annotated with membrane localization for "
-            "membrane-target enrichment workflows."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": "organism_id:9606 AND reviewed:true AND keyword:Membrane",
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "membrane", "target_family"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_nucleus",
-        name="UniProt Human Nuclear Proteins",
-        description=(
-            "Reviewed human proteins annotated with nuclear localization for "
-            "nucleus-focused target enrichment and biology workflows."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": "organism_id:9606 AND reviewed:true AND keyword:Nucleus",
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "nucleus", "target_family"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_kinases",
-        name="UniProt Human Kinases",
-        description=(
-            "Reviewed human proteins annotated as kinases for kinase-focused "
-            "target campaigns."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": "organism_id:9606 AND reviewed:true AND keyword:Kinase",
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "kinase", "target_family"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_gpcr",
-        name="UniProt Human GPCRs",
-        description=(
-            "Reviewed human GPCR proteins for receptor-focused target "
-            "selection and annotation."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": (
-                    "organism_id:9606 AND reviewed:true AND "
-                    'keyword:"G-protein coupled receptor"'
-                ),
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "gpcr", "target_family"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_ion_channels",
-        name="UniProt Human Ion Channels",
-        description=(
-            "Reviewed human ion channel proteins for ion-channel-focused "
-            "campaign planning."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": 'organism_id:9606 AND reviewed:true AND keyword:"Ion channel"',
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "ion_channel", "target_family"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_transporters",
-        name="UniProt Human Transporters",
-        description=(
-            "Reviewed human transporter proteins for transporter liability and "
-            "uptake/efflux modeling contexts."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": "organism_id:9606 AND reviewed:true AND keyword:Transport",
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "transporters", "target_family"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_secreted",
-        name="UniProt Human Secreted Proteins",
-        description=(
-            "Reviewed human secreted proteins for extracellular target discovery "
-            "and biologics-oriented programs."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": "organism_id:9606 AND reviewed:true AND keyword:Secreted",
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "secreted", "target_family"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_transcription_factors",
-        name="UniProt Human Transcription-Related Proteins",
-        description=(
-            "Reviewed human proteins annotated with transcription-related "
-            "keywords for transcriptional program target discovery."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": "organism_id:9606 AND reviewed:true AND keyword:Transcription",
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "transcription", "target_family"),
-    ),
-    DatasetDefinition(
-        dataset_id="uniprot_human_enzymes",
-        name="UniProt Human Enzymes",
-        description=(
-            "Reviewed human proteins annotated as enzymes for enzyme-focused "
-            "target family benchmarking."
-        ),
-        source="UniProt REST API",
-        homepage="https://www.uniprot.org/help/api_queries",
-        license_name="UniProt terms",
-        license_url="https://www.uniprot.org/help/license",
-        file_format="jsonl",
-        category="target_families",
-        api=ApiDatasetConfig(
-            endpoint="https://rest.uniprot.org/uniprotkb/search",
-            params={
-                "query": "organism_id:9606 AND reviewed:true AND keyword:Enzyme",
-                "format": "json",
-            },
-            pagination="link_header",
-            items_path="results",
-            page_size_param="size",
-            page_size=500,
-            max_pages=20,
-            max_rows=8_000,
-        ),
-        tags=("api", "uniprot", "human", "enzymes", "target_family"),
-    ),
-]
-
-DEFAULT_CATALOG = DatasetCatalog.from_entries(_DEFAULT_DATASETS)
+def _build_default_datasets() -> builtin_list[DatasetDefinition]:
+    return [
+        DatasetDefinition(
+            dataset_id="zinc15_250k",
+            name="ZINC15 250K (2D)",
+            description=(
+                "A 250k compound subset from ZINC suitable for virtual "
+                "screening and pretraining."
+            ),
+            source="ZINC via chemical_vae mirror",
+            homepage="https://zinc.docking.org/",
+            license_name=_ZINC_LICENSE_NAME,
+            license_url=_ZINC_LICENSE_URL,
+            urls=(
+                "https://raw.githubusercontent.com/aspuru-guzik-group/chemical_vae/main/models/zinc_properties/250k_rndm_zinc_drugs_clean_3.csv",
+                "https://raw.githubusercontent.com/aspuru-guzik-group/chemical_vae/master/models/zinc_properties/250k_rndm_zinc_drugs_clean_3.csv",
+            ),
+            file_format="csv",
+            category="compound_library",
+            tags=("zinc", "virtual_screening", "small_molecules"),
+        ),
+        DatasetDefinition(
+            dataset_id="zinc15_tranche_druglike_instock",
+            name="ZINC15 Drug-Like In-Stock (2D, Multi-Tranche)",
+            description=(
+                "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
+                "logP bins A-K with up-to-standard reactivity (A/B/C/E) and in-stock "
+                "purchasability."
+            ),
+            source=_ZINC_TRANCHE_SOURCE,
+            homepage=_ZINC_TRANCHE_HOMEPAGE,
+            license_name=_ZINC_LICENSE_NAME,
+            license_url=_ZINC_LICENSE_URL,
+            urls=_zinc_druglike_tranche_prefixes(),
+            url_suffix="B.txt",
+            file_format="tsv",
+            category="compound_library",
+            url_mode="concat",
+            tags=(
+                "zinc",
+                "tranche",
+                "multi_tranche",
+                "drug_like",
+                "in_stock",
+                "small_molecules",
+            ),
+        ),
+        DatasetDefinition(
+            dataset_id="zinc15_tranche_druglike_agent",
+            name="ZINC15 Drug-Like Agent (2D, Multi-Tranche)",
+            description=(
+                "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
+                "logP bins A-K with up-to-standard reactivity (A/B/C/E) and "
+                "agent-level "
+                "purchasability."
+            ),
+            source=_ZINC_TRANCHE_SOURCE,
+            homepage=_ZINC_TRANCHE_HOMEPAGE,
+            license_name=_ZINC_LICENSE_NAME,
+            license_url=_ZINC_LICENSE_URL,
+            urls=_zinc_druglike_tranche_prefixes(),
+            url_suffix="C.txt",
+            file_format="tsv",
+            category="compound_library",
+            url_mode="concat",
+            tags=(
+                "zinc",
+                "tranche",
+                "multi_tranche",
+                "drug_like",
+                "agent",
+                "small_molecules",
+            ),
+        ),
+        DatasetDefinition(
+            dataset_id="zinc15_tranche_druglike_wait_ok",
+            name="ZINC15 Drug-Like Wait-OK (2D, Multi-Tranche)",
+            description=(
+                "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
+                "logP bins A-K with up-to-standard reactivity (A/B/C/E) and wait-ok "
+                "purchasability."
+            ),
+            source=_ZINC_TRANCHE_SOURCE,
+            homepage=_ZINC_TRANCHE_HOMEPAGE,
+            license_name=_ZINC_LICENSE_NAME,
+            license_url=_ZINC_LICENSE_URL,
+            urls=_zinc_druglike_tranche_prefixes(),
+            url_suffix="D.txt",
+            file_format="tsv",
+            category="compound_library",
+            url_mode="concat",
+            tags=(
+                "zinc",
+                "tranche",
+                "multi_tranche",
+                "drug_like",
+                "wait_ok",
+                "small_molecules",
+            ),
+        ),
+        DatasetDefinition(
+            dataset_id="zinc15_tranche_druglike_boutique",
+            name="ZINC15 Drug-Like Boutique (2D, Multi-Tranche)",
+            description=(
+                "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
+                "logP bins A-K with up-to-standard reactivity (A/B/C/E) and boutique "
+                "purchasability."
+            ),
+            source=_ZINC_TRANCHE_SOURCE,
+            homepage=_ZINC_TRANCHE_HOMEPAGE,
+            license_name=_ZINC_LICENSE_NAME,
+            license_url=_ZINC_LICENSE_URL,
+            urls=_zinc_druglike_tranche_prefixes(),
+            url_suffix="E.txt",
+            file_format="tsv",
+            category="compound_library",
+            url_mode="concat",
+            tags=(
+                "zinc",
+                "tranche",
+                "multi_tranche",
+                "drug_like",
+                "boutique",
+                "small_molecules",
+            ),
+        ),
+        DatasetDefinition(
+            dataset_id="zinc15_tranche_druglike_annotated",
+            name="ZINC15 Drug-Like Annotated (2D, Multi-Tranche)",
+            description=(
+                "Multi-tranche drug-like subset from ZINC15 across MW bins B-K and "
+                "logP bins A-K with up-to-standard reactivity (A/B/C/E) and annotated "
+                "purchasability."
+            ),
+            source=_ZINC_TRANCHE_SOURCE,
+            homepage=_ZINC_TRANCHE_HOMEPAGE,
+            license_name=_ZINC_LICENSE_NAME,
+            license_url=_ZINC_LICENSE_URL,
+            urls=_zinc_druglike_tranche_prefixes(),
+            url_suffix="F.txt",
+            file_format="tsv",
+            category="compound_library",
+            url_mode="concat",
+            tags=(
+                "zinc",
+                "tranche",
+                "multi_tranche",
+                "drug_like",
+                "annotated",
+                "small_molecules",
+            ),
+        ),
+        DatasetDefinition(
+            dataset_id="tox21",
+            name="Tox21",
+            description="Nuclear receptor and stress response toxicity assays.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/tox21.csv.gz",),
+            file_format="csv",
+            category="toxicity",
+            tags=("toxicity", "classification", "admet"),
+        ),
+        DatasetDefinition(
+            dataset_id="bbbp",
+            name="BBBP",
+            description="Blood-brain barrier penetration classification dataset.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/BBBP.csv",),
+            file_format="csv",
+            category="admet",
+            tags=("bbb", "classification", "admet"),
+        ),
+        DatasetDefinition(
+            dataset_id="bace",
+            name="BACE",
+            description="Binding and inhibition labels for beta-secretase 1.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/bace.csv",),
+            file_format="csv",
+            category="target_activity",
+            tags=("target", "activity", "classification", "regression"),
+        ),
+        DatasetDefinition(
+            dataset_id="clintox",
+            name="ClinTox",
+            description="Clinical toxicity labels for marketed and failed compounds.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=(
+                "https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/clintox.csv.gz",
+            ),
+            file_format="csv",
+            category="toxicity",
+            tags=("toxicity", "clinical", "admet"),
+        ),
+        DatasetDefinition(
+            dataset_id="sider",
+            name="SIDER",
+            description="Side effect labels curated from marketed drugs.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/sider.csv.gz",),
+            file_format="csv",
+            category="safety",
+            tags=("side_effects", "safety", "multitask"),
+        ),
+        DatasetDefinition(
+            dataset_id="hiv",
+            name="HIV",
+            description="HIV replication inhibition activity labels.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/HIV.csv",),
+            file_format="csv",
+            category="target_activity",
+            tags=("hiv", "classification", "bioactivity"),
+        ),
+        DatasetDefinition(
+            dataset_id="muv",
+            name="MUV",
+            description="Maximum unbiased validation benchmark for virtual screening tasks.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/muv.csv.gz",),
+            file_format="csv",
+            category="virtual_screening",
+            tags=("virtual_screening", "classification", "hts"),
+        ),
+        DatasetDefinition(
+            dataset_id="esol",
+            name="ESOL",
+            description="Aqueous solubility regression benchmark.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=(
+                "https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/delaney-processed.csv",
+            ),
+            file_format="csv",
+            category="physchem",
+            tags=("solubility", "regression", "admet"),
+        ),
+        DatasetDefinition(
+            dataset_id="freesolv",
+            name="FreeSolv",
+            description="Hydration free energy regression set for small molecules.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/SAMPL.csv",),
+            file_format="csv",
+            category="physchem",
+            tags=("solvation", "regression", "qm"),
+        ),
+        DatasetDefinition(
+            dataset_id="lipophilicity",
+            name="Lipophilicity",
+            description="Octanol/water distribution coefficient (logD) regression dataset.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=(
+                "https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/Lipophilicity.csv",
+                "https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/lipo.csv",
+            ),
+            file_format="csv",
+            category="physchem",
+            tags=("logd", "regression", "admet"),
+        ),
+        DatasetDefinition(
+            dataset_id="pcba",
+            name="PCBA",
+            description="PubChem BioAssay multitask virtual screening benchmark.",
+            source=_MOLECULENET_SOURCE,
+            homepage=_MOLECULENET_HOMEPAGE,
+            license_name=_MOLECULENET_LICENSE_NAME,
+            license_url=_MOLECULENET_LICENSE_URL,
+            urls=("https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/pcba.csv.gz",),
+            file_format="csv",
+            category="virtual_screening",
+            tags=("pcba", "hts", "multitask"),
+        ),
+        DatasetDefinition(
+            dataset_id="bindingdb_articles_affinity",
+            name="BindingDB Article-Curated Affinity",
+            description=(
+                "BindingDB article-curated protein-ligand affinity measurements with "
+                "SMILES, target annotations, and assay values for SAR and "
+                "cross-target modeling."
+            ),
+            source="BindingDB downloadable TSV",
+            homepage="https://www.bindingdb.org/rwd/bind/chemsearch/marvin/Download.jsp",
+            license_name="CC BY 3.0 (BindingDB-curated data)",
+            license_url="https://creativecommons.org/licenses/by/3.0/",
+            urls=(
+                "https://www.bindingdb.org/rwd/bind/downloads/BindingDB_BindingDB_Articles_202604_tsv.zip",
+            ),
+            file_format="tsv",
+            category="target_activity",
+            compression="zip",
+            version="202604",
+            usage_notes=(
+                "Use for protein-ligand affinity modeling, literature-derived SAR "
+                "mining, and transfer learning across medicinal chemistry programs.",
+            ),
+            tags=("bindingdb", "affinity", "protein_ligand", "sar", "training"),
+        ),
+        DatasetDefinition(
+            dataset_id="openfda_drug_event_serious",
+            name="openFDA Drug Event Serious Reports",
+            description=(
+                "Serious adverse event reports from openFDA/FAERS for "
+                "post-marketing safety surveillance and pharmacovigilance analyses."
+            ),
+            source="openFDA Drug Adverse Event API (FAERS)",
+            homepage="https://open.fda.gov/apis/drug/event/",
+            license_name="CC0 1.0 (openFDA)",
+            license_url="https://open.fda.gov/license/",
+            file_format="jsonl",
+            category="safety",
+            api=ApiDatasetConfig(
+                endpoint="https://api.fda.gov/drug/event.json",
+                params={"search": "serious:1"},
+                pagination="link_header",
+                items_path="results",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=30,
+                max_rows=30_000,
+            ),
+            tags=(
+                "api",
+                "openfda",
+                "faers",
+                "adverse_events",
+                "post_marketing",
+                "safety",
+            ),
+        ),
+        DatasetDefinition(
+            dataset_id="proteinatlas_human_proteome",
+            name="Human Protein Atlas Proteome Table",
+            description=(
+                "Gene/protein-centric atlas table with tissue expression, "
+                "subcellular localization, secretome, and disease-related "
+                "annotations for human target biology workflows."
+            ),
+            source="Human Protein Atlas downloadable data",
+            homepage="https://www.proteinatlas.org/about/download",
+            license_name="CC BY-SA 4.0 (Human Protein Atlas)",
+            license_url="https://www.proteinatlas.org/about/licence",
+            urls=("https://www.proteinatlas.org/download/proteinatlas.tsv.zip",),
+            file_format="tsv",
+            category="targets",
+            tags=(
+                "human",
+                "proteomics",
+                "expression",
+                "target_annotation",
+                "subcellular_localization",
+            ),
+        ),
+        DatasetDefinition(
+            dataset_id="opentargets_target_prioritisation",
+            name="Open Targets Target Prioritisation",
+            description=(
+                "Open Targets target prioritisation features spanning tractability, "
+                "safety, novelty, and evidence-linked attributes for therapeutic "
+                "target ranking."
+            ),
+            source="Open Targets Platform downloadable parquet",
+            homepage="https://platform-docs.opentargets.org/data-access/datasets",
+            license_name="CC0 1.0 (Open Targets Platform data)",
+            license_url="https://platform-docs.opentargets.org/licence",
+            urls=_opentargets_parquet_part_urls(
+                release="25.03",
+                dataset="target_prioritisation",
+                part_token="9647e5c1-fd87-47e0-8c5d-3b1429e19b9a",
+                part_count=16,
+            ),
+            file_format="parquet",
+            category="targets",
+            version="25.03",
+            filename="target_prioritisation",
+            url_mode="bundle",
+            usage_notes=(
+                "Use for target ranking, tractability-aware portfolio construction, "
+                "and feature generation for target prioritisation models.",
+            ),
+            tags=(
+                "opentargets",
+                "target_prioritisation",
+                "tractability",
+                "safety",
+                "target_ranking",
+            ),
+        ),
+        DatasetDefinition(
+            dataset_id="gdsc2_fitted_dose_response",
+            name="GDSC2 Fitted Dose Response",
+            description=(
+                "CancerRxGene GDSC2 fitted dose-response measurements across cancer "
+                "cell lines for biomarker discovery, sensitivity modeling, and "
+                "translational pharmacology."
+            ),
+            source="CancerRxGene bulk download",
+            homepage="https://www.cancerrxgene.org/downloads/bulk_download",
+            license_name="CancerRxGene data terms",
+            license_url="https://www.cancerrxgene.org/legal",
+            urls=(
+                "https://cog.sanger.ac.uk/cancerrxgene/GDSC_release8.5/GDSC2_fitted_dose_response_27Oct23.xlsx",
+            ),
+            file_format="xlsx",
+            category="cell_response",
+            version="8.5-20231027",
+            usage_notes=(
+                "Use for cell-line drug sensitivity prediction, pharmacogenomic "
+                "biomarker discovery, and translational response modeling.",
+            ),
+            tags=(
+                "gdsc",
+                "cancerrxgene",
+                "dose_response",
+                "cell_lines",
+                "pharmacogenomics",
+            ),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_activity_ki_human",
+            name="ChEMBL Human Ki Activities",
+            description=(
+                "ChEMBL activity records for human targets with Ki and pChEMBL "
+                "values, useful for potency modeling."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="target_activity",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
+                params={
+                    "target_organism": "Homo sapiens",
+                    "standard_type": "Ki",
+                    "pchembl_value__isnull": "false",
+                },
+                pagination="chembl",
+                items_path="activities",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=40,
+                max_rows=25_000,
+            ),
+            tags=("api", "chembl", "human", "ki", "potency"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_activity_ic50_human",
+            name="ChEMBL Human IC50 Activities",
+            description=(
+                "ChEMBL activity records for human targets with IC50 and pChEMBL "
+                "values, useful for activity modeling."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="target_activity",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
+                params={
+                    "target_organism": "Homo sapiens",
+                    "standard_type": "IC50",
+                    "pchembl_value__isnull": "false",
+                },
+                pagination="chembl",
+                items_path="activities",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=40,
+                max_rows=25_000,
+            ),
+            tags=("api", "chembl", "human", "ic50", "potency"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_activity_kd_human",
+            name="ChEMBL Human Kd Activities",
+            description=(
+                "ChEMBL activity records for human targets with Kd and pChEMBL "
+                "values, useful for affinity modeling."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="target_activity",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
+                params={
+                    "target_organism": "Homo sapiens",
+                    "standard_type": "Kd",
+                    "pchembl_value__isnull": "false",
+                },
+                pagination="chembl",
+                items_path="activities",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=40,
+                max_rows=25_000,
+            ),
+            tags=("api", "chembl", "human", "kd", "affinity"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_activity_ec50_human",
+            name="ChEMBL Human EC50 Activities",
+            description=(
+                "ChEMBL activity records for human targets with EC50 and pChEMBL "
+                "values, useful for functional potency modeling."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="target_activity",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
+                params={
+                    "target_organism": "Homo sapiens",
+                    "standard_type": "EC50",
+                    "pchembl_value__isnull": "false",
+                },
+                pagination="chembl",
+                items_path="activities",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=40,
+                max_rows=25_000,
+            ),
+            tags=("api", "chembl", "human", "ec50", "potency"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_activity_ac50_human",
+            name="ChEMBL Human AC50 Activities",
+            description=(
+                "ChEMBL activity records for human targets with AC50 and pChEMBL "
+                "values, useful for concentration-response modeling."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="target_activity",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/activity.json",
+                params={
+                    "target_organism": "Homo sapiens",
+                    "standard_type": "AC50",
+                    "pchembl_value__isnull": "false",
+                },
+                pagination="chembl",
+                items_path="activities",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=40,
+                max_rows=25_000,
+            ),
+            tags=("api", "chembl", "human", "ac50", "potency"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_assays_binding_human",
+            name="ChEMBL Human Binding Assays",
+            description=(
+                "Binding-type ChEMBL assays for human targets, useful for assay "
+                "context and panel design."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="assays",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/assay.json",
+                params={
+                    "assay_type": "B",
+                    "target_organism": "Homo sapiens",
+                },
+                pagination="chembl",
+                items_path="assays",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=20,
+                max_rows=12_000,
+            ),
+            tags=("api", "chembl", "human", "assays", "binding"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_assays_functional_human",
+            name="ChEMBL Human Functional Assays",
+            description=(
+                "Functional-type ChEMBL assays for human targets, useful for "
+                "phenotypic and pathway-relevant assay context."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="assays",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/assay.json",
+                params={
+                    "assay_type": "F",
+                    "target_organism": "Homo sapiens",
+                },
+                pagination="chembl",
+                items_path="assays",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=20,
+                max_rows=12_000,
+            ),
+            tags=("api", "chembl", "human", "assays", "functional"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_assays_adme_human",
+            name="ChEMBL Human ADME Assays",
+            description=(
+                "ADME-type ChEMBL assays linked to human targets, useful for "
+                "pharmacokinetic assay landscape analysis."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="assays",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/assay.json",
+                params={
+                    "assay_type": "A",
+                    "target_organism": "Homo sapiens",
+                },
+                pagination="chembl",
+                items_path="assays",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=20,
+                max_rows=12_000,
+            ),
+            tags=("api", "chembl", "human", "assays", "adme"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_targets_human_single_protein",
+            name="ChEMBL Human Single-Protein Targets",
+            description=(
+                "ChEMBL target records restricted to human single proteins for "
+                "target universe definition."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="targets",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/target.json",
+                params={
+                    "target_type": "SINGLE PROTEIN",
+                    "organism": "Homo sapiens",
+                },
+                pagination="chembl",
+                items_path="targets",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=10,
+                max_rows=8_000,
+            ),
+            tags=("api", "chembl", "human", "targets"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_targets_human_protein_complex",
+            name="ChEMBL Human Protein Complex Targets",
+            description=(
+                "ChEMBL target records restricted to human protein complexes for "
+                "multi-subunit target-space definition."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="targets",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/target.json",
+                params={
+                    "target_type": "PROTEIN COMPLEX",
+                    "organism": "Homo sapiens",
+                },
+                pagination="chembl",
+                items_path="targets",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=10,
+                max_rows=8_000,
+            ),
+            tags=("api", "chembl", "human", "targets", "protein_complex"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_molecules_phase3plus",
+            name="ChEMBL Molecules Phase 3+",
+            description=(
+                "ChEMBL molecules with max clinical phase >= 3, useful for "
+                "late-stage scaffold and property priors."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="compound_library",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/molecule.json",
+                params={"max_phase__gte": "3"},
+                pagination="chembl",
+                items_path="molecules",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=30,
+                max_rows=20_000,
+            ),
+            tags=("api", "chembl", "clinical", "phase3plus"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_molecules_phase4",
+            name="ChEMBL Molecules Phase 4",
+            description=(
+                "ChEMBL molecules with max clinical phase >= 4, useful for "
+                "marketed-drug priors and late-stage benchmark sets."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="compound_library",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/molecule.json",
+                params={"max_phase__gte": "4"},
+                pagination="chembl",
+                items_path="molecules",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=30,
+                max_rows=20_000,
+            ),
+            tags=("api", "chembl", "clinical", "phase4"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_molecules_black_box_warning",
+            name="ChEMBL Molecules with Black Box Warning",
+            description=(
+                "ChEMBL molecules flagged with FDA boxed warning metadata for "
+                "safety-aware filtering and risk modeling."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="safety",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/molecule.json",
+                params={"black_box_warning": "1"},
+                pagination="chembl",
+                items_path="molecules",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=20,
+                max_rows=20_000,
+            ),
+            tags=("api", "chembl", "molecules", "safety", "black_box_warning"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_mechanism_phase2plus",
+            name="ChEMBL Mechanisms Phase 2+",
+            description=(
+                "ChEMBL mechanism-of-action records for compounds with max phase >= 2, "
+                "useful for target-mechanism mapping."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="targets",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/mechanism.json",
+                params={"max_phase__gte": "2"},
+                pagination="chembl",
+                items_path="mechanisms",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=20,
+                max_rows=20_000,
+            ),
+            tags=("api", "chembl", "mechanism_of_action", "clinical", "phase2plus"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_drug_indications_phase2plus",
+            name="ChEMBL Drug Indications Phase 2+",
+            description=(
+                "ChEMBL drug indication records for compounds with indication max phase >= 2, "
+                "useful for translational and disease-area annotation."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="targets",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/drug_indication.json",
+                params={"max_phase_for_ind__gte": "2"},
+                pagination="chembl",
+                items_path="drug_indications",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=20,
+                max_rows=20_000,
+            ),
+            tags=("api", "chembl", "indications", "clinical", "phase2plus"),
+        ),
+        DatasetDefinition(
+            dataset_id="chembl_drug_indications_phase3plus",
+            name="ChEMBL Drug Indications Phase 3+",
+            description=(
+                "ChEMBL drug indication records for compounds with indication max phase >= 3, "
+                "useful for late-stage translational and disease-area annotation."
+            ),
+            source=_CHEMBL_SOURCE,
+            homepage=_CHEMBL_HOMEPAGE,
+            license_name=_CHEMBL_LICENSE_NAME,
+            license_url=_CHEMBL_LICENSE_URL,
+            file_format="jsonl",
+            category="targets",
+            api=ApiDatasetConfig(
+                endpoint="https://www.ebi.ac.uk/chembl/api/data/drug_indication.json",
+                params={"max_phase_for_ind__gte": "3"},
+                pagination="chembl",
+                items_path="drug_indications",
+                page_size_param="limit",
+                page_size=1000,
+                max_pages=20,
+                max_rows=20_000,
+            ),
+            tags=("api", "chembl", "indications", "clinical", "phase3plus"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_reviewed",
+            name="UniProt Human Reviewed Proteome",
+            description=(
+                "Reviewed human UniProtKB entries (Swiss-Prot) for baseline target "
+                "annotation and sequence features."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="targets",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": "organism_id:9606 AND reviewed:true",
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=40,
+                max_rows=20_000,
+            ),
+            tags=("api", "uniprot", "human", "reviewed", "targets"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_receptors",
+            name="UniProt Human Receptors",
+            description=(
+                "Reviewed human proteins annotated as receptors for receptor-family "
+                "mapping beyond GPCR-focused subsets."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": "organism_id:9606 AND reviewed:true AND keyword:Receptor",
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "receptors", "target_family"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_membrane",
+            name="UniProt Human Membrane Proteins",
+            description=(
+                "Reviewed human proteins annotated with membrane localization for "
+                "membrane-target enrichment workflows."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": "organism_id:9606 AND reviewed:true AND keyword:Membrane",
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "membrane", "target_family"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_nucleus",
+            name="UniProt Human Nuclear Proteins",
+            description=(
+                "Reviewed human proteins annotated with nuclear localization for "
+                "nucleus-focused target enrichment and biology workflows."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": "organism_id:9606 AND reviewed:true AND keyword:Nucleus",
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "nucleus", "target_family"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_kinases",
+            name="UniProt Human Kinases",
+            description=(
+                "Reviewed human proteins annotated as kinases for kinase-focused "
+                "target campaigns."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": "organism_id:9606 AND reviewed:true AND keyword:Kinase",
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "kinase", "target_family"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_gpcr",
+            name="UniProt Human GPCRs",
+            description=(
+                "Reviewed human GPCR proteins for receptor-focused target "
+                "selection and annotation."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": (
+                        "organism_id:9606 AND reviewed:true AND "
+                        'keyword:"G-protein coupled receptor"'
+                    ),
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "gpcr", "target_family"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_ion_channels",
+            name="UniProt Human Ion Channels",
+            description=(
+                "Reviewed human ion channel proteins for ion-channel-focused "
+                "campaign planning."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": 'organism_id:9606 AND reviewed:true AND keyword:"Ion channel"',
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "ion_channel", "target_family"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_transporters",
+            name="UniProt Human Transporters",
+            description=(
+                "Reviewed human transporter proteins for transporter liability and "
+                "uptake/efflux modeling contexts."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": "organism_id:9606 AND reviewed:true AND keyword:Transport",
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "transporters", "target_family"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_secreted",
+            name="UniProt Human Secreted Proteins",
+            description=(
+                "Reviewed human secreted proteins for extracellular target discovery "
+                "and biologics-oriented programs."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": "organism_id:9606 AND reviewed:true AND keyword:Secreted",
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "secreted", "target_family"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_transcription_factors",
+            name="UniProt Human Transcription-Related Proteins",
+            description=(
+                "Reviewed human proteins annotated with transcription-related "
+                "keywords for transcriptional program target discovery."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": "organism_id:9606 AND reviewed:true AND keyword:Transcription",
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "transcription", "target_family"),
+        ),
+        DatasetDefinition(
+            dataset_id="uniprot_human_enzymes",
+            name="UniProt Human Enzymes",
+            description=(
+                "Reviewed human proteins annotated as enzymes for enzyme-focused "
+                "target family benchmarking."
+            ),
+            source=_UNIPROT_SOURCE,
+            homepage=_UNIPROT_HOMEPAGE,
+            license_name=_UNIPROT_LICENSE_NAME,
+            license_url=_UNIPROT_LICENSE_URL,
+            file_format="jsonl",
+            category="target_families",
+            api=ApiDatasetConfig(
+                endpoint="https://rest.uniprot.org/uniprotkb/search",
+                params={
+                    "query": "organism_id:9606 AND reviewed:true AND keyword:Enzyme",
+                    "format": "json",
+                },
+                pagination="link_header",
+                items_path="results",
+                page_size_param="size",
+                page_size=500,
+                max_pages=20,
+                max_rows=8_000,
+            ),
+            tags=("api", "uniprot", "human", "enzymes", "target_family"),
+        ),
+    ]
 
 
+@functools.cache
 def get_default_catalog() -> DatasetCatalog:
-    """Return the built-in dataset catalog."""
-    return DEFAULT_CATALOG
+    """Return the built-in dataset catalog, building it on first use."""
+    return DatasetCatalog.from_entries(_build_default_datasets())
@@ -3,98 +3,139 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import datetime
+import functools
 import json
-from collections.abc import Mapping
+import operator
+import os
+import sys
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .cache import DataCache
-from .io import iter_parquet_file_chunks
-from .pipeline import DatasetManager
+if TYPE_CHECKING:
+    from .models import DatasetDefinition, FetchResult, MaterializeResult
+    from .pipeline import DatasetManager
 
+_Subparsers = argparse._SubParsersAction
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build command-line parser."""
-    parser = argparse.ArgumentParser(
-        prog="refua-data", description="Refua dataset tooling"
-    )
-    parser.add_argument(
-        "--cache-root",
-        type=Path,
-        default=None,
-        help="Override cache root (default: $REFUA_DATA_HOME or ~/.cache/refua-data)",
-    )
+_HELP_DATASET_ID = "Dataset ID"
+_HELP_TAG = "Filter datasets by tag"
+_HELP_JSON = "Emit JSON output"
+_HELP_DOWNLOAD_TIMEOUT = "Download timeout in seconds"
 
-    subparsers = parser.add_subparsers(dest="command", required=True)
 
-    list_parser = subparsers.add_parser("list", help="List available datasets")
-    list_parser.add_argument("--tag", default=None, help="Filter datasets by tag")
-    list_parser.add_argument("--json", action="store_true", help="Emit JSON output")
+@functools.cache
+def _tag_parent() -> argparse.ArgumentParser:
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--tag", default=None, help=_HELP_TAG)
+    return parent
 
-    fetch_parser = subparsers.add_parser("fetch", help="Fetch one dataset")
-    fetch_parser.add_argument("dataset_id", help="Dataset ID")
-    fetch_parser.add_argument("--force", action="store_true", help="Force re-download")
-    fetch_parser.add_argument(
-        "--refresh",
-        action="store_true",
-        help="Refresh against remote with conditional HTTP requests",
-    )
-    fetch_parser.add_argument(
+
+@functools.cache
+def _json_parent() -> argparse.ArgumentParser:
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--json", action="store_true", help=_HELP_JSON)
+    return parent
+
+
+@functools.cache
+def _download_timeout_parent() -> argparse.ArgumentParser:
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument(
         "--timeout-seconds",
         type=float,
         default=120.0,
-        help="Download timeout in seconds",
+        help=_HELP_DOWNLOAD_TIMEOUT,
     )
+    return parent
 
-    materialize_parser = subparsers.add_parser(
-        "materialize", help="Fetch and materialize one dataset to parquet"
-    )
-    materialize_parser.add_argument("dataset_id", help="Dataset ID")
-    materialize_parser.add_argument(
-        "--force", action="store_true", help="Force reprocessing"
-    )
-    materialize_parser.add_argument(
+
+@functools.cache
+def _materialize_parent() -> argparse.ArgumentParser:
+    """Options shared by `materialize` and `materialize-all`."""
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--force", action="store_true", help="Force reprocessing")
+    parent.add_argument(
         "--refresh",
         action="store_true",
-        help="Refresh raw file against remote metadata",
+        help="Refresh raw files against remote metadata",
     )
-    materialize_parser.add_argument(
+    parent.add_argument(
         "--chunksize",
         type=int,
         default=100_000,
         help="Rows per chunk for parquet writing",
     )
-    materialize_parser.add_argument(
-        "--timeout-seconds",
-        type=float,
-        default=120.0,
-        help="Download timeout in seconds",
+    return parent
+
+
+def _add_list_parser(subparsers: _Subparsers) -> None:
+    list_parser = subparsers.add_parser(
+        "list",
+        parents=[_tag_parent(), _json_parent()],
+        help="List available datasets",
+    )
+    list_parser.add_argument(
+        "--ndjson", action="store_true", help="Emit one JSON object per dataset per line"
+    )
+
+
+def _add_fetch_parser(subparsers: _Subparsers) -> None:
+    fetch_parser = subparsers.add_parser(
+        "fetch", parents=[_download_timeout_parent()], help="Fetch one dataset"
+    )
+    fetch_parser.add_argument("dataset_id", help=_HELP_DATASET_ID)
+    fetch_parser.add_argument("--force", action="store_true", help="Force re-download")
+    fetch_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Refresh against remote with conditional HTTP requests",
+    )
+
+
+def _add_materialize_parser(subparsers: _Subparsers) -> None:
+    materialize_parser = subparsers.add_parser(
+        "materialize",
+        parents=[_materialize_parent(), _download_timeout_parent()],
+        help="Fetch and materialize one dataset to parquet",
     )
+    materialize_parser.add_argument("dataset_id", help=_HELP_DATASET_ID)
+
+
+def _add_materialize_all_parser(subparsers: _Subparsers) -> None:
+    from .pipeline import _MAX_WORKERS
 
     mat_all_parser = subparsers.add_parser(
-        "materialize-all", help="Materialize all datasets (or by tag)"
+        "materialize-all",
+        parents=[_tag_parent(), _materialize_parent()],
+        help="Materialize all datasets (or by tag)",
     )
-    mat_all_parser.add_argument("--tag", default=None, help="Filter datasets by tag")
     mat_all_parser.add_argument(
-        "--force", action="store_true", help="Force reprocessing"
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Datasets to materialize concurrently (default: min({_MAX_WORKERS}, datasets))",
     )
     mat_all_parser.add_argument(
-        "--refresh",
+        "--processes",
         action="store_true",
-        help="Refresh raw files against remote metadata",
+        help="Materialize in worker processes instead of threads (CPU-bound parquet encoding)",
     )
     mat_all_parser.add_argument(
-        "--chunksize",
-        type=int,
-        default=100_000,
-        help="Rows per chunk for parquet writing",
+        "--ndjson",
+        action="store_true",
+        help="Stream one JSON line per dataset as it finishes",
     )
 
+
+def _add_query_parser(subparsers: _Subparsers) -> None:
     query_parser = subparsers.add_parser(
         "query",
         help="Query rows from materialized parquet",
     )
-    query_parser.add_argument("dataset_id", help="Dataset ID")
+    query_parser.add_argument("dataset_id", help=_HELP_DATASET_ID)
     query_parser.add_argument(
         "--columns",
         default=None,
@@ -116,10 +157,17 @@ def build_parser() -> argparse.ArgumentParser:
     )
     query_parser.add_argument(
         "--materialize-if-missing",
-        action=argparse.BooleanOptionalAction,
-        default=True,
+        dest="materialize_if_missing",
+        action="store_true",
         help="Materialize parquet if missing (default: true)",
     )
+    query_parser.add_argument(
+        "--no-materialize-if-missing",
+        dest="materialize_if_missing",
+        action="store_false",
+        help="Fail instead of materializing when parquet is missing",
+    )
+    query_parser.set_defaults(materialize_if_missing=True)
     query_parser.add_argument(
         "--force-materialize",
         action="store_true",
@@ -142,9 +190,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=120.0,
         help="Download/materialization timeout in seconds",
     )
+    query_parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream a header line then one JSON row per line instead of one document",
+    )
 
+
+def _add_validate_sources_parser(subparsers: _Subparsers) -> None:
     validate_parser = subparsers.add_parser(
         "validate-sources",
+        parents=[_tag_parent(), _json_parent()],
         help="Validate dataset source endpoints (file/http/api)",
     )
     validate_parser.add_argument(
@@ -152,61 +208,150 @@ def build_parser() -> argparse.ArgumentParser:
         nargs="*",
         help="Optional dataset IDs to validate (defaults to all datasets)",
     )
-    validate_parser.add_argument("--tag", default=None, help="Filter datasets by tag")
     validate_parser.add_argument(
         "--timeout-seconds",
         type=float,
         default=20.0,
         help="Per-source probe timeout in seconds",
     )
-    validate_parser.add_argument("--json", action="store_true", help="Emit JSON output")
     validate_parser.add_argument(
         "--fail-on-error",
         action="store_true",
         help="Exit with code 1 if any source probe fails",
     )
+    validate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Datasets to validate concurrently (default: min(8, datasets))",
+    )
+
+
+_SUBCOMMAND_PARSERS: dict[str, Callable[[_Subparsers], None]] = {
+    "list": _add_list_parser,
+    "fetch": _add_fetch_parser,
+    "materialize": _add_materialize_parser,
+    "materialize-all": _add_materialize_all_parser,
+    "query": _add_query_parser,
+    "validate-sources": _add_validate_sources_parser,
+}
+
+
+def _peek_command(argv: Sequence[str]) -> str | None:
+    """Return the subcommand named in `argv`, or None if help/unknown."""
+    tokens = iter(argv)
+    for token in tokens:
+        if token in {"-h", "--help"}:
+            return None
+        if token == "--cache-root":
+            next(tokens, None)
+            continue
+        if token.startswith("-"):
+            continue
+        return token if token in _SUBCOMMAND_PARSERS else None
+    return None
+
+
+def build_parser(argv: Sequence[str] | None = None) -> argparse.ArgumentParser:
+    """Build command-line parser.
+
+    When `argv` names a known subcommand only that subparser is registered;
+    otherwise (help, missing, or unknown command) all subparsers are built.
+    """
+    parser = argparse.ArgumentParser(
+        prog="refua-data", description="Refua dataset tooling"
+    )
+    parser.add_argument(
+        "--cache-root",
+        default=None,
+        help="Override cache root (default: $REFUA_DATA_HOME or ~/.cache/refua-data)",
+    )
+    parser.add_argument(
+        "--pretty",
+        dest="pretty",
+        action="store_true",
+        default=None,
+        help="Indent JSON output (default: only when stdout is a terminal)",
+    )
+    parser.add_argument(
+        "--no-pretty",
+        dest="pretty",
+        action="store_false",
+        help="Emit compact JSON output",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    command = _peek_command(argv) if argv is not None else None
+    if command is not None:
+        _SUBCOMMAND_PARSERS[command](subparsers)
+    else:
+        for add_parser in _SUBCOMMAND_PARSERS.values():
+            add_parser(subparsers)
 
     return parser
 
 
-def _build_manager(cache_root: Path | None) -> DatasetManager:
-    cache = DataCache(cache_root) if cache_root else DataCache()
+def _build_manager(cache_root: str | None) -> DatasetManager:
+    from .cache import DataCache
+    from .pipeline import DatasetManager
+
+    cache = DataCache(Path(cache_root)) if cache_root else DataCache()
     return DatasetManager(cache=cache)
 
 
-def _run_list(manager: DatasetManager, *, tag: str | None, as_json: bool) -> int:
+def _list_record(dataset: DatasetDefinition) -> dict[str, Any]:
+    return {
+        "dataset_id": dataset.dataset_id,
+        "name": dataset.name,
+        "description": dataset.description,
+        "usage_notes": dataset.resolved_usage_notes(),
+        "category": dataset.category,
+        "source_type": "api" if dataset.api is not None else "file",
+        "source": dataset.source,
+        "tags": dataset.tags,
+        "license": dataset.license_name,
+    }
+
+
+def _run_list(
+    manager: DatasetManager,
+    *,
+    tag: str | None,
+    as_json: bool,
+    ndjson: bool = False,
+    pretty: bool = True,
+) -> int:
     datasets = manager.list_datasets(tag=tag)
+    if ndjson:
+        for dataset in datasets:
+            _write_stdout_bytes(_dumps_json_line(_list_record(dataset)))
+        return 0
     if as_json:
-        payload = [
-            {
-                "dataset_id": dataset.dataset_id,
-                "name": dataset.name,
-                "description": dataset.description,
-                "usage_notes": list(dataset.resolved_usage_notes()),
-                "category": dataset.category,
-                "source_type": "api" if dataset.api is not None else "file",
-                "source": dataset.source,
-                "tags": list(dataset.tags),
-                "license": dataset.license_name,
-            }
-            for dataset in datasets
-        ]
-        print(json.dumps(payload, indent=2))
+        _print_json([_list_record(dataset) for dataset in datasets], pretty=pretty)
         return 0
 
-    print(f"Datasets ({len(datasets)}):")
+    lines = [f"Datasets ({len(datasets)}):"]
     for dataset in datasets:
         tags = ", ".join(dataset.tags)
         source_type = "api" if dataset.api is not None else "file"
-        print(
+        lines.append(
             f"- {dataset.dataset_id:<32} {source_type:<4} {dataset.category:<18} "
             f"{dataset.name} [{tags}]"
         )
-        print(f"  desc: {dataset.description}")
-        print(f"  use:  {dataset.resolved_usage_notes()[0]}")
+        lines.append(f"  desc: {dataset.description}")
+        lines.append(f"  use:  {dataset.resolved_usage_notes()[0]}")
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
+def _result_dataset(
+    manager: DatasetManager, result: FetchResult | MaterializeResult
+) -> DatasetDefinition:
+    if result.dataset is not None:
+        return result.dataset
+    return manager.catalog.get(result.dataset_id)
+
+
 def _run_fetch(
     manager: DatasetManager,
     *,
@@ -214,30 +359,28 @@ def _run_fetch(
     force: bool,
     refresh: bool,
     timeout_seconds: float,
+    pretty: bool = True,
 ) -> int:
-    dataset = manager.catalog.get(dataset_id)
     result = manager.fetch(
         dataset_id,
         force=force,
         refresh=refresh,
         timeout_seconds=timeout_seconds,
     )
-    print(
-        json.dumps(
-            {
-                "dataset_id": result.dataset_id,
-                "version": result.version,
-                "raw_path": str(result.raw_path),
-                "metadata_path": str(result.metadata_path),
-                "source_url": result.source_url,
-                "cache_hit": result.cache_hit,
-                "refreshed": result.refreshed,
-                "bytes_downloaded": result.bytes_downloaded,
-                "sha256": result.sha256,
-                "dataset": dataset.metadata_snapshot(),
-            },
-            indent=2,
-        )
+    _print_json(
+        {
+            "dataset_id": result.dataset_id,
+            "version": result.version,
+            "raw_path": result.raw_path_str,
+            "metadata_path": result.metadata_path_str,
+            "source_url": result.source_url,
+            "cache_hit": result.cache_hit,
+            "refreshed": result.refreshed,
+            "bytes_downloaded": result.bytes_downloaded,
+            "sha256": result.sha256,
+            "dataset": _result_dataset(manager, result).metadata_snapshot(),
+        },
+        pretty=pretty,
     )
     return 0
 
@@ -250,8 +393,8 @@ def _run_materialize(
     refresh: bool,
     chunksize: int,
     timeout_seconds: float,
+    pretty: bool = True,
 ) -> int:
-    dataset = manager.catalog.get(dataset_id)
     result = manager.materialize(
         dataset_id,
         force=force,
@@ -259,25 +402,50 @@ def _run_materialize(
         chunksize=chunksize,
         timeout_seconds=timeout_seconds,
     )
-    print(
-        json.dumps(
-            {
-                "dataset_id": result.dataset_id,
-                "version": result.version,
-                "parquet_dir": str(result.parquet_dir),
-                "manifest_path": str(result.manifest_path),
-                "parts": [str(path) for path in result.parts],
-                "row_count": result.row_count,
-                "cache_hit": result.cache_hit,
-                "source_sha256": result.source_sha256,
-                "dataset": dataset.metadata_snapshot(),
-            },
-            indent=2,
-        )
+    _print_json(
+        {
+            "dataset_id": result.dataset_id,
+            "version": result.version,
+            "parquet_dir": result.parquet_dir_str,
+            "manifest_path": result.manifest_path_str,
+            "parts": list(result.part_strs),
+            "row_count": result.row_count,
+            "cache_hit": result.cache_hit,
+            "source_sha256": result.source_sha256,
+            "dataset": _result_dataset(manager, result).metadata_snapshot(),
+        },
+        pretty=pretty,
     )
     return 0
 
 
+def _materialize_record(result: MaterializeResult) -> dict[str, Any]:
+    return {
+        "dataset_id": result.dataset_id,
+        "parquet_dir": result.parquet_dir_str,
+        "row_count": result.row_count,
+        "cache_hit": result.cache_hit,
+    }
+
+
+def _materialize_in_process(
+    cache_root: str,
+    dataset_id: str,
+    force: bool,
+    refresh: bool,
+    chunksize: int,
+) -> dict[str, Any]:
+    """Process-pool entrypoint: rebuild a manager in the child and materialize."""
+    manager = _build_manager(cache_root)
+    result = manager.materialize(
+        dataset_id,
+        force=force,
+        refresh=refresh,
+        chunksize=chunksize,
+    )
+    return _materialize_record(result)
+
+
 def _run_materialize_all(
     manager: DatasetManager,
     *,
@@ -285,38 +453,58 @@ def _run_materialize_all(
     force: bool,
     refresh: bool,
     chunksize: int,
+    workers: int | None = None,
+    processes: bool = False,
+    ndjson: bool = False,
+    pretty: bool = True,
 ) -> int:
-    dataset_ids = [dataset.dataset_id for dataset in manager.list_datasets(tag=tag)]
-    results = manager.materialize_many(
-        dataset_ids,
-        force=force,
-        refresh=refresh,
-        chunksize=chunksize,
-    )
-    payload = [
-        {
-            "dataset_id": result.dataset_id,
-            "parquet_dir": str(result.parquet_dir),
-            "row_count": result.row_count,
-            "cache_hit": result.cache_hit,
-        }
-        for result in results
-    ]
-    print(json.dumps(payload, indent=2))
-    return 0
+    datasets = manager.list_datasets(tag=tag)
+    records: Iterator[dict[str, Any]]
+    if processes and len(datasets) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+
+        from .pipeline import _worker_count
+
+        executor = ProcessPoolExecutor(max_workers=_worker_count(workers, len(datasets)))
+        records = executor.map(
+            _materialize_in_process,
+            repeat(str(manager.cache.root)),
+            [dataset.dataset_id for dataset in datasets],
+            repeat(force),
+            repeat(refresh),
+            repeat(chunksize),
+        )
+    else:
+        executor = None
+        results = manager.iter_materialize(
+            datasets,
+            force=force,
+            refresh=refresh,
+            chunksize=chunksize,
+            max_workers=workers,
+        )
+        records = (_materialize_record(result) for result in results)
+
+    try:
+        if ndjson:
+            for record in records:
+                _write_stdout_bytes(_dumps_json_line(record))
+                sys.stdout.flush()
+            return 0
+
+        _print_json(list(records), pretty=pretty)
+        return 0
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
 
 def _parse_query_columns(raw_columns: str | None) -> list[str] | None:
     if raw_columns is None:
         return None
-    seen: set[str] = set()
-    columns: list[str] = []
-    for raw_value in raw_columns.split(","):
-        column = raw_value.strip()
-        if not column or column in seen:
-            continue
-        seen.add(column)
-        columns.append(column)
+    stripped = (raw_value.strip() for raw_value in raw_columns.split(","))
+    columns = list(dict.fromkeys(column for column in stripped if column))
     if not columns:
         raise ValueError("columns must contain at least one non-empty name.")
     return columns
@@ -334,58 +522,100 @@ def _parse_query_filters(raw_filters: str | None) -> dict[str, Any]:
     return {str(key): value for key, value in parsed.items()}
 
 
-def _apply_query_filters(frame: Any, filters: Mapping[str, Any]) -> Any:
-    if not filters:
-        return frame
+# Binary comparisons shared by the pandas and Arrow filter paths; `in` and
+# `contains` are handled separately.
+_COMPARISON_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "le": operator.le,
+}
+
+# Cheaper, usually more selective predicates run first so later ones see
+# fewer rows: equality/membership, then ranges, then substring matches.
+_FILTER_OP_TIERS: dict[str, int] = {
+    "eq": 0,
+    "in": 0,
+    "ne": 1,
+    "gt": 1,
+    "gte": 1,
+    "ge": 1,
+    "lt": 1,
+    "lte": 1,
+    "le": 1,
+    "contains": 2,
+}
 
-    filtered = frame
-    for column, condition in filters.items():
-        if column not in filtered.columns:
-            raise ValueError(f"Unknown filter column '{column}'.")
-        series = filtered[column]
 
+def _flatten_query_filters(filters: Mapping[str, Any]) -> list[tuple[str, str, Any]]:
+    """Expand filters into `(column, op, value)` predicates ordered by selectivity."""
+    predicates: list[tuple[str, str, Any]] = []
+    for column, condition in filters.items():
         if isinstance(condition, Mapping):
             for op, raw_value in condition.items():
                 op_name = str(op).strip().lower()
-                if op_name == "eq":
-                    filtered = filtered[series == raw_value]
-                elif op_name == "ne":
-                    filtered = filtered[series != raw_value]
-                elif op_name == "gt":
-                    filtered = filtered[series > raw_value]
-                elif op_name in {"gte", "ge"}:
-                    filtered = filtered[series >= raw_value]
-                elif op_name == "lt":
-                    filtered = filtered[series < raw_value]
-                elif op_name in {"lte", "le"}:
-                    filtered = filtered[series <= raw_value]
-                elif op_name == "in":
-                    if not isinstance(raw_value, (list, tuple, set)):
-                        raise ValueError(f"filters.{column}.in must be an array value.")
-                    filtered = filtered[series.isin(list(raw_value))]
-                elif op_name == "contains":
-                    pattern = str(raw_value)
-                    filtered = filtered[
-                        series.astype(str).str.contains(
-                            pattern,
-                            case=False,
-                            na=False,
-                            regex=False,
-                        )
-                    ]
-                else:
+                if op_name not in _FILTER_OP_TIERS:
                     raise ValueError(
                         f"Unsupported filter operation '{op_name}' for column '{column}'."
                     )
-                series = filtered[column]
-            continue
+                if op_name == "in" and not isinstance(raw_value, (list, tuple, set)):
+                    raise ValueError(f"filters.{column}.in must be an array value.")
+                predicates.append((column, op_name, raw_value))
+        elif isinstance(condition, (list, tuple, set)):
+            predicates.append((column, "in", condition))
+        else:
+            predicates.append((column, "eq", condition))
+
+    predicates.sort(key=lambda predicate: _FILTER_OP_TIERS[predicate[1]])
+    return predicates
+
 
-        if isinstance(condition, (list, tuple, set)):
-            filtered = filtered[series.isin(list(condition))]
+def _apply_query_filters(frame: Any, filters: Mapping[str, Any]) -> Any:
+    if not filters:
+        return frame
+
+    for column in filters:
+        if column not in frame.columns:
+            raise ValueError(f"Unknown filter column '{column}'.")
+
+    import numpy as np
+
+    # Fuse every predicate into one boolean mask and index the frame once.
+    mask = np.ones(len(frame), dtype=bool)
+    for column, op_name, raw_value in _flatten_query_filters(filters):
+        series = frame[column]
+        compare = _COMPARISON_OPS.get(op_name)
+        if compare is not None:
+            matches = compare(series, raw_value)
+        elif op_name == "in":
+            matches = series.isin(list(raw_value))
         else:
-            filtered = filtered[series == condition]
+            pattern = str(raw_value)
+            if not pattern:
+                continue
+            matches = _contains_mask(series, pattern)
+        if hasattr(matches, "fillna"):
+            # Missing values are "not equal" to anything, as with plain pandas `!=`.
+            matches = matches.fillna(op_name == "ne").to_numpy(dtype=bool)
+        mask &= matches
+        if not mask.any():
+            break
+
+    return frame[mask]
+
 
-    return filtered
+def _contains_mask(series: Any, pattern: str) -> Any:
+    """Case-insensitive substring mask computed with Arrow's string kernel."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    values = pa.array(series.astype("string"), from_pandas=True)
+    matches = pc.match_substring(values, pattern, ignore_case=True).fill_null(False)
+    return matches.to_numpy(zero_copy_only=False)
 
 
 def _query_read_columns(
@@ -395,14 +625,251 @@ def _query_read_columns(
     if query_columns is None:
         return None
 
-    columns = list(query_columns)
-    seen = set(columns)
-    for column in query_filters:
-        if column in seen:
+    return list(dict.fromkeys([*query_columns, *query_filters]))
+
+
+def _build_query_expression(
+    filters: Mapping[str, Any],
+    column_names: Sequence[str],
+) -> Any:
+    """Translate query filters into one Arrow dataset expression (or None)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for column in filters:
+        if column not in column_names:
+            raise ValueError(f"Unknown filter column '{column}'.")
+
+    expression = None
+    for column, op_name, raw_value in _flatten_query_filters(filters):
+        field = pc.field(column)
+        compare = _COMPARISON_OPS.get(op_name)
+        if op_name == "ne":
+            if raw_value is None:
+                # pandas `series != None` is true for every row, nulls included.
+                continue
+            # Arrow drops rows whose comparison is null; pandas keeps them for `!=`.
+            predicate = (field != raw_value) | field.is_null()
+        elif compare is not None:
+            predicate = compare(field, raw_value)
+        elif op_name == "in":
+            predicate = field.isin(list(raw_value))
+        else:
+            pattern = str(raw_value)
+            if not pattern:
+                continue
+            predicate = pc.match_substring(
+                field.cast(pa.string()), pattern, ignore_case=True
+            )
+        expression = predicate if expression is None else expression & predicate
+    return expression
+
+
+def _batch_records(batch: Any) -> tuple[list[dict[str, Any]], bool]:
+    """Convert a record batch to row dicts, with missing values as pandas prints them.
+
+    Null numbers and strings become NaN, as they did when rows came from pandas
+    frames. The flag reports whether any NaN made it into the rows.
+    """
+    import math
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    records = batch.to_pylist()
+    missing: list[str] = []
+    has_nan = False
+    for name, column in zip(batch.schema.names, batch.columns, strict=True):
+        kind = column.type
+        is_float = pa.types.is_floating(kind)
+        if column.null_count and (
+            is_float
+            or pa.types.is_integer(kind)
+            or pa.types.is_string(kind)
+            or pa.types.is_large_string(kind)
+        ):
+            missing.append(name)
+        elif is_float and pc.any(pc.is_nan(column)).as_py():
+            has_nan = True
+    for record in records:
+        for name in missing:
+            if record[name] is None:
+                record[name] = math.nan
+    return records, has_nan or bool(missing)
+
+
+@functools.lru_cache(maxsize=32)
+def _open_query_dataset(
+    part_paths: tuple[str, ...],
+    part_stamps: tuple[tuple[int, int], ...],
+) -> Any:
+    # `part_stamps` only keys the cache so rewritten parts are re-opened; the
+    # cached dataset keeps parsed parquet footers across repeated queries.
+    import pyarrow.dataset as pads
+
+    return pads.dataset(list(part_paths), format="parquet")
+
+
+def _scan_query_arrow(
+    parts: list[Path],
+    *,
+    query_columns: list[str] | None,
+    query_filters: Mapping[str, Any],
+    limit: int,
+    chunksize: int,
+    emit: Callable[[list[dict[str, Any]], bool], None],
+) -> tuple[int, int, int]:
+    """Scan parquet parts with Arrow filter/projection and row-group pushdown.
+
+    Matching rows are passed to `emit` part by part. A part whose types Arrow
+    cannot filter falls back to pandas before any of its rows are emitted, so
+    streamed output never stops halfway. Returns
+    `(returned_rows, scanned_rows, scanned_parts)`.
+    """
+    import pyarrow as pa
+
+    part_paths = tuple(str(part) for part in parts)
+    part_stamps = tuple(
+        (stat.st_mtime_ns, stat.st_size) for stat in map(os.stat, part_paths)
+    )
+    dataset = _open_query_dataset(part_paths, part_stamps)
+
+    returned_rows = 0
+    scanned_rows = 0
+    scanned_parts = 0
+    for fragment in dataset.get_fragments():
+        scanned_parts += 1
+        scan_kwargs: dict[str, Any] = {
+            "query_columns": query_columns,
+            "query_filters": query_filters,
+            "remaining": int(limit) - returned_rows,
+            "chunksize": chunksize,
+        }
+        try:
+            part_rows, has_nan, part_scanned = _scan_fragment_arrow(fragment, **scan_kwargs)
+        except (pa.ArrowException, TypeError):
+            # Filters Arrow cannot bind to this part's types (for example a
+            # column that drifted to strings) keep the pandas semantics.
+            part_rows, has_nan, part_scanned = _scan_part_pandas(
+                Path(fragment.path), **scan_kwargs
+            )
+        scanned_rows += part_scanned
+        if part_rows:
+            emit(part_rows, has_nan)
+            returned_rows += len(part_rows)
+            if returned_rows >= limit:
+                break
+    return returned_rows, scanned_rows, scanned_parts
+
+
+def _scan_fragment_arrow(
+    fragment: Any,
+    *,
+    query_columns: list[str] | None,
+    query_filters: Mapping[str, Any],
+    remaining: int,
+    chunksize: int,
+) -> tuple[list[dict[str, Any]], bool, int]:
+    """Filter one parquet fragment in Arrow; return (rows, has_nan, scanned_rows)."""
+    # Parts may differ in column types (materialize starts a new part when
+    # they drift), so each one is scanned with its own schema rather than
+    # the dataset schema inferred from the first part.
+    schema = fragment.physical_schema
+    expression = _build_query_expression(query_filters, schema.names)
+    if expression is not None:
+        # Drop row groups whose min/max statistics cannot satisfy the
+        # filter before any column data is decoded.
+        fragment = fragment.subset(filter=expression, schema=schema)
+    row_groups = fragment.row_groups
+    rows: list[dict[str, Any]] = []
+    rows_have_nan = False
+    if not row_groups:
+        return rows, rows_have_nan, 0
+    scanned_rows = sum(row_group.num_rows for row_group in row_groups)
+    for batch in fragment.to_batches(
+        schema=schema,
+        columns=query_columns,
+        filter=expression,
+        batch_size=chunksize,
+    ):
+        if batch.num_rows == 0:
             continue
-        columns.append(column)
-        seen.add(column)
-    return columns
+        batch_rows, has_nan = _batch_records(batch.slice(0, remaining - len(rows)))
+        rows.extend(batch_rows)
+        rows_have_nan = rows_have_nan or has_nan
+        if len(rows) >= remaining:
+            break
+    return rows, rows_have_nan, scanned_rows
+
+
+def _scan_query_pandas(
+    parts: list[Path],
+    *,
+    query_columns: list[str] | None,
+    query_filters: Mapping[str, Any],
+    limit: int,
+    chunksize: int,
+    emit: Callable[[list[dict[str, Any]], bool], None],
+) -> tuple[int, int, int]:
+    """Scan parquet record batches, evaluating filters on each batch in pandas."""
+    returned_rows = 0
+    scanned_rows = 0
+    scanned_parts = 0
+    for part in parts:
+        scanned_parts += 1
+        part_rows, has_nan, part_scanned = _scan_part_pandas(
+            part,
+            query_columns=query_columns,
+            query_filters=query_filters,
+            remaining=int(limit) - returned_rows,
+            chunksize=chunksize,
+        )
+        scanned_rows += part_scanned
+        if part_rows:
+            emit(part_rows, has_nan)
+            returned_rows += len(part_rows)
+            if returned_rows >= limit:
+                break
+    return returned_rows, scanned_rows, scanned_parts
+
+
+def _scan_part_pandas(
+    part: Path,
+    *,
+    query_columns: list[str] | None,
+    query_filters: Mapping[str, Any],
+    remaining: int,
+    chunksize: int,
+) -> tuple[list[dict[str, Any]], bool, int]:
+    """Filter one parquet part in pandas; return (rows, has_nan, scanned_rows)."""
+    import pyarrow.parquet as pq
+
+    from .io import prepare_dataframe
+
+    rows: list[dict[str, Any]] = []
+    rows_have_nan = False
+    scanned_rows = 0
+    read_columns = _query_read_columns(query_columns, query_filters)
+    parquet = pq.ParquetFile(part)
+    for batch in parquet.iter_batches(batch_size=chunksize, columns=read_columns):
+        scanned_rows += batch.num_rows
+        frame = prepare_dataframe(batch.to_pandas())
+        filtered = _apply_query_filters(frame, query_filters)
+        if filtered.empty:
+            continue
+
+        # `to_pandas` yields a RangeIndex, so the surviving labels are the
+        # batch row positions; only the rows that fit under the limit are
+        # converted to Python objects.
+        selected = batch.take(filtered.index[: remaining - len(rows)].to_numpy())
+        if query_columns is not None:
+            selected = selected.select(query_columns)
+        batch_rows, has_nan = _batch_records(selected)
+        rows.extend(batch_rows)
+        rows_have_nan = rows_have_nan or has_nan
+        if len(rows) >= remaining:
+            break
+    return rows, rows_have_nan, scanned_rows
 
 
 def _run_query(
@@ -417,6 +884,8 @@ def _run_query(
     refresh: bool,
     chunksize: int,
     timeout_seconds: float,
+    ndjson: bool = False,
+    pretty: bool = True,
 ) -> int:
     if limit < 1:
         raise ValueError("limit must be >= 1.")
@@ -445,11 +914,13 @@ def _run_query(
             timeout_seconds=timeout_seconds,
         )
         parts = list(materialized.parts)
-        manifest_path_text = str(materialized.manifest_path)
-        manifest_raw = manager.cache.read_json(materialized.manifest_path)
+        manifest_path_text = materialized.manifest_path_str
+        manifest_raw = materialized.manifest
+        if manifest_raw is None:
+            manifest_raw = manager.cache.read_json(materialized.manifest_path)
         if isinstance(manifest_raw, dict):
             manifest = dict(manifest_raw)
-        dataset_meta = manager.catalog.get(dataset_key).metadata_snapshot()
+        dataset_meta = _result_dataset(manager, materialized).metadata_snapshot()
     else:
         dataset = manager.catalog.get(dataset_key)
         dataset_meta = dataset.metadata_snapshot()
@@ -473,35 +944,6 @@ def _run_query(
                 "Re-materialize with force_materialize=true."
             )
 
-    rows: list[dict[str, Any]] = []
-    scanned_rows = 0
-    scanned_parts = 0
-    read_columns = _query_read_columns(query_columns, query_filters)
-    for part in parts:
-        scanned_parts += 1
-        for frame in iter_parquet_file_chunks(
-            part,
-            chunksize=chunksize,
-            columns=read_columns,
-        ):
-            scanned_rows += len(frame)
-            filtered = _apply_query_filters(frame, query_filters)
-            if filtered.empty:
-                continue
-
-            if query_columns is not None:
-                filtered = filtered.loc[:, query_columns]
-
-            if len(rows) >= limit:
-                break
-            remaining = int(limit) - len(rows)
-            batch = filtered.head(remaining)
-            rows.extend(batch.to_dict(orient="records"))
-            if len(rows) >= limit:
-                break
-        if len(rows) >= limit:
-            break
-
     row_count_estimate = manifest.get("row_count")
     row_count: int | None = None
     if isinstance(row_count_estimate, int | float | str):
@@ -510,12 +952,63 @@ def _run_query(
         except (TypeError, ValueError):
             row_count = None
 
+    import pyarrow as pa
+
+    header = {
+        "dataset_id": dataset_key,
+        "columns": query_columns,
+        "filters": query_filters,
+        "limit": int(limit),
+        "row_count_estimate": row_count,
+        "dataset": dataset_meta,
+        "cache_root": str(manager.cache.root),
+        "manifest_path": manifest_path_text,
+    }
+    rows: list[dict[str, Any]] = []
+    streamed_rows = 0
+    rows_have_nan = False
+
+    def emit(batch_rows: list[dict[str, Any]], has_nan: bool) -> None:
+        nonlocal streamed_rows, rows_have_nan
+        if not ndjson:
+            rows.extend(batch_rows)
+            rows_have_nan = rows_have_nan or has_nan
+            return
+        _write_stdout_bytes(
+            b"".join(_dumps_json_line(row, stdlib_encoder=has_nan) for row in batch_rows)
+        )
+        streamed_rows += len(batch_rows)
+
+    if ndjson:
+        _write_stdout_bytes(_dumps_json_line(header))
+
+    scan_kwargs: dict[str, Any] = {
+        "query_columns": query_columns,
+        "query_filters": query_filters,
+        "limit": limit,
+        "chunksize": chunksize,
+        "emit": emit,
+    }
+    try:
+        returned_rows, scanned_rows, scanned_parts = _scan_query_arrow(parts, **scan_kwargs)
+    except (pa.ArrowException, TypeError):
+        # Parts fall back to pandas one at a time, so this only catches Arrow
+        # failing before the first part (for example opening the dataset).
+        if streamed_rows:
+            raise
+        rows.clear()
+        rows_have_nan = False
+        returned_rows, scanned_rows, scanned_parts = _scan_query_pandas(parts, **scan_kwargs)
+
+    if ndjson:
+        return 0
+
     payload = {
         "dataset_id": dataset_key,
         "columns": query_columns,
         "filters": query_filters,
         "limit": int(limit),
-        "returned_rows": len(rows),
+        "returned_rows": returned_rows,
         "scanned_rows": scanned_rows,
         "scanned_parts": scanned_parts,
         "row_count_estimate": row_count,
@@ -524,10 +1017,61 @@ def _run_query(
         "cache_root": str(manager.cache.root),
         "manifest_path": manifest_path_text,
     }
-    print(json.dumps(payload, indent=2))
+    _print_json(payload, pretty=pretty, stdlib_encoder=rows_have_nan)
     return 0
 
 
+def _write_stdout_bytes(data: bytes) -> None:
+    """Write encoded output straight to the binary stdout buffer when there is one."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    # Keep ordering with any text still sitting in the wrapper's buffer.
+    sys.stdout.flush()
+    buffer.write(data)
+
+
+def _json_default(value: Any) -> Any:
+    # Only what orjson encodes natively, so the stdlib fallback writes the same
+    # JSON and both encoders reject everything else.
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _print_json(payload: Any, *, pretty: bool, stdlib_encoder: bool = False) -> None:
+    from .cache import dumps_json
+
+    _write_stdout_bytes(
+        dumps_json(
+            payload,
+            sort_keys=False,
+            indent=pretty,
+            default=_json_default,
+            stdlib_encoder=stdlib_encoder,
+        )
+        + b"\n"
+    )
+
+
+def _dumps_json_line(payload: Any, *, stdlib_encoder: bool = False) -> bytes:
+    from .cache import dumps_json
+
+    return (
+        dumps_json(
+            payload,
+            sort_keys=False,
+            indent=False,
+            default=_json_default,
+            stdlib_encoder=stdlib_encoder,
+        )
+        + b"\n"
+    )
+
+
 def _run_validate_sources(
     manager: DatasetManager,
     *,
@@ -536,11 +1080,14 @@ def _run_validate_sources(
     timeout_seconds: float,
     as_json: bool,
     fail_on_error: bool,
+    workers: int | None = None,
+    pretty: bool = True,
 ) -> int:
     results = manager.validate_sources(
         dataset_ids=dataset_ids or None,
         tag=tag,
         timeout_seconds=timeout_seconds,
+        max_workers=workers,
     )
 
     failures = [result for result in results if not result.ok]
@@ -551,26 +1098,16 @@ def _run_validate_sources(
                 "ok": len(results) - len(failures),
                 "failed": len(failures),
             },
-            "results": [
-                {
-                    "dataset_id": result.dataset_id,
-                    "source_type": result.source_type,
-                    "source": result.source,
-                    "ok": result.ok,
-                    "status_code": result.status_code,
-                    "latency_ms": round(result.latency_ms, 3),
-                    "error": result.error,
-                    "details": result.details,
-                }
-                for result in results
-            ],
+            # Result records are slots dataclasses: orjson encodes them natively
+            # and _json_default covers the stdlib fallback.
+            "results": results,
         }
-        print(json.dumps(payload, indent=2))
+        _print_json(payload, pretty=pretty)
     else:
-        print(
+        lines = [
             f"Source validation: checked={len(results)} ok={len(results) - len(failures)} "
             f"failed={len(failures)}"
-        )
+        ]
         for result in results:
             status = "OK " if result.ok else "ERR"
             code = str(result.status_code) if result.status_code is not None else "-"
@@ -580,71 +1117,119 @@ def _run_validate_sources(
             )
             if result.error:
                 line = f"{line} :: {result.error}"
-            print(line)
+            lines.append(line)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     if fail_on_error and failures:
         return 1
     return 0
 
 
-def main() -> int:
-    """CLI entrypoint."""
-    parser = build_parser()
-    args = parser.parse_args()
-    manager = _build_manager(args.cache_root)
+def _list_from_args(manager: DatasetManager, args: argparse.Namespace, pretty: bool) -> int:
+    return _run_list(
+        manager,
+        tag=args.tag,
+        as_json=args.json,
+        ndjson=args.ndjson,
+        pretty=pretty,
+    )
 
-    if args.command == "list":
-        return _run_list(manager, tag=args.tag, as_json=args.json)
-    if args.command == "fetch":
-        return _run_fetch(
-            manager,
-            dataset_id=args.dataset_id,
-            force=args.force,
-            refresh=args.refresh,
-            timeout_seconds=args.timeout_seconds,
-        )
-    if args.command == "materialize":
-        return _run_materialize(
-            manager,
-            dataset_id=args.dataset_id,
-            force=args.force,
-            refresh=args.refresh,
-            chunksize=args.chunksize,
-            timeout_seconds=args.timeout_seconds,
-        )
-    if args.command == "materialize-all":
-        return _run_materialize_all(
-            manager,
-            tag=args.tag,
-            force=args.force,
-            refresh=args.refresh,
-            chunksize=args.chunksize,
-        )
-    if args.command == "query":
-        return _run_query(
-            manager,
-            dataset_id=args.dataset_id,
-            columns=args.columns,
-            filters=args.filters,
-            limit=args.limit,
-            materialize_if_missing=args.materialize_if_missing,
-            force_materialize=args.force_materialize,
-            refresh=args.refresh,
-            chunksize=args.chunksize,
-            timeout_seconds=args.timeout_seconds,
-        )
-    if args.command == "validate-sources":
-        return _run_validate_sources(
-            manager,
-            dataset_ids=args.dataset_ids,
-            tag=args.tag,
-            timeout_seconds=args.timeout_seconds,
-            as_json=args.json,
-            fail_on_error=args.fail_on_error,
-        )
 
-    parser.error(f"Unknown command: {args.command}")
-    return 2
+def _fetch_from_args(manager: DatasetManager, args: argparse.Namespace, pretty: bool) -> int:
+    return _run_fetch(
+        manager,
+        dataset_id=args.dataset_id,
+        force=args.force,
+        refresh=args.refresh,
+        timeout_seconds=args.timeout_seconds,
+        pretty=pretty,
+    )
+
+
+def _materialize_from_args(
+    manager: DatasetManager, args: argparse.Namespace, pretty: bool
+) -> int:
+    return _run_materialize(
+        manager,
+        dataset_id=args.dataset_id,
+        force=args.force,
+        refresh=args.refresh,
+        chunksize=args.chunksize,
+        timeout_seconds=args.timeout_seconds,
+        pretty=pretty,
+    )
+
+
+def _materialize_all_from_args(
+    manager: DatasetManager, args: argparse.Namespace, pretty: bool
+) -> int:
+    return _run_materialize_all(
+        manager,
+        tag=args.tag,
+        force=args.force,
+        refresh=args.refresh,
+        chunksize=args.chunksize,
+        workers=args.workers,
+        processes=args.processes,
+        ndjson=args.ndjson,
+        pretty=pretty,
+    )
+
+
+def _query_from_args(manager: DatasetManager, args: argparse.Namespace, pretty: bool) -> int:
+    return _run_query(
+        manager,
+        dataset_id=args.dataset_id,
+        columns=args.columns,
+        filters=args.filters,
+        limit=args.limit,
+        materialize_if_missing=args.materialize_if_missing,
+        force_materialize=args.force_materialize,
+        refresh=args.refresh,
+        chunksize=args.chunksize,
+        timeout_seconds=args.timeout_seconds,
+        ndjson=args.ndjson,
+        pretty=pretty,
+    )
+
+
+def _validate_sources_from_args(
+    manager: DatasetManager, args: argparse.Namespace, pretty: bool
+) -> int:
+    return _run_validate_sources(
+        manager,
+        dataset_ids=args.dataset_ids,
+        tag=args.tag,
+        timeout_seconds=args.timeout_seconds,
+        as_json=args.json,
+        fail_on_error=args.fail_on_error,
+        workers=args.workers,
+        pretty=pretty,
+    )
+
+
+_COMMANDS: dict[str, Callable[[DatasetManager, argparse.Namespace, bool], int]] = {
+    "list": _list_from_args,
+    "fetch": _fetch_from_args,
+    "materialize": _materialize_from_args,
+    "materialize-all": _materialize_all_from_args,
+    "query": _query_from_args,
+    "validate-sources": _validate_sources_from_args,
+}
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entrypoint."""
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
+    command = _COMMANDS.get(args.command)
+    if command is None:
+        parser.error(f"Unknown command: {args.command}")
+    manager = _build_manager(args.cache_root)
+    pretty = args.pretty if args.pretty is not None else sys.stdout.isatty()
+    return command(manager, args, pretty)
 
 
 if __name__ == "__main__":
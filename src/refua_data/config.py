@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
@@ -15,7 +16,20 @@ def default_cache_root() -> Path:
     1. `REFUA_DATA_HOME`
     2. `~/.cache/refua-data`
     """
-    env = os.environ.get(DEFAULT_CACHE_ENV)
-    if env:
-        return Path(env).expanduser().resolve()
+    return _resolve_default_cache_root(
+        os.environ.get(DEFAULT_CACHE_ENV),
+        os.environ.get("HOME"),
+        os.environ.get("USERPROFILE"),
+        os.getcwd(),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_default_cache_root(
+    env_root: str | None, home: str | None, user_profile: str | None, cwd: str
+) -> Path:
+    # `home`/`user_profile`/`cwd` only key the cache so a changed home, or the
+    # directory a relative $REFUA_DATA_HOME resolves against, is re-resolved.
+    if env_root:
+        return Path(env_root).expanduser().resolve()
     return Path.home().joinpath(".cache", "refua-data").resolve()
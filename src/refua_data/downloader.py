@@ -2,25 +2,36 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
-import json
 import os
 import shutil
-from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
-from urllib.parse import unquote, urljoin, urlparse
+from typing import Any, BinaryIO
+from urllib.parse import parse_qsl, unquote, urlencode, urljoin, urlparse
 
 import requests
+from urllib3.util.retry import Retry
 
-from .cache import CacheBackend, sha256_file
+from .cache import CacheBackend, dumps_json, loads_json, sha256_file
 from .models import ApiDatasetConfig, DatasetDefinition, FetchResult
 
 _DEFAULT_TIMEOUT = 120.0
 _DEFAULT_USER_AGENT = "refua-data/0.7.2"
 _CHUNK_SIZE = 4 * 1024 * 1024
 _MAX_DOWNLOAD_WORKERS = 8
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_API_PREFETCH_PAGES = 4
+_RESUME_ATTEMPTS = 3
+_MIRROR_PROBE_TIMEOUT = 5.0
+_CHEMBL_NEXT_PATH = ("page_meta", "next")
+_CHEMBL_TOTAL_PATH = ("page_meta", "total_count")
+_RESUME_BACKOFF_SECONDS = 0.5
 
 
 def _utcnow_iso() -> str:
@@ -32,6 +43,13 @@ def _build_session() -> requests.Session:
     adapter = requests.adapters.HTTPAdapter(
         pool_connections=_MAX_DOWNLOAD_WORKERS,
         pool_maxsize=_MAX_DOWNLOAD_WORKERS,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        ),
     )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
@@ -42,6 +60,60 @@ def _download_worker_count(url_count: int) -> int:
     return max(1, min(_MAX_DOWNLOAD_WORKERS, url_count))
 
 
+def _download_parts(
+    dataset: DatasetDefinition,
+    urls: Sequence[str],
+    dest_paths: Sequence[Path],
+    *,
+    timeout_seconds: float,
+) -> list[dict[str, Any]]:
+    """Download `urls` concurrently into `dest_paths`, returning details in URL order.
+
+    Each worker thread keeps one pooled session, so parts served from the same
+    host reuse keep-alive connections instead of opening one per URL.
+    """
+    local = threading.local()
+    sessions: list[requests.Session] = []
+    sessions_lock = threading.Lock()
+
+    def download_one(url: str, dest_path: Path) -> dict[str, Any] | Exception:
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = _build_session()
+            with sessions_lock:
+                sessions.append(session)
+        try:
+            return _download_url_to_path(
+                url=url,
+                dest_path=dest_path,
+                timeout_seconds=timeout_seconds,
+                session=session,
+            )
+        except Exception as exc:
+            return exc
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=_download_worker_count(len(urls))
+        ) as executor:
+            outcomes = list(executor.map(download_one, urls, dest_paths))
+    finally:
+        for session in sessions:
+            session.close()
+
+    errors = [
+        f"{url}: {outcome}"
+        for url, outcome in zip(urls, outcomes, strict=True)
+        if isinstance(outcome, Exception)
+    ]
+    if errors:
+        details = "\n".join(errors)
+        raise RuntimeError(
+            f"Failed to download dataset '{dataset.dataset_id}'.\n{details}"
+        )
+    return [outcome for outcome in outcomes if not isinstance(outcome, Exception)]
+
+
 def _write_bytes_to_path(
     *,
     dest_path: Path,
@@ -64,17 +136,196 @@ def _write_bytes_to_path(
     return bytes_written, digest.hexdigest()
 
 
+def _write_response_to_path(
+    session: requests.Session,
+    response: requests.Response,
+    *,
+    url: str,
+    dest_path: Path,
+    headers: dict[str, str],
+    timeout_seconds: float,
+) -> tuple[int, str]:
+    """Stream `response` to `dest_path`, resuming with `Range` if the body breaks off.
+
+    Resumption needs `Accept-Ranges: bytes` and an identity-encoded body, and
+    sends `If-Range` so a changed upstream restarts from zero instead of
+    splicing two versions together.
+    """
+    resumable = (
+        response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        and response.headers.get("Content-Encoding", "identity").lower() == "identity"
+    )
+    validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+    digest = hashlib.sha256()
+    bytes_written = 0
+    attempts = 0
+    current = response
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with dest_path.open("wb") as handle:
+            while True:
+                try:
+                    for chunk in current.iter_content(chunk_size=_CHUNK_SIZE):
+                        if not chunk:
+                            continue
+                        handle.write(chunk)
+                        digest.update(chunk)
+                        bytes_written += len(chunk)
+                    break
+                except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                    attempts += 1
+                    if not resumable or attempts > _RESUME_ATTEMPTS:
+                        raise
+                time.sleep(_RESUME_BACKOFF_SECONDS * 2 ** (attempts - 1))
+                range_headers = {**headers, "Range": f"bytes={bytes_written}-"}
+                if validator:
+                    range_headers["If-Range"] = validator
+                if current is not response:
+                    current.close()
+                current = session.get(
+                    url, stream=True, timeout=timeout_seconds, headers=range_headers
+                )
+                if current.status_code != requests.codes.partial_content:
+                    # Full body (range ignored or entity changed): start over.
+                    current.raise_for_status()
+                    handle.seek(0)
+                    handle.truncate()
+                    digest = hashlib.sha256()
+                    bytes_written = 0
+    except Exception:
+        dest_path.unlink(missing_ok=True)
+        raise
+    finally:
+        if current is not response:
+            current.close()
+    return bytes_written, digest.hexdigest()
+
+
+def _copy_range(
+    source_fd: int, dest_fd: int, source_offset: int, dest_offset: int, count: int
+) -> int:
+    return os.copy_file_range(source_fd, dest_fd, count, source_offset, dest_offset)
+
+
+def _send_range(
+    source_fd: int, dest_fd: int, source_offset: int, dest_offset: int, count: int
+) -> int:
+    os.lseek(dest_fd, dest_offset, os.SEEK_SET)
+    return os.sendfile(dest_fd, source_fd, source_offset, count)
+
+
+def _kernel_copy(
+    source_fd: int,
+    dest_fd: int,
+    size: int,
+    *,
+    source_offset: int = 0,
+    dest_offset: int = 0,
+) -> bool:
+    """Copy `size` bytes between descriptors in-kernel; return False if unsupported.
+
+    `copy_file_range` can reflink on copy-on-write filesystems; `sendfile`
+    still avoids bouncing the bytes through userspace buffers. On failure the
+    destination is truncated back to `dest_offset`.
+    """
+    copiers: list[Callable[[int, int, int, int, int], int]] = []
+    if hasattr(os, "copy_file_range"):
+        copiers.append(_copy_range)
+    if hasattr(os, "sendfile"):
+        copiers.append(_send_range)
+    for copy in copiers:
+        copied = 0
+        try:
+            while copied < size:
+                sent = copy(
+                    source_fd,
+                    dest_fd,
+                    source_offset + copied,
+                    dest_offset + copied,
+                    size - copied,
+                )
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError:
+            pass
+        if copied == size:
+            return True
+        os.ftruncate(dest_fd, dest_offset)
+        os.lseek(dest_fd, dest_offset, os.SEEK_SET)
+    return False
+
+
+def _starts_with_header(handle: BinaryIO, header: bytes) -> bool:
+    """Return whether the first line of `handle` equals `header`."""
+    if header.endswith(b"\n") and hasattr(os, "pread"):
+        # A newline-terminated header compares with one positional read.
+        return os.pread(handle.fileno(), len(header), 0) == header
+    handle.seek(0)
+    return handle.readline() == header
+
+
+def _append_part(source: BinaryIO, dest: BinaryIO, offset: int) -> None:
+    """Append `source` from byte `offset` onwards to `dest`, in-kernel when possible."""
+    size = os.fstat(source.fileno()).st_size - offset
+    dest.flush()
+    position = dest.tell()
+    if _kernel_copy(
+        source.fileno(), dest.fileno(), size, source_offset=offset, dest_offset=position
+    ):
+        dest.seek(position + size)
+        return
+    dest.seek(position)
+    source.seek(offset)
+    shutil.copyfileobj(source, dest, _CHUNK_SIZE)
+
+
 def _copy_file_to_path(source_path: Path, dest_path: Path) -> tuple[int, str]:
     source_path = source_path.expanduser().resolve()
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
     with source_path.open("rb") as handle:
-        bytes_written, checksum = _write_bytes_to_path(
-            dest_path=dest_path,
-            chunks=iter(lambda: handle.read(_CHUNK_SIZE), b""),
-        )
+        size = os.fstat(handle.fileno()).st_size
+        try:
+            with dest_path.open("wb") as dest:
+                copied = _kernel_copy(handle.fileno(), dest.fileno(), size)
+        except Exception:
+            dest_path.unlink(missing_ok=True)
+            raise
+        if copied:
+            # Hash the copy itself so a source changing mid-copy cannot skew it.
+            bytes_written, checksum = size, sha256_file(dest_path)
+        else:
+            handle.seek(0)
+            bytes_written, checksum = _write_bytes_to_path(
+                dest_path=dest_path,
+                chunks=iter(lambda: handle.read(_CHUNK_SIZE), b""),
+            )
     shutil.copystat(source_path, dest_path)
     return bytes_written, checksum
 
 
+def _link_file_to_path(source_path: Path, dest_path: Path) -> str | None:
+    """Hard-link `source_path` to `dest_path` and hash it; None if linking fails."""
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    dest_path.unlink(missing_ok=True)
+    try:
+        os.link(source_path, dest_path)
+    except OSError:
+        # Cross-device, unsupported filesystem or permissions: caller copies.
+        return None
+    return sha256_file(dest_path)
+
+
+def _linked_raw_changed(raw_path: Path, meta: Mapping[str, Any]) -> bool:
+    """Whether a raw file hard-linked to its source was edited since it was hashed."""
+    if meta.get("ingest_mode") != "link":
+        return False
+    # The link shares the source inode, so its stat is the source's stat.
+    stat = raw_path.stat()
+    recorded = (meta.get("source_mtime_ns"), meta.get("source_size"))
+    return (stat.st_mtime_ns, stat.st_size) != recorded
+
+
 def _conditional_headers(meta: dict[str, Any]) -> dict[str, str]:
     headers: dict[str, str] = {}
     etag = meta.get("etag") or meta.get("first_page_etag")
@@ -87,9 +338,13 @@ def _conditional_headers(meta: dict[str, Any]) -> dict[str, str]:
 
 
 def _with_dataset_metadata(
-    meta: dict[str, Any], dataset: DatasetDefinition
+    meta: Mapping[str, Any],
+    dataset: DatasetDefinition,
+    overrides: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
     merged = dict(meta)
+    if overrides:
+        merged.update(overrides)
     merged["dataset"] = dataset.metadata_snapshot()
     return merged
 
@@ -99,9 +354,17 @@ def _write_raw_metadata(
     meta_path: Path,
     *,
     dataset: DatasetDefinition,
-    meta: dict[str, Any],
+    meta: Mapping[str, Any],
+    overrides: Mapping[str, Any] | None = None,
 ) -> None:
-    cache.write_json(meta_path, _with_dataset_metadata(meta, dataset))
+    cache.write_json(meta_path, _with_dataset_metadata(meta, dataset, overrides))
+
+
+def _cached_sha256(raw_path: Path, meta: Mapping[str, Any]) -> str:
+    checksum = meta.get("sha256")
+    if isinstance(checksum, str) and checksum:
+        return checksum
+    return sha256_file(raw_path)
 
 
 def _ensure_sha256(
@@ -112,20 +375,15 @@ def _ensure_sha256(
     *,
     dataset: DatasetDefinition,
 ) -> str:
-    snapshot = dataset.metadata_snapshot()
-    checksum = meta.get("sha256")
-    if isinstance(checksum, str) and checksum:
-        if meta.get("dataset") != snapshot:
-            updated_meta = dict(meta)
-            updated_meta["dataset"] = snapshot
-            updated_meta["observed_at"] = _utcnow_iso()
-            _write_raw_metadata(cache, meta_path, dataset=dataset, meta=updated_meta)
-        return checksum
-    checksum = sha256_file(raw_path)
-    updated_meta = dict(meta)
-    updated_meta["sha256"] = checksum
-    updated_meta["observed_at"] = _utcnow_iso()
-    _write_raw_metadata(cache, meta_path, dataset=dataset, meta=updated_meta)
+    checksum = _cached_sha256(raw_path, meta)
+    if checksum != meta.get("sha256") or meta.get("dataset") != dataset.metadata_snapshot():
+        _write_raw_metadata(
+            cache,
+            meta_path,
+            dataset=dataset,
+            meta=meta,
+            overrides={"sha256": checksum, "observed_at": _utcnow_iso()},
+        )
     return checksum
 
 
@@ -138,7 +396,7 @@ def _default_source_url(
     if dataset.api is not None:
         return dataset.api.endpoint
     if dataset.urls:
-        return dataset.urls[0]
+        return dataset.urls[0] + dataset.url_suffix
     return ""
 
 
@@ -149,15 +407,26 @@ def fetch_dataset(
     force: bool = False,
     refresh: bool = False,
     timeout_seconds: float = _DEFAULT_TIMEOUT,
+    session: requests.Session | None = None,
 ) -> FetchResult:
-    """Fetch a dataset using local cache and optional conditional refresh."""
+    """Fetch a dataset using local cache and optional conditional refresh.
+
+    Pass `session` to reuse pooled connections across several fetches; the
+    caller keeps ownership of it. Otherwise a session is built for this call.
+    """
     cache.ensure()
 
     raw_path = cache.raw_file(dataset)
     meta_path = cache.raw_meta(dataset)
     existing_meta = cache.read_json(meta_path) or {}
 
-    if dataset.api is None and raw_path.exists() and not force and not refresh:
+    if (
+        dataset.api is None
+        and raw_path.exists()
+        and not force
+        and not refresh
+        and not _linked_raw_changed(raw_path, existing_meta)
+    ):
         checksum = _ensure_sha256(
             raw_path,
             existing_meta,
@@ -175,10 +444,14 @@ def fetch_dataset(
             refreshed=False,
             bytes_downloaded=0,
             sha256=checksum,
+            dataset=dataset,
         )
 
+    session_context = (
+        _build_session() if session is None else contextlib.nullcontext(session)
+    )
     try:
-        with _build_session() as session:
+        with session_context as active_session:
             if dataset.api is not None:
                 return _fetch_api_dataset(
                     dataset=dataset,
@@ -189,7 +462,7 @@ def fetch_dataset(
                     force=force,
                     refresh=refresh,
                     timeout_seconds=timeout_seconds,
-                    session=session,
+                    session=active_session,
                 )
 
             if not dataset.urls:
@@ -218,7 +491,7 @@ def fetch_dataset(
                 )
 
             errors: list[str] = []
-            for url in dataset.urls:
+            for url in _order_mirrors(dataset.resolved_urls(), timeout_seconds):
                 try:
                     return _fetch_from_url(
                         dataset=dataset,
@@ -230,7 +503,7 @@ def fetch_dataset(
                         force=force,
                         refresh=refresh,
                         timeout_seconds=timeout_seconds,
-                        session=session,
+                        session=active_session,
                     )
                 except Exception as exc:
                     errors.append(f"{url}: {exc}")
@@ -258,12 +531,60 @@ def fetch_dataset(
                 refreshed=refresh,
                 bytes_downloaded=0,
                 sha256=checksum,
+                dataset=dataset,
             )
         raise RuntimeError(
             f"Failed to fetch dataset '{dataset.dataset_id}': {exc}"
         ) from exc
 
 
+def _probe_mirror(url: str, timeout_seconds: float) -> bool:
+    try:
+        response = requests.head(
+            url,
+            timeout=timeout_seconds,
+            allow_redirects=True,
+            headers={"User-Agent": _DEFAULT_USER_AGENT},
+        )
+    except requests.RequestException:
+        return False
+    response.close()
+    return response.status_code < 400
+
+
+def _order_mirrors(urls: tuple[str, ...], timeout_seconds: float) -> tuple[str, ...]:
+    """Move the first mirror to answer a parallel HEAD probe to the front.
+
+    Dead mirrors then cost one probe timeout in total instead of one full
+    download timeout each. The remaining mirrors keep their declared order
+    as fallbacks, and non-HTTP sources are never reordered.
+    """
+    if len(urls) < 2 or any(
+        urlparse(url).scheme.lower() not in {"http", "https"} for url in urls
+    ):
+        return urls
+
+    executor = ThreadPoolExecutor(max_workers=_download_worker_count(len(urls)))
+    futures = {
+        executor.submit(
+            _probe_mirror, url, min(_MIRROR_PROBE_TIMEOUT, timeout_seconds)
+        ): url
+        for url in urls
+    }
+    winner: str | None = None
+    try:
+        for future in as_completed(futures):
+            if future.result():
+                winner = futures[future]
+                break
+    finally:
+        # Do not wait on mirrors that are still timing out.
+        executor.shutdown(wait=False, cancel_futures=True)
+    if winner is None:
+        return urls
+    return (winner, *(url for url in urls if url != winner))
+
+
 def _fetch_from_url(
     *,
     dataset: DatasetDefinition,
@@ -350,9 +671,13 @@ def _download_url_to_path(
                 headers=headers,
             ) as response:
                 response.raise_for_status()
-                bytes_downloaded, checksum = _write_bytes_to_path(
+                bytes_downloaded, checksum = _write_response_to_path(
+                    active_session,
+                    response,
+                    url=url,
                     dest_path=dest_path,
-                    chunks=response.iter_content(chunk_size=_CHUNK_SIZE),
+                    headers=headers,
+                    timeout_seconds=timeout_seconds,
                 )
                 return {
                     "source_url": url,
@@ -361,6 +686,7 @@ def _download_url_to_path(
                     "etag": response.headers.get("ETag"),
                     "last_modified": response.headers.get("Last-Modified"),
                     "content_length": response.headers.get("Content-Length"),
+                    "accept_ranges": response.headers.get("Accept-Ranges"),
                     "bytes_downloaded": bytes_downloaded,
                     "sha256": checksum,
                 }
@@ -390,76 +716,43 @@ def _fetch_concat_urls(
     refresh: bool,
     timeout_seconds: float,
 ) -> FetchResult:
+    urls = dataset.resolved_urls()
     raw_path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = raw_path.with_suffix(raw_path.suffix + ".tmp")
     part_paths: list[Path] = []
 
-    first_header: bytes | None = None
+    first_header = b""
     dedupe_header = dataset.file_format in {"csv", "tsv"}
-    source_details: list[dict[str, Any]] = [{} for _ in dataset.urls]
 
     try:
-        futures: dict[Future[dict[str, Any]], tuple[int, str, Path]] = {}
-        with ThreadPoolExecutor(
-            max_workers=_download_worker_count(len(dataset.urls))
-        ) as executor:
-            for index, url in enumerate(dataset.urls):
-                part_path = raw_path.with_suffix(
-                    f"{raw_path.suffix}.part-{index:04d}.tmp"
-                )
-                part_paths.append(part_path)
-                future = executor.submit(
-                    _download_url_to_path,
-                    url=url,
-                    dest_path=part_path,
-                    timeout_seconds=timeout_seconds,
-                    session=None,
-                )
-                futures[future] = (index, url, part_path)
-
-            errors: list[str] = []
-            for future, (index, url, _) in futures.items():
-                try:
-                    source_details[index] = future.result()
-                except Exception as exc:
-                    errors.append(f"{url}: {exc}")
-
-            if errors:
-                details = "\n".join(errors)
-                raise RuntimeError(
-                    f"Failed to download dataset '{dataset.dataset_id}'.\n{details}"
-                )
+        part_paths.extend(
+            raw_path.with_suffix(f"{raw_path.suffix}.part-{index:04d}.tmp")
+            for index in range(len(urls))
+        )
+        source_details = _download_parts(
+            dataset, urls, part_paths, timeout_seconds=timeout_seconds
+        )
 
         bytes_downloaded = 0
-        digest = hashlib.sha256()
         with tmp_path.open("wb") as merged:
             for index, part_path in enumerate(part_paths):
                 detail = source_details[index]
                 bytes_downloaded += int(detail.get("bytes_downloaded", 0))
 
                 with part_path.open("rb") as source_handle:
+                    body_offset = 0
                     if dedupe_header:
-                        first_line = source_handle.readline()
                         if index == 0:
-                            first_header = first_line
-                            if first_line:
-                                merged.write(first_line)
-                                digest.update(first_line)
-                        elif first_header is None or first_line != first_header:
-                            if first_line:
-                                merged.write(first_line)
-                                digest.update(first_line)
-
-                    while True:
-                        chunk = source_handle.read(_CHUNK_SIZE)
-                        if not chunk:
-                            break
-                        merged.write(chunk)
-                        digest.update(chunk)
+                            first_header = source_handle.readline()
+                        elif _starts_with_header(source_handle, first_header):
+                            body_offset = len(first_header)
+                    _append_part(source_handle, merged, body_offset)
 
                 part_path.unlink(missing_ok=True)
             part_paths.clear()
 
+        # Parts are spliced in-kernel, so hash the merged file once at the end.
+        checksum = sha256_file(tmp_path)
         os.replace(tmp_path, raw_path)
     except Exception:
         tmp_path.unlink(missing_ok=True)
@@ -467,16 +760,15 @@ def _fetch_concat_urls(
             part_path.unlink(missing_ok=True)
         raise
 
-    checksum = digest.hexdigest()
-    source_url = dataset.urls[0]
+    source_url = urls[0]
     meta = {
         "dataset_id": dataset.dataset_id,
         "version": dataset.version,
         "source_type": "multi_url",
         "source_url": source_url,
-        "source_urls": list(dataset.urls),
+        "source_urls": list(urls),
         "url_mode": dataset.url_mode,
-        "source_count": len(dataset.urls),
+        "source_count": len(urls),
         "fetched_at": _utcnow_iso(),
         "refreshed": refresh,
         "bytes_downloaded": bytes_downloaded,
@@ -495,6 +787,7 @@ def _fetch_concat_urls(
         refreshed=refresh,
         bytes_downloaded=bytes_downloaded,
         sha256=checksum,
+        dataset=dataset,
     )
 
 
@@ -507,47 +800,24 @@ def _fetch_bundle_urls(
     refresh: bool,
     timeout_seconds: float,
 ) -> FetchResult:
+    urls = dataset.resolved_urls()
     raw_path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = raw_path.with_name(f"{raw_path.name}.tmp")
     if tmp_path.exists():
         _remove_path(tmp_path)
     tmp_path.mkdir(parents=True, exist_ok=True)
 
-    bytes_downloaded = 0
-    source_details: list[dict[str, Any]] = [{} for _ in dataset.urls]
-
     try:
-        futures: dict[Future[dict[str, Any]], tuple[int, str]] = {}
-        with ThreadPoolExecutor(
-            max_workers=_download_worker_count(len(dataset.urls))
-        ) as executor:
-            for index, url in enumerate(dataset.urls):
-                candidate_name = Path(urlparse(url).path).name
-                filename = candidate_name or f"part-{index:05d}"
-                future = executor.submit(
-                    _download_url_to_path,
-                    url=url,
-                    dest_path=tmp_path / filename,
-                    timeout_seconds=timeout_seconds,
-                    session=None,
-                )
-                futures[future] = (index, url)
-
-            errors: list[str] = []
-            for future, (index, url) in futures.items():
-                try:
-                    detail = future.result()
-                except Exception as exc:
-                    errors.append(f"{url}: {exc}")
-                    continue
-                source_details[index] = detail
-                bytes_downloaded += int(detail.get("bytes_downloaded", 0))
-
-            if errors:
-                details = "\n".join(errors)
-                raise RuntimeError(
-                    f"Failed to download dataset '{dataset.dataset_id}'.\n{details}"
-                )
+        dest_paths = [
+            tmp_path / (Path(urlparse(url).path).name or f"part-{index:05d}")
+            for index, url in enumerate(urls)
+        ]
+        source_details = _download_parts(
+            dataset, urls, dest_paths, timeout_seconds=timeout_seconds
+        )
+        bytes_downloaded = sum(
+            int(detail.get("bytes_downloaded", 0)) for detail in source_details
+        )
 
         if raw_path.exists():
             _remove_path(raw_path)
@@ -557,15 +827,15 @@ def _fetch_bundle_urls(
         raise
 
     checksum = sha256_file(raw_path)
-    source_url = dataset.urls[0]
+    source_url = urls[0]
     meta = {
         "dataset_id": dataset.dataset_id,
         "version": dataset.version,
         "source_type": "multi_url",
         "source_url": source_url,
-        "source_urls": list(dataset.urls),
+        "source_urls": list(urls),
         "url_mode": dataset.url_mode,
-        "source_count": len(dataset.urls),
+        "source_count": len(urls),
         "fetched_at": _utcnow_iso(),
         "refreshed": refresh,
         "bytes_downloaded": bytes_downloaded,
@@ -584,6 +854,7 @@ def _fetch_bundle_urls(
         refreshed=refresh,
         bytes_downloaded=bytes_downloaded,
         sha256=checksum,
+        dataset=dataset,
     )
 
 
@@ -629,10 +900,16 @@ def _fetch_file_url(
                 refreshed=refresh,
                 bytes_downloaded=0,
                 sha256=checksum,
+                dataset=dataset,
             )
 
     tmp_path = raw_path.with_suffix(raw_path.suffix + ".tmp")
-    _, checksum = _copy_file_to_path(source_path, tmp_path)
+    link_checksum = _link_file_to_path(source_path, tmp_path) if dataset.allow_link else None
+    if link_checksum is not None:
+        ingest_mode, checksum = "link", link_checksum
+    else:
+        ingest_mode = "copy"
+        _, checksum = _copy_file_to_path(source_path, tmp_path)
     os.replace(tmp_path, raw_path)
 
     meta = {
@@ -645,6 +922,7 @@ def _fetch_file_url(
         "sha256": checksum,
         "source_mtime_ns": source_mtime_ns,
         "source_size": source_size,
+        "ingest_mode": ingest_mode,
     }
     _write_raw_metadata(cache, meta_path, dataset=dataset, meta=meta)
 
@@ -658,6 +936,7 @@ def _fetch_file_url(
         refreshed=refresh,
         bytes_downloaded=source_size,
         sha256=checksum,
+        dataset=dataset,
     )
 
 
@@ -675,24 +954,27 @@ def _fetch_http_url(
     session: requests.Session,
 ) -> FetchResult:
     headers = {"User-Agent": _DEFAULT_USER_AGENT}
-    if refresh and not force:
+    # Revalidating only makes sense with a local copy to fall back on; a 304
+    # for a missing file would otherwise leave an empty body in the cache.
+    if not force and raw_path.exists():
         headers.update(_conditional_headers(existing_meta))
 
     with session.get(
         url, stream=True, timeout=timeout_seconds, headers=headers
     ) as response:
         if response.status_code == requests.codes.not_modified and raw_path.exists():
-            checksum = _ensure_sha256(
-                raw_path,
-                existing_meta,
+            checksum = _cached_sha256(raw_path, existing_meta)
+            _write_raw_metadata(
                 cache,
                 meta_path,
                 dataset=dataset,
+                meta=existing_meta,
+                overrides={
+                    "sha256": checksum,
+                    "source_url": url,
+                    "refreshed_at": _utcnow_iso(),
+                },
             )
-            meta = dict(existing_meta)
-            meta["source_url"] = url
-            meta["refreshed_at"] = _utcnow_iso()
-            _write_raw_metadata(cache, meta_path, dataset=dataset, meta=meta)
             return FetchResult(
                 dataset_id=dataset.dataset_id,
                 version=dataset.version,
@@ -703,15 +985,20 @@ def _fetch_http_url(
                 refreshed=True,
                 bytes_downloaded=0,
                 sha256=checksum,
+                dataset=dataset,
             )
 
         response.raise_for_status()
         raw_path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = raw_path.with_suffix(raw_path.suffix + ".tmp")
 
-        bytes_downloaded, checksum = _write_bytes_to_path(
+        bytes_downloaded, checksum = _write_response_to_path(
+            session,
+            response,
+            url=url,
             dest_path=tmp_path,
-            chunks=response.iter_content(chunk_size=_CHUNK_SIZE),
+            headers={"User-Agent": _DEFAULT_USER_AGENT},
+            timeout_seconds=timeout_seconds,
         )
 
         os.replace(tmp_path, raw_path)
@@ -727,6 +1014,7 @@ def _fetch_http_url(
             "etag": response.headers.get("ETag"),
             "last_modified": response.headers.get("Last-Modified"),
             "content_length": response.headers.get("Content-Length"),
+            "accept_ranges": response.headers.get("Accept-Ranges"),
             "sha256": checksum,
         }
         _write_raw_metadata(cache, meta_path, dataset=dataset, meta=meta)
@@ -741,6 +1029,7 @@ def _fetch_http_url(
             refreshed=refresh,
             bytes_downloaded=bytes_downloaded,
             sha256=checksum,
+            dataset=dataset,
         )
 
 
@@ -784,6 +1073,7 @@ def _fetch_api_dataset(
                 refreshed=False,
                 bytes_downloaded=0,
                 sha256=checksum,
+                dataset=dataset,
             )
 
     raw_path.parent.mkdir(parents=True, exist_ok=True)
@@ -798,6 +1088,12 @@ def _fetch_api_dataset(
         initial_params.setdefault("limit", api.page_size or 1000)
         initial_params.setdefault("offset", 0)
 
+    # Validators from a different request signature describe another query.
+    revalidate = (
+        not force
+        and raw_path.exists()
+        and existing_meta.get("api_request_signature") == request_signature
+    )
     first_page_etag: str | None = None
     first_page_last_modified: str | None = None
     rows_written = 0
@@ -805,35 +1101,37 @@ def _fetch_api_dataset(
     bytes_downloaded = 0
     digest = hashlib.sha256()
 
-    with tmp_path.open("wb") as handle:
+    pages = _ApiPageFetcher(
+        session,
+        timeout_seconds=timeout_seconds,
+        headers=base_headers,
+        depth=_API_PREFETCH_PAGES if api.pagination == "chembl" else 0,
+    )
+    with pages, tmp_path.open("wb") as handle:
         next_params: dict[str, Any] | None = initial_params
         while True:
             headers = dict(base_headers)
-            if pages_fetched == 0 and refresh and not force:
+            if pages_fetched == 0 and revalidate:
                 headers.update(_conditional_headers(existing_meta))
 
-            with session.get(
-                page_url,
-                params=next_params,
-                timeout=timeout_seconds,
-                headers=headers,
-            ) as response:
+            with pages.get(page_url, params=next_params, headers=headers) as response:
                 if (
                     response.status_code == requests.codes.not_modified
                     and raw_path.exists()
                     and pages_fetched == 0
                 ):
-                    checksum = _ensure_sha256(
-                        raw_path,
-                        existing_meta,
+                    checksum = _cached_sha256(raw_path, existing_meta)
+                    _write_raw_metadata(
                         cache,
                         meta_path,
                         dataset=dataset,
+                        meta=existing_meta,
+                        overrides={
+                            "sha256": checksum,
+                            "source_url": api.endpoint,
+                            "refreshed_at": _utcnow_iso(),
+                        },
                     )
-                    meta = dict(existing_meta)
-                    meta["source_url"] = api.endpoint
-                    meta["refreshed_at"] = _utcnow_iso()
-                    _write_raw_metadata(cache, meta_path, dataset=dataset, meta=meta)
                     return FetchResult(
                         dataset_id=dataset.dataset_id,
                         version=dataset.version,
@@ -844,6 +1142,7 @@ def _fetch_api_dataset(
                         refreshed=True,
                         bytes_downloaded=0,
                         sha256=checksum,
+                        dataset=dataset,
                     )
 
                 response.raise_for_status()
@@ -853,16 +1152,17 @@ def _fetch_api_dataset(
                     first_page_etag = response.headers.get("ETag")
                     first_page_last_modified = response.headers.get("Last-Modified")
 
-                payload = response.json()
+                # The body is already buffered; orjson parses it directly when available.
+                payload = loads_json(response.content)
                 items = _extract_api_items(payload, api)
 
-                for item in items:
-                    if api.max_rows is not None and rows_written >= api.max_rows:
-                        break
-                    line = json.dumps(item, sort_keys=True).encode("utf-8") + b"\n"
-                    handle.write(line)
-                    digest.update(line)
-                    rows_written += 1
+                if api.max_rows is not None:
+                    items = items[: max(0, api.max_rows - rows_written)]
+                # One write and one digest update per page instead of per row.
+                page_bytes = b"".join([dumps_json(item, indent=False) + b"\n" for item in items])
+                handle.write(page_bytes)
+                digest.update(page_bytes)
+                rows_written += len(items)
 
                 pages_fetched += 1
 
@@ -881,6 +1181,15 @@ def _fetch_api_dataset(
             if not next_url:
                 break
 
+            if api.pagination == "chembl":
+                pages_left = None
+                if api.max_pages is not None:
+                    pages_left = api.max_pages - pages_fetched
+                pages.prefetch_from(
+                    next_url,
+                    pages_left=pages_left,
+                    total_count=_nested_get(payload, _CHEMBL_TOTAL_PATH),
+                )
             page_url = next_url
             next_params = None
 
@@ -914,23 +1223,130 @@ def _fetch_api_dataset(
         refreshed=refresh,
         bytes_downloaded=bytes_downloaded,
         sha256=checksum,
+        dataset=dataset,
     )
 
 
+def _page_key(url: str) -> tuple[str, str, str, tuple[tuple[str, str], ...]]:
+    parsed = urlparse(url)
+    return (parsed.scheme, parsed.netloc, parsed.path, tuple(sorted(parse_qsl(parsed.query))))
+
+
+def _offset_page_urls(url: str, count: int, total_count: int) -> list[str]:
+    """Return up to `count` offset/limit page URLs from `url` that start before `total_count`."""
+    parsed = urlparse(url)
+    query = parse_qsl(parsed.query)
+    params = dict(query)
+    try:
+        offset = int(params["offset"])
+        limit = int(params["limit"])
+    except (KeyError, ValueError):
+        return []
+    if limit < 1:
+        return []
+    urls: list[str] = []
+    for page_offset_value in range(offset, min(total_count, offset + count * limit), limit):
+        page_offset = str(page_offset_value)
+        page_query = [(key, page_offset if key == "offset" else value) for key, value in query]
+        urls.append(parsed._replace(query=urlencode(page_query)).geturl())
+    return urls
+
+
+class _ApiPageFetcher:
+    """Fetch API pages, keeping a window of predictable offset pages in flight.
+
+    ChEMBL-style pagination advances `offset` by `limit` and reports
+    `total_count`, so the remaining page URLs are known before the current
+    page is parsed. Without a total (or with `depth == 0`) pages are fetched
+    serially, so no request is ever made past the last page.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        *,
+        timeout_seconds: float,
+        headers: dict[str, str],
+        depth: int,
+    ) -> None:
+        self._session = session
+        self._timeout_seconds = timeout_seconds
+        self._headers = headers
+        self._depth = depth
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: dict[tuple[Any, ...], Future[requests.Response]] = {}
+
+    def __enter__(self) -> _ApiPageFetcher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+    ) -> requests.Response:
+        if params is None:
+            future = self._pending.pop(_page_key(url), None)
+            if future is not None:
+                return future.result()
+        return self._session.get(
+            url, params=params, timeout=self._timeout_seconds, headers=headers
+        )
+
+    def prefetch_from(
+        self,
+        url: str,
+        *,
+        pages_left: int | None,
+        total_count: Any,
+    ) -> None:
+        """Start fetching `url` and the pages after it, up to the window depth."""
+        count = self._depth if pages_left is None else min(self._depth, pages_left)
+        if count < 1 or not isinstance(total_count, int):
+            return
+        for page_url in _offset_page_urls(url, count, total_count):
+            key = _page_key(page_url)
+            if key in self._pending:
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._depth)
+            self._pending[key] = self._executor.submit(
+                self._session.get,
+                page_url,
+                timeout=self._timeout_seconds,
+                headers=self._headers,
+            )
+
+    def close(self) -> None:
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
 def _extract_api_items(payload: Any, api: ApiDatasetConfig) -> list[Any]:
-    if api.items_path == "":
+    if not api.items_segments:
         if isinstance(payload, list):
             return payload
         raise ValueError("API payload must be a list when items_path is empty.")
 
     value: Any = payload
-    for segment in api.items_path.split("."):
-        if not isinstance(value, dict):
+    for segment in api.items_segments:
+        try:
+            value = value[segment]
+        except KeyError:
+            value = None
+        except TypeError:
             raise ValueError(
                 f"Cannot resolve API items_path '{api.items_path}'. Segment '{segment}' "
                 "was not a mapping."
-            )
-        value = value.get(segment)
+            ) from None
 
     if value is None:
         return []
@@ -952,7 +1368,7 @@ def _resolve_next_page_url(
         return None
 
     if api.pagination == "chembl":
-        raw_next = _nested_get(payload, "page_meta.next")
+        raw_next = _nested_get(payload, _CHEMBL_NEXT_PATH)
         if not isinstance(raw_next, str) or not raw_next:
             return None
         return urljoin(current_url, raw_next)
@@ -963,9 +1379,9 @@ def _resolve_next_page_url(
     raise ValueError(f"Unsupported API pagination mode: {api.pagination}")
 
 
-def _nested_get(payload: Any, path: str) -> Any:
+def _nested_get(payload: Any, path: tuple[str, ...]) -> Any:
     current = payload
-    for segment in path.split("."):
+    for segment in path:
         if not isinstance(current, dict):
             return None
         current = current.get(segment)
@@ -6,13 +6,42 @@ import io
 import zipfile
 from collections.abc import Iterator
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import pyarrow.parquet as pq
 
 from .models import DatasetDefinition
 
+_ARROW_CSV_BLOCK_SIZE = 16 << 20
+# Tokens `pd.read_csv` reads as missing (its documented `na_values` default) or
+# boolean; Arrow's defaults differ (no "None"/"<NA>", and "1"/"0" count as booleans).
+_CSV_NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+_CSV_TRUE_VALUES = ["True", "TRUE", "true"]
+_CSV_FALSE_VALUES = ["False", "FALSE", "false"]
+
 
 def infer_delimiter(dataset: DatasetDefinition, raw_path: Path) -> str:
     """Infer delimiter from dataset metadata and filename."""
@@ -34,12 +63,41 @@ def iter_dataset_chunks(
     chunksize: int,
 ) -> Iterator[pd.DataFrame]:
     """Yield DataFrame chunks from a dataset raw file."""
+    for chunk in _iter_raw_chunks(raw_path, dataset=dataset, chunksize=chunksize):
+        if isinstance(chunk, pa.Table):
+            chunk = prepare_dataframe(chunk.to_pandas())
+        yield chunk
+
+
+def iter_dataset_tables(
+    raw_path: Path,
+    *,
+    dataset: DatasetDefinition,
+    chunksize: int,
+) -> Iterator[pa.Table]:
+    """Yield Arrow tables from a dataset raw file, skipping pandas where possible.
+
+    Delimited files read by the Arrow CSV reader and parquet sources never
+    touch pandas; other formats are converted from their DataFrame chunks.
+    """
+    for chunk in _iter_raw_chunks(raw_path, dataset=dataset, chunksize=chunksize):
+        if isinstance(chunk, pd.DataFrame):
+            chunk = pa.Table.from_pandas(chunk, preserve_index=False)
+        yield chunk
+
+
+def _iter_raw_chunks(
+    raw_path: Path,
+    *,
+    dataset: DatasetDefinition,
+    chunksize: int,
+) -> Iterator[pa.Table | pd.DataFrame]:
     if dataset.file_format == "xlsx":
         yield from _iter_excel_chunks(raw_path, chunksize=chunksize)
         return
 
     if dataset.file_format == "parquet":
-        yield from _iter_parquet_chunks(raw_path, chunksize=chunksize)
+        yield from _iter_parquet_tables(raw_path, chunksize=chunksize)
         return
 
     if dataset.file_format == "jsonl":
@@ -60,6 +118,22 @@ def iter_dataset_chunks(
     elif dataset.compression == "gzip":
         compression = "gzip"
 
+    rows_yielded = 0
+    try:
+        for chunk in _iter_arrow_csv_chunks(
+            raw_path, delimiter=delimiter, compression=compression, chunksize=chunksize
+        ):
+            rows_yielded += chunk.num_rows
+            yield chunk
+    except (pa.ArrowException, ValueError):
+        # Arrow infers types from its first block and rejects later values that
+        # do not fit; finish (or redo) the file with pandas, skipping any rows
+        # that were already emitted.
+        pass
+    else:
+        if rows_yielded:
+            return
+
     reader = pd.read_csv(
         raw_path,
         sep=delimiter,
@@ -68,9 +142,81 @@ def iter_dataset_chunks(
         low_memory=False,
     )
     for chunk in reader:
+        if rows_yielded:
+            skipped = min(rows_yielded, len(chunk))
+            rows_yielded -= skipped
+            chunk = chunk.iloc[skipped:]
+            if chunk.empty:
+                continue
         yield prepare_dataframe(chunk)
 
 
+def _iter_arrow_csv_chunks(
+    raw_path: Path,
+    *,
+    delimiter: str,
+    compression: Literal["infer", "gzip"] | None,
+    chunksize: int,
+) -> Iterator[pa.Table]:
+    """Stream a delimited file through Arrow's multithreaded CSV reader.
+
+    Yields `chunksize`-row tables whose pandas conversion matches `pd.read_csv`
+    dtypes: date and timestamp columns stay strings, and pandas' NA and boolean
+    tokens are used. Raises `ValueError` for inputs the Arrow reader cannot
+    mirror so callers fall back.
+    """
+    if len(delimiter) != 1:
+        raise ValueError("Arrow CSV reader needs a single-character delimiter.")
+
+    read_options = pacsv.ReadOptions(block_size=_ARROW_CSV_BLOCK_SIZE)
+    parse_options = pacsv.ParseOptions(delimiter=delimiter)
+
+    def open_reader(column_types: dict[str, pa.DataType]) -> pacsv.CSVStreamingReader:
+        source: Any = raw_path
+        if compression != "infer":
+            source = pa.input_stream(str(raw_path), compression=compression)
+        return pacsv.open_csv(
+            source,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types,
+                null_values=_CSV_NULL_VALUES,
+                true_values=_CSV_TRUE_VALUES,
+                false_values=_CSV_FALSE_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+
+    reader = open_reader({})
+    names = reader.schema.names
+    if len(set(names)) != len(names):
+        reader.close()
+        raise ValueError("Duplicate column names need pandas header mangling.")
+    temporal = {
+        field.name: pa.string()
+        for field in reader.schema
+        if pa.types.is_temporal(field.type)
+    }
+    if temporal:
+        reader.close()
+        reader = open_reader(temporal)
+
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    with reader:
+        for batch in reader:
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            while pending_rows >= chunksize:
+                table = pa.Table.from_batches(pending)
+                yield table.slice(0, chunksize)
+                pending = table.slice(chunksize).to_batches()
+                pending_rows -= chunksize
+    if pending_rows:
+        yield pa.Table.from_batches(pending)
+
+
 def _iter_jsonl_chunks(raw_path: Path, *, chunksize: int) -> Iterator[pd.DataFrame]:
     reader = pd.read_json(
         raw_path, lines=True, compression="infer", chunksize=chunksize
@@ -79,7 +225,7 @@ def _iter_jsonl_chunks(raw_path: Path, *, chunksize: int) -> Iterator[pd.DataFra
         yield prepare_dataframe(chunk)
 
 
-def _iter_parquet_chunks(raw_path: Path, *, chunksize: int) -> Iterator[pd.DataFrame]:
+def _iter_parquet_tables(raw_path: Path, *, chunksize: int) -> Iterator[pa.Table]:
     parquet_files: list[Path]
     if raw_path.is_dir():
         parquet_files = sorted(path for path in raw_path.glob("*.parquet"))
@@ -90,7 +236,14 @@ def _iter_parquet_chunks(raw_path: Path, *, chunksize: int) -> Iterator[pd.DataF
         raise ValueError(f"No parquet files found at '{raw_path}'.")
 
     for parquet_file in parquet_files:
-        yield from iter_parquet_file_chunks(parquet_file, chunksize=chunksize)
+        parquet = pq.ParquetFile(parquet_file)
+        saw_batch = False
+        for batch in parquet.iter_batches(batch_size=chunksize):
+            saw_batch = True
+            yield pa.Table.from_batches([batch])
+        if not saw_batch:
+            # Preserve empty-file behavior by emitting the empty schema once.
+            yield parquet.schema_arrow.empty_table()
 
 
 def iter_parquet_file_chunks(
@@ -145,21 +298,34 @@ def _iter_csv_like_from_zip(
 
 def _choose_zip_member(archive: zipfile.ZipFile) -> str:
     preferred_suffixes = (".csv", ".tsv", ".txt", ".jsonl")
-    candidates = [name for name in archive.namelist() if not name.endswith("/")]
-    if not candidates:
+    first_file: str | None = None
+    by_suffix: dict[str, str] = {}
+    for info in archive.infolist():
+        if info.is_dir():
+            continue
+        name = info.filename
+        if first_file is None:
+            first_file = name
+        dot = name.rfind(".")
+        if dot >= 0:
+            by_suffix.setdefault(name[dot:].lower(), name)
+    if first_file is None:
         raise ValueError("Zip archive does not contain files.")
 
     for suffix in preferred_suffixes:
-        for candidate in candidates:
-            if candidate.lower().endswith(suffix):
-                return candidate
+        if suffix in by_suffix:
+            return by_suffix[suffix]
 
     # Fallback to first file when extension hints are unavailable.
-    return candidates[0]
+    return first_file
 
 
 def prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize DataFrame dtypes for reliable parquet serialization."""
+    """Normalize DataFrame dtypes for reliable parquet serialization.
+
+    Only object columns are converted; the result is a shallow copy, so the
+    remaining columns share their data with `df` instead of being duplicated.
+    """
     object_columns = [
         column
         for column, dtype in df.dtypes.items()
@@ -168,7 +334,7 @@ def prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     if not object_columns:
         return df
 
-    normalized = df.copy()
+    normalized = df.copy(deep=False)
     for column in object_columns:
         normalized[column] = normalized[column].astype("string")
     return normalized
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -28,6 +30,10 @@ _CATEGORY_USAGE_DEFAULTS: dict[str, str] = {
     "targets": "Use for target selection, annotation, and target-space definition.",
     "target_families": "Use for family-focused target programs and panel design.",
 }
+# Pre-wrapped so `resolved_usage_notes` can return a shared tuple.
+_CATEGORY_USAGE_NOTES: dict[str, tuple[str, ...]] = {
+    category: (note,) for category, note in _CATEGORY_USAGE_DEFAULTS.items()
+}
 
 
 @dataclass(frozen=True, slots=True)
@@ -43,6 +49,11 @@ class ApiDatasetConfig:
     page_size: int | None = None
     max_pages: int | None = 100
     max_rows: int | None = 10_000
+    items_segments: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        segments = tuple(self.items_path.split(".")) if self.items_path else ()
+        object.__setattr__(self, "items_segments", segments)
 
     def request_signature(self) -> dict[str, Any]:
         """Return a stable signature used for cache compatibility checks."""
@@ -81,15 +92,46 @@ class DatasetDefinition:
     version: str = "latest"
     filename: str | None = None
     url_mode: UrlMode = "fallback"
+    url_suffix: str = ""
+    # Hard-link local `file://` sources into the cache instead of copying them.
+    # Only safe for sources that are replaced rather than edited in place.
+    allow_link: bool = False
+    normalized_tags: frozenset[str] = field(init=False, repr=False, compare=False)
+    _snapshot: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _filename: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "normalized_tags", frozenset(tag.lower() for tag in self.tags)
+        )
+
+    def has_tag(self, tag: str) -> bool:
+        """Return whether the dataset carries `tag` (case-insensitive)."""
+        return tag.strip().lower() in self.normalized_tags
+
+    def resolved_urls(self) -> tuple[str, ...]:
+        """Return source URLs with `url_suffix` appended to each configured entry."""
+        if not self.url_suffix:
+            return self.urls
+        return tuple(url + self.url_suffix for url in self.urls)
 
     def preferred_filename(self) -> str:
         """Return a filesystem-safe filename for the raw file."""
+        filename = self._filename
+        if filename is None:
+            filename = self._build_preferred_filename()
+            object.__setattr__(self, "_filename", filename)
+        return filename
+
+    def _build_preferred_filename(self) -> str:
         if self.filename:
             return self.filename
         if self.api is not None:
             return f"{self.dataset_id}.jsonl"
         if self.urls:
-            first_url = self.urls[0]
+            first_url = self.urls[0] + self.url_suffix
             parsed = urlparse(first_url)
             from_url = Path(parsed.path).name
             if from_url:
@@ -107,13 +149,29 @@ class DatasetDefinition:
         """Return explicit usage notes or a category-derived fallback note."""
         if self.usage_notes:
             return self.usage_notes
-        fallback = _CATEGORY_USAGE_DEFAULTS.get(self.category)
+        fallback = _CATEGORY_USAGE_NOTES.get(self.category)
         if fallback:
-            return (fallback,)
+            return fallback
         return (self.description,)
 
     def metadata_snapshot(self) -> dict[str, Any]:
         """Return normalized metadata suitable for cache/manifests and CLI output."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._build_metadata_snapshot()
+            object.__setattr__(self, "_snapshot", snapshot)
+        # The definition is immutable, so only the containers need copying to
+        # keep callers from mutating the cached snapshot.
+        return {
+            key: list(value)
+            if isinstance(value, list)
+            else copy.deepcopy(value)
+            if isinstance(value, dict)
+            else value
+            for key, value in snapshot.items()
+        }
+
+    def _build_metadata_snapshot(self) -> dict[str, Any]:
         return {
             "dataset_id": self.dataset_id,
             "name": self.name,
@@ -132,7 +190,7 @@ class DatasetDefinition:
             "filename": self.filename or self.preferred_filename(),
             "url_mode": self.url_mode,
             "tags": list(self.tags),
-            "urls": list(self.urls),
+            "urls": list(self.resolved_urls()),
             "api": self.api.request_signature() if self.api is not None else None,
         }
 
@@ -150,6 +208,13 @@ class FetchResult:
     refreshed: bool
     bytes_downloaded: int
     sha256: str
+    dataset: DatasetDefinition | None = field(default=None, repr=False, compare=False)
+    raw_path_str: str = field(init=False, repr=False, compare=False)
+    metadata_path_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "raw_path_str", os.fspath(self.raw_path))
+        object.__setattr__(self, "metadata_path_str", os.fspath(self.metadata_path))
 
 
 @dataclass(frozen=True, slots=True)
@@ -164,3 +229,13 @@ class MaterializeResult:
     row_count: int
     cache_hit: bool
     source_sha256: str
+    dataset: DatasetDefinition | None = field(default=None, repr=False, compare=False)
+    manifest: dict[str, Any] | None = field(default=None, repr=False, compare=False)
+    parquet_dir_str: str = field(init=False, repr=False, compare=False)
+    manifest_path_str: str = field(init=False, repr=False, compare=False)
+    part_strs: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "parquet_dir_str", os.fspath(self.parquet_dir))
+        object.__setattr__(self, "manifest_path_str", os.fspath(self.manifest_path))
+        object.__setattr__(self, "part_strs", tuple(map(os.fspath, self.parts)))
@@ -2,26 +2,172 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
+import queue
 import shutil
+import threading
+from collections.abc import Generator, Iterable, Iterator, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from .cache import CacheBackend, DataCache
 from .catalog import DatasetCatalog, get_default_catalog
-from .downloader import fetch_dataset
-from .io import iter_dataset_chunks
 from .models import DatasetDefinition, FetchResult, MaterializeResult
-from .validation import SourceValidationResult, validate_dataset_sources
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from .validation import SourceValidationResult
+
+# The downloader (requests), io (pandas/pyarrow) and validation modules are
+# imported where they are used so catalog-only work such as `list` stays cheap.
 
 _DEFAULT_CHUNKSIZE = 100_000
-_MAX_VALIDATE_WORKERS = 8
+_MAX_WORKERS = 8
+# Chunks become row groups of a part until it grows past this size.
+_PART_TARGET_BYTES = 256 << 20
+# Chunks decoded ahead of the parquet writer.
+_PREFETCH_CHUNKS = 2
+
+_T = TypeVar("_T")
 
 
 def _utcnow_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def _worker_count(max_workers: int | None, task_count: int) -> int:
+    if max_workers is None:
+        return max(1, min(_MAX_WORKERS, task_count))
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    return max(1, min(max_workers, task_count))
+
+
+def _prefetched(items: Iterable[_T], depth: int) -> Generator[_T, None, None]:
+    """Produce `items` on a background thread, buffering up to `depth` ahead.
+
+    Decoding the next chunk then overlaps with encoding the current one.
+    Producer exceptions are re-raised in the consumer; closing the iterator
+    stops the producer.
+    """
+    buffer: queue.Queue[tuple[bool, Any]] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def offer(entry: tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not offer((False, item)):
+                    return
+            offer((True, None))
+        except BaseException as exc:
+            offer((True, exc))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=produce, name="refua-data-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            done, value = buffer.get()
+            if done:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _widens_losslessly(source: pa.DataType, target: pa.DataType) -> bool:
+    """Whether every `source` value survives a cast to `target` unchanged."""
+    import pyarrow as pa
+
+    types = pa.types
+    if source.equals(target) or types.is_null(source):
+        return True
+    if types.is_integer(source) and types.is_integer(target):
+        if types.is_signed_integer(source) == types.is_signed_integer(target):
+            return bool(target.bit_width >= source.bit_width)
+        return types.is_unsigned_integer(source) and target.bit_width > source.bit_width
+    if types.is_floating(source) and types.is_floating(target):
+        return bool(target.bit_width >= source.bit_width)
+    if types.is_integer(source) and types.is_floating(target):
+        # Exact while the float mantissa still covers the integer width.
+        return bool(target.bit_width > source.bit_width)
+    return (types.is_string(source) and types.is_large_string(target)) or (
+        types.is_binary(source) and types.is_large_binary(target)
+    )
+
+
+def _write_parquet_parts(
+    tables: Iterable[pa.Table], parquet_dir: Path, *, target_bytes: int
+) -> tuple[list[Path], int]:
+    """Write `tables` as row groups of rolling parquet parts; return parts and rows.
+
+    A part is closed once it reaches roughly `target_bytes`, or when a table's
+    schema differs from the open part's by more than null columns or lossless
+    widening, so drifted values keep their own types instead of being coerced.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parts: list[Path] = []
+    parquet_dir_str = os.fspath(parquet_dir)
+    row_count = 0
+    sink: pa.NativeFile | None = None
+    writer: pq.ParquetWriter | None = None
+
+    def close_part() -> None:
+        nonlocal sink, writer
+        if writer is not None:
+            writer.close()
+            writer = None
+        if sink is not None:
+            sink.close()
+            sink = None
+
+    try:
+        for table in tables:
+            if writer is not None and not table.schema.equals(writer.schema):
+                if table.schema.names == writer.schema.names and all(
+                    _widens_losslessly(field.type, target.type)
+                    for field, target in zip(table.schema, writer.schema, strict=True)
+                ):
+                    table = table.cast(writer.schema)
+                else:
+                    # Types drifted between chunks: start a part with the new schema.
+                    close_part()
+            if writer is None:
+                part_str = os.path.join(parquet_dir_str, f"part-{len(parts):05d}.parquet")
+                sink = pa.OSFile(part_str, "wb")
+                writer = pq.ParquetWriter(sink, table.schema)
+                parts.append(Path(part_str))
+            writer.write_table(table)
+            row_count += table.num_rows
+            if sink is not None and sink.tell() >= target_bytes:
+                close_part()
+    finally:
+        close_part()
+    return parts, row_count
+
+
 class DatasetManager:
     """Entrypoint for catalog lookup, downloading, and parquet conversion."""
 
@@ -33,8 +179,12 @@ class DatasetManager:
     ):
         self.catalog = catalog or get_default_catalog()
         self.cache: CacheBackend = cache or DataCache()
+        # manifest path -> (source sha256, parquet dir + manifest stamp, cached result).
+        self._manifest_hits: dict[Path, tuple[str, tuple[int, ...], MaterializeResult]] = {}
 
-    def list_datasets(self, *, tag: str | None = None) -> list[DatasetDefinition]:
+    def list_datasets(
+        self, *, tag: str | None = None
+    ) -> tuple[DatasetDefinition, ...]:
         """List available datasets, optionally filtered by tag."""
         if tag is None:
             return self.catalog.list()
@@ -49,6 +199,8 @@ class DatasetManager:
         timeout_seconds: float = 120.0,
     ) -> FetchResult:
         """Fetch a dataset to local cache."""
+        from .downloader import fetch_dataset
+
         dataset = self.catalog.get(dataset_id)
         return fetch_dataset(
             dataset,
@@ -68,12 +220,32 @@ class DatasetManager:
         timeout_seconds: float = 120.0,
     ) -> MaterializeResult:
         """Fetch a dataset and materialize chunked parquet output."""
+        return self._materialize_dataset(
+            self.catalog.get(dataset_id),
+            force=force,
+            refresh=refresh,
+            chunksize=chunksize,
+            timeout_seconds=timeout_seconds,
+        )
+
+    def _materialize_dataset(
+        self,
+        dataset: DatasetDefinition,
+        *,
+        force: bool,
+        refresh: bool,
+        chunksize: int,
+        timeout_seconds: float = 120.0,
+    ) -> MaterializeResult:
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1")
 
-        dataset = self.catalog.get(dataset_id)
-        fetch_result = self.fetch(
-            dataset_id,
+        from .downloader import fetch_dataset
+        from .io import iter_dataset_tables
+
+        fetch_result = fetch_dataset(
+            dataset,
+            cache=self.cache,
             force=force,
             refresh=refresh,
             timeout_seconds=timeout_seconds,
@@ -96,22 +268,20 @@ class DatasetManager:
             shutil.rmtree(parquet_dir)
         parquet_dir.mkdir(parents=True, exist_ok=True)
 
-        parts: list[Path] = []
-        row_count = 0
-
-        for index, chunk in enumerate(
-            iter_dataset_chunks(
+        tables = _prefetched(
+            iter_dataset_tables(
                 fetch_result.raw_path, dataset=dataset, chunksize=chunksize
+            ),
+            _PREFETCH_CHUNKS,
+        )
+        with contextlib.closing(tables):
+            parts, row_count = _write_parquet_parts(
+                tables, parquet_dir, target_bytes=_PART_TARGET_BYTES
             )
-        ):
-            part_path = parquet_dir.joinpath(f"part-{index:05d}.parquet")
-            chunk.to_parquet(part_path, index=False)
-            parts.append(part_path)
-            row_count += len(chunk)
 
         if not parts:
             raise ValueError(
-                f"No tabular rows found while materializing dataset '{dataset_id}'."
+                f"No tabular rows found while materializing dataset '{dataset.dataset_id}'."
             )
 
         manifest = {
@@ -138,6 +308,8 @@ class DatasetManager:
             row_count=row_count,
             cache_hit=False,
             source_sha256=fetch_result.sha256,
+            dataset=dataset,
+            manifest=manifest,
         )
 
     def _manifest_cache_hit(
@@ -148,8 +320,30 @@ class DatasetManager:
         parquet_dir: Path,
         manifest_path: Path,
     ) -> MaterializeResult | None:
+        try:
+            # Adding or removing parts bumps the directory mtime and a rebuild
+            # replaces the directory (new inode). Every build also rewrites the
+            # manifest, which covers rebuilds inside one mtime tick.
+            dir_stat = os.stat(parquet_dir)
+        except OSError:
+            return None
+        stamp: tuple[int, ...] = (dir_stat.st_ino, dir_stat.st_mtime_ns)
+        try:
+            manifest_stat = os.stat(manifest_path)
+        except OSError:
+            pass  # Backends may keep manifests outside the filesystem.
+        else:
+            stamp += (manifest_stat.st_ino, manifest_stat.st_mtime_ns, manifest_stat.st_size)
+        memo = self._manifest_hits.get(manifest_path)
+        if (
+            memo is not None
+            and memo[:2] == (source_sha256, stamp)
+            and memo[2].dataset == dataset
+        ):
+            return memo[2]
+
         manifest = self.cache.read_json(manifest_path)
-        if not manifest or not parquet_dir.exists():
+        if not manifest:
             return None
 
         source = manifest.get("source")
@@ -162,16 +356,21 @@ class DatasetManager:
         if not isinstance(parts_raw, list) or not parts_raw:
             return None
 
-        parts = tuple(parquet_dir.joinpath(str(name)) for name in parts_raw)
-        if not all(path.exists() for path in parts):
+        # One directory listing instead of a stat per part.
+        present = set(os.listdir(parquet_dir))
+        if not all(str(name) in present for name in parts_raw):
             return None
+        parquet_dir_str = os.fspath(parquet_dir)
+        parts = tuple(
+            Path(os.path.join(parquet_dir_str, str(name))) for name in parts_raw
+        )
 
         row_count_raw = manifest.get("row_count")
         row_count = (
             int(row_count_raw) if isinstance(row_count_raw, int | float | str) else 0
         )
 
-        return MaterializeResult(
+        result = MaterializeResult(
             dataset_id=dataset.dataset_id,
             version=dataset.version,
             parquet_dir=parquet_dir,
@@ -180,39 +379,110 @@ class DatasetManager:
             row_count=row_count,
             cache_hit=True,
             source_sha256=source_sha256,
+            dataset=dataset,
+            manifest=manifest,
         )
+        self._manifest_hits[manifest_path] = (source_sha256, stamp, result)
+        return result
 
     def fetch_many(
         self,
-        dataset_ids: list[str],
+        dataset_ids: Sequence[str],
         *,
         force: bool = False,
         refresh: bool = False,
+        max_workers: int | None = None,
     ) -> list[FetchResult]:
-        """Fetch multiple datasets."""
-        return [
-            self.fetch(dataset_id, force=force, refresh=refresh)
-            for dataset_id in dataset_ids
+        """Fetch multiple datasets concurrently, preserving input order.
+
+        Repeated IDs are fetched once (they would share one raw file) and the
+        result is repeated at every position.
+        """
+
+        def fetch_one(dataset_id: str) -> FetchResult:
+            return self.fetch(dataset_id, force=force, refresh=refresh)
+
+        unique = list(dict.fromkeys(dataset_ids))
+        workers = _worker_count(max_workers, len(unique))
+        if workers == 1:
+            fetched = {dataset_id: fetch_one(dataset_id) for dataset_id in unique}
+        else:
+            # Create cache directories once instead of racing from every worker.
+            self.cache.ensure()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = dict(zip(unique, executor.map(fetch_one, unique), strict=True))
+        return [fetched[dataset_id] for dataset_id in dataset_ids]
+
+    def iter_materialize(
+        self,
+        dataset_ids: Sequence[str | DatasetDefinition],
+        *,
+        force: bool = False,
+        refresh: bool = False,
+        chunksize: int = _DEFAULT_CHUNKSIZE,
+        max_workers: int | None = None,
+    ) -> Iterator[MaterializeResult]:
+        """Yield materialization results in input order as each dataset finishes.
+
+        Entries may be dataset IDs or already-resolved dataset definitions. A
+        dataset listed more than once is built once (they would share one
+        parquet directory) and its result is repeated at every position.
+        """
+        datasets = [
+            item if isinstance(item, DatasetDefinition) else self.catalog.get(item)
+            for item in dataset_ids
         ]
+        unique: dict[str, DatasetDefinition] = {}
+        for dataset in datasets:
+            unique.setdefault(dataset.dataset_id, dataset)
+
+        def materialize_one(dataset: DatasetDefinition) -> MaterializeResult:
+            return self._materialize_dataset(
+                dataset,
+                force=force,
+                refresh=refresh,
+                chunksize=chunksize,
+            )
+
+        workers = _worker_count(max_workers, len(unique))
+        if workers == 1:
+            done: dict[str, MaterializeResult] = {}
+            for dataset in datasets:
+                result = done.get(dataset.dataset_id)
+                if result is None:
+                    result = done[dataset.dataset_id] = materialize_one(
+                        unique[dataset.dataset_id]
+                    )
+                yield result
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                dataset_id: executor.submit(materialize_one, dataset)
+                for dataset_id, dataset in unique.items()
+            }
+            for dataset in datasets:
+                yield futures[dataset.dataset_id].result()
 
     def materialize_many(
         self,
-        dataset_ids: list[str],
+        dataset_ids: Sequence[str | DatasetDefinition],
         *,
         force: bool = False,
         refresh: bool = False,
         chunksize: int = _DEFAULT_CHUNKSIZE,
+        max_workers: int | None = None,
     ) -> list[MaterializeResult]:
-        """Materialize multiple datasets."""
-        return [
-            self.materialize(
-                dataset_id,
+        """Materialize multiple datasets concurrently, preserving input order."""
+        return list(
+            self.iter_materialize(
+                dataset_ids,
                 force=force,
                 refresh=refresh,
                 chunksize=chunksize,
+                max_workers=max_workers,
             )
-            for dataset_id in dataset_ids
-        ]
+        )
 
     def validate_sources(
         self,
@@ -220,26 +490,22 @@ class DatasetManager:
         dataset_ids: list[str] | None = None,
         tag: str | None = None,
         timeout_seconds: float = 20.0,
+        max_workers: int | None = None,
     ) -> list[SourceValidationResult]:
         """Validate dataset source accessibility for configured datasets."""
         if timeout_seconds <= 0:
             raise ValueError("timeout_seconds must be > 0")
 
-        datasets: list[DatasetDefinition]
+        datasets: Sequence[DatasetDefinition]
         if dataset_ids is not None:
             datasets = [self.catalog.get(dataset_id) for dataset_id in dataset_ids]
         else:
             datasets = self.list_datasets(tag=tag)
 
-        results: list[SourceValidationResult] = []
-        max_workers = max(1, min(_MAX_VALIDATE_WORKERS, len(datasets)))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for dataset_results in executor.map(
-                lambda dataset: validate_dataset_sources(
-                    dataset,
-                    timeout_seconds=timeout_seconds,
-                ),
-                datasets,
-            ):
-                results.extend(dataset_results)
-        return results
+        from .validation import validate_many_dataset_sources
+
+        return validate_many_dataset_sources(
+            datasets,
+            timeout_seconds=timeout_seconds,
+            max_workers=_worker_count(max_workers, len(datasets)),
+        )
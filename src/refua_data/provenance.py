@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import stat
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
@@ -9,19 +11,28 @@ from typing import Any
 
 def load_materialized_manifest(manifest_path: Path) -> dict[str, Any]:
     """Load and validate a refua-data parquet manifest."""
-    resolved = manifest_path.expanduser().resolve()
-    if not resolved.exists() or not resolved.is_file():
-        raise ValueError(f"Manifest file does not exist: {resolved}")
+    path = manifest_path.expanduser()
+    # Open first and fstat the handle: one lookup instead of resolve/exists/is_file.
+    try:
+        with open(path, "rb") as handle:
+            if not stat.S_ISREG(os.fstat(handle.fileno()).st_mode):
+                raise ValueError(f"Manifest file does not exist: {path.resolve()}")
+            data = handle.read()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as exc:
+        raise ValueError(f"Manifest file does not exist: {path.resolve()}") from exc
 
     import json
 
+    from .cache import loads_json
+
     try:
-        payload = json.loads(resolved.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"Manifest is not valid JSON: {resolved}") from exc
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        payload = loads_json(data)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raise ValueError(f"Manifest is not valid JSON: {path.resolve()}") from exc
 
     if not isinstance(payload, dict):
-        raise ValueError(f"Manifest must be a JSON object: {resolved}")
+        raise ValueError(f"Manifest must be a JSON object: {path.resolve()}")
     return payload
 
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 import time
+from collections.abc import Sequence
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -15,6 +17,9 @@ from .models import ApiDatasetConfig, DatasetDefinition
 
 _DEFAULT_USER_AGENT = "refua-data/0.7.2"
 _MAX_VALIDATION_WORKERS = 8
+# HEAD answers that warrant a ranged GET retry; 403 covers object stores whose
+# signed URLs only authorize GET.
+_HEAD_UNSUPPORTED_STATUSES = frozenset({403, 405, 501})
 
 
 def _build_session() -> requests.Session:
@@ -32,6 +37,29 @@ def _validation_worker_count(task_count: int) -> int:
     return max(1, min(_MAX_VALIDATION_WORKERS, task_count))
 
 
+class _ThreadSessions:
+    """Hand each worker thread its own HTTP session and close them all at the end."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> requests.Session:
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = _build_session()
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+
 @dataclass(frozen=True, slots=True)
 class SourceValidationResult:
     """Result of probing a single dataset source endpoint."""
@@ -45,6 +73,40 @@ class SourceValidationResult:
     error: str | None = None
     details: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Round once here so serializers can emit the record as-is.
+        object.__setattr__(self, "latency_ms", round(self.latency_ms, 3))
+
+
+def validate_many_dataset_sources(
+    datasets: Sequence[DatasetDefinition],
+    *,
+    timeout_seconds: float,
+    max_workers: int,
+) -> list[SourceValidationResult]:
+    """Validate several datasets on a thread pool, preserving input order.
+
+    Each worker thread reuses one HTTP session so datasets served from the
+    same host share pooled keep-alive connections.
+    """
+    sessions = _ThreadSessions()
+
+    def validate_one(dataset: DatasetDefinition) -> list[SourceValidationResult]:
+        return validate_dataset_sources(
+            dataset,
+            timeout_seconds=timeout_seconds,
+            session=sessions.get(),
+        )
+
+    results: list[SourceValidationResult] = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for dataset_results in executor.map(validate_one, datasets):
+                results.extend(dataset_results)
+    finally:
+        sessions.close()
+    return results
+
 
 def validate_dataset_sources(
     dataset: DatasetDefinition,
@@ -69,7 +131,8 @@ def validate_dataset_sources(
             )
         ]
 
-    if not dataset.urls:
+    urls = dataset.resolved_urls()
+    if not urls:
         return [
             SourceValidationResult(
                 dataset_id=dataset.dataset_id,
@@ -93,27 +156,35 @@ def validate_dataset_sources(
                 latency_ms=0.0,
                 error="uninitialized",
             )
-            for _ in dataset.urls
+            for _ in urls
         ]
         futures: dict[Future[SourceValidationResult], int] = {}
-        with ThreadPoolExecutor(
-            max_workers=_validation_worker_count(len(dataset.urls))
-        ) as executor:
-            for index, url in enumerate(dataset.urls):
-                future = executor.submit(
-                    _probe_url,
-                    dataset,
-                    url,
-                    timeout_seconds=timeout_seconds,
-                    session=None,
-                )
-                futures[future] = index
-            for future, index in futures.items():
-                concat_attempts[index] = future.result()
+        # Parts usually share a host, so each worker keeps one pooled session
+        # instead of opening a fresh connection per URL.
+        part_sessions = _ThreadSessions()
+
+        def probe_part(url: str) -> SourceValidationResult:
+            return _probe_url(
+                dataset,
+                url,
+                timeout_seconds=timeout_seconds,
+                session=part_sessions.get(),
+            )
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=_validation_worker_count(len(urls))
+            ) as executor:
+                for index, url in enumerate(urls):
+                    futures[executor.submit(probe_part, url)] = index
+                for future, index in futures.items():
+                    concat_attempts[index] = future.result()
+        finally:
+            part_sessions.close()
         return [_collapse_concat_attempts(dataset, concat_attempts)]
 
     attempts: list[SourceValidationResult] = []
-    for url in dataset.urls:
+    for url in urls:
         result = _probe_url(
             dataset,
             url,
@@ -219,7 +290,7 @@ def _attempt_details(result: SourceValidationResult) -> dict[str, Any]:
         "source_type": result.source_type,
         "ok": result.ok,
         "status_code": result.status_code,
-        "latency_ms": round(result.latency_ms, 3),
+        "latency_ms": result.latency_ms,
         "error": result.error,
     }
 
@@ -287,10 +358,7 @@ def _probe_http_url(
     session: requests.Session | None = None,
 ) -> SourceValidationResult:
     started = time.perf_counter()
-    headers = {
-        "User-Agent": _DEFAULT_USER_AGENT,
-        "Range": "bytes=0-0",
-    }
+    headers = {"User-Agent": _DEFAULT_USER_AGENT}
 
     active_session = session
     owns_session = active_session is None
@@ -298,13 +366,23 @@ def _probe_http_url(
         active_session = _build_session()
 
     try:
-        with active_session.get(
+        response = active_session.head(
             url,
             timeout=timeout_seconds,
             headers=headers,
-            stream=True,
             allow_redirects=True,
-        ) as response:
+        )
+        if response.status_code in _HEAD_UNSUPPORTED_STATUSES:
+            # Servers that reject HEAD still answer a one-byte ranged GET.
+            response.close()
+            response = active_session.get(
+                url,
+                timeout=timeout_seconds,
+                headers={**headers, "Range": "bytes=0-0"},
+                stream=True,
+                allow_redirects=True,
+            )
+        with response:
             ok = response.status_code < 400
             latency_ms = (time.perf_counter() - started) * 1000.0
             return SourceValidationResult(
@@ -367,7 +445,7 @@ def _probe_api(
         )
         response.raise_for_status()
         payload = response.json()
-        items = _extract_items(payload, api.items_path)
+        items = _extract_items(payload, api)
         latency_ms = (time.perf_counter() - started) * 1000.0
 
         return SourceValidationResult(
@@ -404,14 +482,15 @@ def _probe_api(
             active_session.close()
 
 
-def _extract_items(payload: Any, items_path: str) -> list[Any]:
-    if items_path == "":
+def _extract_items(payload: Any, api: ApiDatasetConfig) -> list[Any]:
+    items_path = api.items_path
+    if not api.items_segments:
         if isinstance(payload, list):
             return payload
         raise ValueError("API payload must be a list when items_path is empty.")
 
     value: Any = payload
-    for segment in items_path.split("."):
+    for segment in api.items_segments:
         if not isinstance(value, dict):
             raise ValueError(
                 f"Cannot resolve items_path '{items_path}'; segment '{segment}' is not a mapping."
@@ -1,8 +1,18 @@
+import hashlib
+import os
 from pathlib import Path
 from typing import Any
 
-from refua_data.cache import DataCache
+import pytest
+
+from refua_data.cache import (
+    _XATTR_META_NAME,
+    DataCache,
+    SQLiteCacheBackend,
+    XattrCacheBackend,
+)
 from refua_data.catalog import DatasetCatalog
+from refua_data.config import default_cache_root
 from refua_data.models import DatasetDefinition
 from refua_data.pipeline import DatasetManager
 
@@ -68,3 +78,162 @@ def test_dataset_manager_accepts_pluggable_cache_backend(tmp_path: Path) -> None
     assert cache.write_calls >= 1
     assert first.cache_hit is False
     assert second.cache_hit is True
+
+
+def test_data_cache_json_round_trip_is_sorted_and_indented(tmp_path: Path) -> None:
+    cache = DataCache(tmp_path)
+    path = tmp_path / "_meta" / "sample.json"
+
+    cache.write_json(path, {"b": 1, "a": {"d": [1, 2], "c": "µ"}})
+
+    assert cache.read_json(path) == {"a": {"c": "µ", "d": [1, 2]}, "b": 1}
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith('{\n  "a": {')
+    assert text.index('"a"') < text.index('"b"')
+    assert cache.read_json(tmp_path / "_meta" / "missing.json") is None
+
+
+def test_durable_data_cache_rewrites_json_files(tmp_path: Path) -> None:
+    cache = DataCache(tmp_path, durable=True)
+    first = tmp_path / "_meta" / "raw" / "a.json"
+    second = tmp_path / "_meta" / "raw" / "b.json"
+
+    cache.write_json(first, {"id": "a"})
+    cache.write_json(second, {"id": "b"})
+    cache.write_json(first, {"id": "a2"})
+
+    assert cache.read_json(first) == {"id": "a2"}
+    assert cache.read_json(second) == {"id": "b"}
+    assert sorted(path.name for path in first.parent.iterdir()) == ["a.json", "b.json"]
+
+
+def test_sqlite_cache_backend_stores_metadata_in_index(tmp_path: Path) -> None:
+    source = tmp_path / "source.csv"
+    source.write_text("smiles,label\nCCO,1\nCCC,0\n", encoding="utf-8")
+
+    dataset = DatasetDefinition(
+        dataset_id="toy",
+        name="Toy",
+        description="Toy test dataset",
+        source="unit-test",
+        homepage="https://example.test",
+        license_name="test",
+        license_url=None,
+        urls=(source.resolve().as_uri(),),
+        file_format="csv",
+        category="test",
+        tags=("unit",),
+    )
+    cache = SQLiteCacheBackend(tmp_path / "cache")
+    manager = DatasetManager(catalog=DatasetCatalog.from_entries([dataset]), cache=cache)
+
+    first = manager.materialize("toy")
+    second = manager.materialize("toy")
+    cache.close()
+
+    assert first.cache_hit is False
+    assert second.cache_hit is True
+    assert not first.manifest_path.exists()
+    assert cache.index_path.exists()
+    manifest = SQLiteCacheBackend(tmp_path / "cache").read_json(first.manifest_path)
+    assert isinstance(manifest, dict)
+    assert manifest["row_count"] == 2
+
+
+def test_xattr_cache_backend_keeps_raw_metadata_on_raw_file(tmp_path: Path) -> None:
+    source = tmp_path / "source.csv"
+    source.write_text("smiles,label\nCCO,1\nCCC,0\n", encoding="utf-8")
+
+    dataset = DatasetDefinition(
+        dataset_id="toy",
+        name="Toy",
+        description="Toy test dataset",
+        source="unit-test",
+        homepage="https://example.test",
+        license_name="test",
+        license_url=None,
+        urls=(source.resolve().as_uri(),),
+        file_format="csv",
+        category="test",
+        tags=("unit",),
+    )
+    cache = XattrCacheBackend(tmp_path / "cache")
+    manager = DatasetManager(catalog=DatasetCatalog.from_entries([dataset]), cache=cache)
+
+    first = manager.fetch("toy")
+    second = manager.fetch("toy")
+    meta = cache.read_json(first.metadata_path)
+
+    assert first.cache_hit is False
+    assert second.cache_hit is True
+    assert isinstance(meta, dict)
+    assert meta["sha256"] == first.sha256
+    assert first.metadata_path.exists() is not cache.xattr_supported
+
+
+def test_xattr_cache_backend_keeps_linked_source_free_of_metadata(tmp_path: Path) -> None:
+    source = tmp_path / "source.csv"
+    source.write_bytes(b"smiles,label\nCCO,1\n")
+
+    dataset = DatasetDefinition(
+        dataset_id="toy_link",
+        name="Toy Link",
+        description="Toy hard-linked dataset",
+        source="unit-test",
+        homepage="https://example.test",
+        license_name="test",
+        license_url=None,
+        urls=(source.resolve().as_uri(),),
+        file_format="csv",
+        category="test",
+        allow_link=True,
+    )
+    cache = XattrCacheBackend(tmp_path / "cache")
+    manager = DatasetManager(catalog=DatasetCatalog.from_entries([dataset]), cache=cache)
+
+    first = manager.fetch("toy_link")
+    meta = cache.read_json(first.metadata_path)
+
+    assert isinstance(meta, dict)
+    assert meta["ingest_mode"] == "link"
+    assert first.metadata_path.exists()
+    if hasattr(os, "listxattr"):
+        assert _XATTR_META_NAME not in os.listxattr(source)
+
+    # An in-place edit of the linked source is picked up by the next fetch.
+    with source.open("ab") as handle:
+        handle.write(b"CCC,0\n")
+    second = manager.fetch("toy_link")
+    assert second.cache_hit is False
+    assert second.sha256 == hashlib.sha256(source.read_bytes()).hexdigest()
+
+
+def test_relative_cache_root_resolves_against_current_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert DataCache(Path("cache")).root == (tmp_path / "a" / "cache").resolve()
+    monkeypatch.chdir(tmp_path / "b")
+    assert DataCache(Path("cache")).root == (tmp_path / "b" / "cache").resolve()
+
+
+def test_default_cache_root_follows_environment_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("REFUA_DATA_HOME", str(tmp_path / "first"))
+    assert default_cache_root() == (tmp_path / "first").resolve()
+    assert default_cache_root() is default_cache_root()
+
+    monkeypatch.setenv("REFUA_DATA_HOME", str(tmp_path / "second"))
+    assert default_cache_root() == (tmp_path / "second").resolve()
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    monkeypatch.setenv("REFUA_DATA_HOME", "relative")
+    monkeypatch.chdir(tmp_path / "a")
+    assert default_cache_root() == (tmp_path / "a" / "relative").resolve()
+    monkeypatch.chdir(tmp_path / "b")
+    assert default_cache_root() == (tmp_path / "b" / "relative").resolve()
@@ -33,3 +33,30 @@ def test_default_catalog_contains_core_and_api_datasets() -> None:
     assert "uniprot_human_enzymes" in ids
     assert "chembl_targets_human_protein_complex" in ids
     assert len(datasets) >= 49
+
+
+def test_filter_by_tag_is_case_insensitive_and_sorted() -> None:
+    catalog = get_default_catalog()
+
+    zinc = catalog.filter_by_tag(" ZINC ")
+    ids = [dataset.dataset_id for dataset in zinc]
+
+    assert "zinc15_250k" in ids
+    assert ids == sorted(ids)
+    assert all("zinc" in dataset.tags for dataset in zinc)
+    assert catalog.filter_by_tag("no-such-tag") == ()
+
+
+def test_metadata_snapshot_is_cached_but_returned_as_a_copy() -> None:
+    dataset = get_default_catalog().get("chembl_activity_ki_human")
+
+    first = dataset.metadata_snapshot()
+    first["tags"].append("mutated")
+    first["api"]["params"]["mutated"] = True
+    second = dataset.metadata_snapshot()
+
+    assert "mutated" not in second["tags"]
+    assert "mutated" not in second["api"]["params"]
+    assert second == dataset.metadata_snapshot()
+    assert dataset.preferred_filename() is dataset.preferred_filename()
+    assert second["filename"] == dataset.preferred_filename()
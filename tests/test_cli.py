@@ -1,42 +1,46 @@
 from __future__ import annotations
 
+import datetime
+import gzip
 import json
+import math
 import sys
 from pathlib import Path
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from _pytest.capture import CaptureFixture
-from _pytest.monkeypatch import MonkeyPatch
 
-from refua_data import DataCache, DatasetManager
-from refua_data.cli import main
+from refua_data import DataCache, get_default_catalog
+from refua_data import cli as cli_module
+from refua_data.cache import dumps_json
+from refua_data.cli import _json_default, _open_query_dataset, build_parser, main
 
 
 def _write_materialized_fixture(cache_root: Path, *, dataset_id: str = "tox21") -> None:
     cache = DataCache(cache_root)
-    manager = DatasetManager(cache=cache)
-    dataset = manager.catalog.get(dataset_id)
+    dataset = get_default_catalog().get(dataset_id)
 
     parquet_dir = cache.parquet_dir(dataset)
     parquet_dir.mkdir(parents=True, exist_ok=True)
     part_path = parquet_dir / "part-00000.parquet"
 
-    frame = pd.DataFrame(
-        [
-            {"smiles": "CCO", "label": 1, "split": "train"},
-            {"smiles": "CCN", "label": 0, "split": "train"},
-            {"smiles": "CCC", "label": 1, "split": "valid"},
-        ]
+    table = pa.table(
+        {
+            "smiles": ["CCO", "CCN", "CCC"],
+            "label": [1, 0, 1],
+            "split": ["train", "train", "valid"],
+        }
     )
-    frame.to_parquet(part_path, index=False)
+    pq.write_table(table, part_path)
 
     cache.write_json(
         cache.parquet_manifest(dataset),
         {
             "dataset_id": dataset.dataset_id,
             "version": dataset.version,
-            "row_count": len(frame),
+            "row_count": table.num_rows,
             "parts": [part_path.name],
             "source": {"sha256": "fixture"},
             "dataset": dataset.metadata_snapshot(),
@@ -44,20 +48,46 @@ def _write_materialized_fixture(cache_root: Path, *, dataset_id: str = "tox21")
     )
 
 
+def _write_drifted_fixture(cache_root: Path) -> None:
+    """Two parts whose `label` column drifted from integers to strings."""
+    cache = DataCache(cache_root)
+    dataset = get_default_catalog().get("tox21")
+    parquet_dir = cache.parquet_dir(dataset)
+    parquet_dir.mkdir(parents=True)
+    pq.write_table(
+        pa.table({"smiles": ["CCO", "CCN"], "label": [7, 0]}),
+        parquet_dir / "part-00000.parquet",
+    )
+    pq.write_table(
+        pa.table({"smiles": ["CCC"], "label": pa.array(["x"], pa.large_string())}),
+        parquet_dir / "part-00001.parquet",
+    )
+    cache.write_json(
+        cache.parquet_manifest(dataset),
+        {
+            "dataset_id": dataset.dataset_id,
+            "row_count": 3,
+            "parts": ["part-00000.parquet", "part-00001.parquet"],
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def materialized_cache(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared cache root for query tests that never modify the parquet fixture."""
+    cache_root = tmp_path_factory.mktemp("materialized")
+    _write_materialized_fixture(cache_root)
+    return cache_root
+
+
 def test_cli_query_reads_manifest_without_materialize(
-    tmp_path: Path,
+    materialized_cache: Path,
     capsys: CaptureFixture[str],
-    monkeypatch: MonkeyPatch,
 ) -> None:
-    _write_materialized_fixture(tmp_path)
-
-    monkeypatch.setattr(
-        sys,
-        "argv",
+    rc = main(
         [
-            "refua-data",
             "--cache-root",
-            str(tmp_path),
+            str(materialized_cache),
             "query",
             "tox21",
             "--columns",
@@ -67,12 +97,12 @@ def test_cli_query_reads_manifest_without_materialize(
             "--limit",
             "10",
             "--no-materialize-if-missing",
-        ],
+        ]
     )
-    rc = main()
 
     assert rc == 0
     payload = json.loads(capsys.readouterr().out)
+    assert list(payload)[:2] == ["dataset_id", "columns"]
     assert payload["dataset_id"] == "tox21"
     assert payload["returned_rows"] == 2
     assert payload["scanned_parts"] == 1
@@ -83,78 +113,449 @@ def test_cli_query_reads_manifest_without_materialize(
 
 def test_cli_query_without_manifest_returns_error(
     tmp_path: Path,
-    monkeypatch: MonkeyPatch,
 ) -> None:
-    monkeypatch.setattr(
-        sys,
-        "argv",
+    with pytest.raises(ValueError, match="has no parquet manifest"):
+        main(
+            [
+                "--cache-root",
+                str(tmp_path),
+                "query",
+                "tox21",
+                "--no-materialize-if-missing",
+            ]
+        )
+
+
+def test_cli_query_rejects_invalid_filter_json(
+    materialized_cache: Path,
+) -> None:
+    with pytest.raises(ValueError, match="filters must be a valid JSON object"):
+        main(
+            [
+                "--cache-root",
+                str(materialized_cache),
+                "query",
+                "tox21",
+                "--filters",
+                "{not-json",
+                "--no-materialize-if-missing",
+            ]
+        )
+
+
+def test_cli_query_filters_on_non_projected_column(
+    materialized_cache: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    rc = main(
         [
-            "refua-data",
             "--cache-root",
-            str(tmp_path),
+            str(materialized_cache),
             "query",
             "tox21",
+            "--columns",
+            "smiles",
+            "--filters",
+            '{"split":{"eq":"valid"}}',
+            "--limit",
+            "10",
+            "--chunksize",
+            "1",
             "--no-materialize-if-missing",
-        ],
+        ]
     )
-    with pytest.raises(ValueError, match="has no parquet manifest"):
-        main()
 
+    assert rc == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["returned_rows"] == 1
+    assert payload["rows"] == [{"smiles": "CCC"}]
 
-def test_cli_query_rejects_invalid_filter_json(
+
+def test_build_parser_registers_only_requested_subcommand() -> None:
+    parser = build_parser(["--cache-root", "/tmp/x", "query", "demo"])
+    subparsers = parser._subparsers._group_actions[0]  # type: ignore[union-attr]
+    assert list(subparsers.choices) == ["query"]
+
+    args = parser.parse_args(["--cache-root", "/tmp/x", "query", "demo"])
+    assert args.command == "query"
+    assert args.dataset_id == "demo"
+
+    full_parser = build_parser(["--help"])
+    full_subparsers = full_parser._subparsers._group_actions[0]  # type: ignore[union-attr]
+    assert "validate-sources" in full_subparsers.choices
+
+
+def test_build_parser_shared_options_keep_per_command_defaults() -> None:
+    parser = build_parser()
+    mat_all = parser.parse_args(["materialize-all", "--tag", "toxicity", "--force"])
+    assert (mat_all.tag, mat_all.force, mat_all.refresh) == ("toxicity", True, False)
+    assert mat_all.chunksize == 100_000
+
+    materialize = parser.parse_args(["materialize", "demo", "--chunksize", "10"])
+    assert (materialize.chunksize, materialize.timeout_seconds) == (10, 120.0)
+
+    validate = parser.parse_args(["validate-sources", "--json"])
+    assert (validate.json, validate.tag, validate.timeout_seconds) == (True, None, 20.0)
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ('{"smiles":{"contains":"cc"},"label":{"in":[1]}}', ["CCO", "CCC"]),
+        ('{"split":{"ne":"train"}}', ["CCC"]),
+        ('{"label":"1"}', []),
+        ('{"smiles":{"contains":""}}', ["CCO", "CCN", "CCC"]),
+        ('{"label":"1","smiles":{"contains":"co"}}', []),
+        ('{"label":{"in":[1,"x"]},"split":"valid"}', ["CCC"]),
+    ],
+)
+def test_cli_query_filter_operations(
+    materialized_cache: Path,
+    capsys: CaptureFixture[str],
+    filters: str,
+    expected: list[str],
+) -> None:
+    rc = main(
+        [
+            "--cache-root",
+            str(materialized_cache),
+            "query",
+            "tox21",
+            "--columns",
+            "smiles",
+            "--filters",
+            filters,
+            "--no-materialize-if-missing",
+        ]
+    )
+
+    assert rc == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert [row["smiles"] for row in payload["rows"]] == expected
+    assert payload["scanned_rows"] == 3
+
+
+def test_cli_query_prunes_row_groups_by_statistics(
     tmp_path: Path,
-    monkeypatch: MonkeyPatch,
+    capsys: CaptureFixture[str],
 ) -> None:
     _write_materialized_fixture(tmp_path)
+    cache = DataCache(tmp_path)
+    dataset = get_default_catalog().get("tox21")
+    part_path = cache.parquet_dir(dataset) / "part-00000.parquet"
+    pq.write_table(pq.read_table(part_path), part_path, row_group_size=1)
 
-    monkeypatch.setattr(
-        sys,
-        "argv",
+    rc = main(
         [
-            "refua-data",
             "--cache-root",
             str(tmp_path),
             "query",
             "tox21",
             "--filters",
-            "{not-json",
+            '{"smiles":{"eq":"CCN"}}',
             "--no-materialize-if-missing",
-        ],
+        ]
     )
-    with pytest.raises(ValueError, match="filters must be a valid JSON object"):
-        main()
 
+    assert rc == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["rows"] == [{"smiles": "CCN", "label": 0, "split": "train"}]
+    assert payload["scanned_rows"] == 1
 
-def test_cli_query_filters_on_non_projected_column(
+
+def test_cli_query_reuses_opened_dataset_until_parts_change(
     tmp_path: Path,
     capsys: CaptureFixture[str],
-    monkeypatch: MonkeyPatch,
 ) -> None:
     _write_materialized_fixture(tmp_path)
+    argv = ["--cache-root", str(tmp_path), "query", "tox21", "--no-materialize-if-missing"]
 
-    monkeypatch.setattr(
-        sys,
-        "argv",
+    _open_query_dataset.cache_clear()
+    assert main(argv) == 0
+    assert main(argv) == 0
+    assert _open_query_dataset.cache_info().hits == 1
+
+    cache = DataCache(tmp_path)
+    dataset = get_default_catalog().get("tox21")
+    part_path = cache.parquet_dir(dataset) / "part-00000.parquet"
+    pq.write_table(pq.read_table(part_path).slice(0, 1), part_path)
+    capsys.readouterr()
+    assert main(argv) == 0
+    assert json.loads(capsys.readouterr().out)["returned_rows"] == 1
+
+
+@pytest.mark.parametrize("scan", ["arrow", "pandas"])
+def test_cli_query_ne_keeps_rows_with_missing_values(
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    scan: str,
+) -> None:
+    if scan == "pandas":
+
+        def unsupported(*_args: object, **_kwargs: object) -> None:
+            raise pa.ArrowInvalid("force the pandas fallback")
+
+        monkeypatch.setattr(cli_module, "_scan_query_arrow", unsupported)
+    cache = DataCache(tmp_path)
+    dataset = get_default_catalog().get("tox21")
+    parquet_dir = cache.parquet_dir(dataset)
+    parquet_dir.mkdir(parents=True)
+    import pandas as pd
+
+    # Nullable pandas dtypes round-trip through the parquet metadata, so the
+    # pandas fallback compares against pd.NA rather than NaN.
+    frame = pd.DataFrame(
+        {
+            "smiles": ["CCO", "CCN", "CCC"],
+            "label": pd.array([1, None, 0], dtype="Int64"),
+            "split": pd.array(["train", None, "valid"], dtype="string"),
+        }
+    )
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    pq.write_table(table, parquet_dir / "part-00000.parquet")
+    cache.write_json(
+        cache.parquet_manifest(dataset),
+        {"dataset_id": dataset.dataset_id, "row_count": 3, "parts": ["part-00000.parquet"]},
+    )
+
+    rc = main(
         [
-            "refua-data",
             "--cache-root",
             str(tmp_path),
             "query",
             "tox21",
+            "--filters",
+            '{"split":{"ne":"train"}}',
+            "--no-materialize-if-missing",
+        ]
+    )
+
+    assert rc == 0
+    out = capsys.readouterr().out
+    # Missing values print as NaN, as they do for rows read through pandas.
+    assert '"label":NaN' in out
+    rows = json.loads(out)["rows"]
+    assert [row["smiles"] for row in rows] == ["CCN", "CCC"]
+    assert math.isnan(rows[0]["label"]) and math.isnan(rows[0]["split"])
+    assert rows[1] == {"smiles": "CCC", "label": 0, "split": "valid"}
+
+
+@pytest.mark.parametrize("scan", ["arrow", "pandas"])
+def test_cli_query_ne_null_matches_every_row(
+    materialized_cache: Path,
+    capsys: CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    scan: str,
+) -> None:
+    if scan == "pandas":
+
+        def unsupported(*_args: object, **_kwargs: object) -> None:
+            raise pa.ArrowInvalid("force the pandas fallback")
+
+        monkeypatch.setattr(cli_module, "_scan_query_arrow", unsupported)
+    rc = main(
+        [
+            "--cache-root",
+            str(materialized_cache),
+            "query",
+            "tox21",
+            "--filters",
+            '{"split":{"ne":null}}',
+            "--no-materialize-if-missing",
+        ]
+    )
+
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["returned_rows"] == 3
+
+
+def test_cli_query_scans_each_part_with_its_own_schema(
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _write_drifted_fixture(tmp_path)
+
+    def no_fallback(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("the Arrow scan should handle drifted parts")
+
+    monkeypatch.setattr(cli_module, "_scan_query_pandas", no_fallback)
+    rc = main(
+        [
+            "--cache-root",
+            str(tmp_path),
+            "query",
+            "tox21",
+            "--filters",
+            '{"smiles":{"ne":"CCO"}}',
+            "--no-materialize-if-missing",
+        ]
+    )
+
+    assert rc == 0
+    rows = json.loads(capsys.readouterr().out)["rows"]
+    assert rows == [{"smiles": "CCN", "label": 0}, {"smiles": "CCC", "label": "x"}]
+
+
+def test_cli_query_ndjson_falls_back_per_part_on_drifted_types(
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    _write_drifted_fixture(tmp_path)
+    argv = [
+        "--cache-root",
+        str(tmp_path),
+        "query",
+        "tox21",
+        "--filters",
+        '{"label":{"ne":0}}',
+        "--no-materialize-if-missing",
+    ]
+
+    assert main(argv) == 0
+    expected = json.loads(capsys.readouterr().out)["rows"]
+    assert main([*argv, "--ndjson"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+
+    # The string part cannot compare against 0 in Arrow; pandas handles it.
+    assert expected == [{"smiles": "CCO", "label": 7}, {"smiles": "CCC", "label": "x"}]
+    assert [json.loads(line) for line in lines[1:]] == expected
+
+
+def test_cli_query_rejects_unsupported_filter_operation(materialized_cache: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported filter operation 'like'"):
+        main(
+            [
+                "--cache-root",
+                str(materialized_cache),
+                "query",
+                "tox21",
+                "--filters",
+                '{"label":{"eq":1},"smiles":{"like":"C"}}',
+                "--no-materialize-if-missing",
+            ]
+        )
+
+
+def test_cli_query_streams_ndjson(
+    materialized_cache: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    rc = main(
+        [
+            "--cache-root",
+            str(materialized_cache),
+            "query",
+            "tox21",
             "--columns",
             "smiles",
             "--filters",
-            '{"split":{"eq":"valid"}}',
-            "--limit",
-            "10",
-            "--chunksize",
-            "1",
+            '{"label":1}',
+            "--ndjson",
             "--no-materialize-if-missing",
-        ],
+        ]
     )
-    rc = main()
 
     assert rc == 0
-    payload = json.loads(capsys.readouterr().out)
-    assert payload["returned_rows"] == 1
-    assert payload["rows"] == [{"smiles": "CCC"}]
+    lines = capsys.readouterr().out.splitlines()
+    header = json.loads(lines[0])
+    assert header["dataset_id"] == "tox21"
+    assert "rows" not in header
+    assert [json.loads(line) for line in lines[1:]] == [{"smiles": "CCO"}, {"smiles": "CCC"}]
+
+
+def test_cli_materialize_all_in_worker_processes(
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    # Seed raw files so the child processes materialize from the cache offline.
+    cache = DataCache(tmp_path)
+    catalog = get_default_catalog()
+    for dataset_id in ("clintox", "tox21"):
+        raw_path = cache.raw_file(catalog.get(dataset_id))
+        raw_path.parent.mkdir(parents=True)
+        raw_path.write_bytes(gzip.compress(b"smiles,label\nCCO,1\nCCN,0\n"))
+
+    rc = main(
+        [
+            "--cache-root",
+            str(tmp_path),
+            "materialize-all",
+            "--tag",
+            "toxicity",
+            "--processes",
+            "--workers",
+            "2",
+        ]
+    )
+
+    assert rc == 0
+    records = json.loads(capsys.readouterr().out)
+    assert [record["dataset_id"] for record in records] == ["clintox", "tox21"]
+    assert [record["row_count"] for record in records] == [2, 2]
+    for dataset_id in ("clintox", "tox21"):
+        manifest = cache.read_json(cache.parquet_manifest(catalog.get(dataset_id)))
+        assert isinstance(manifest, dict)
+        assert manifest["row_count"] == 2
+
+
+def test_cli_json_output_is_compact_unless_pretty(
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    argv = ["--cache-root", str(tmp_path), "list", "--tag", "toxicity", "--json"]
+
+    assert main(argv) == 0
+    compact = capsys.readouterr().out
+    assert main(["--pretty", *argv]) == 0
+    pretty = capsys.readouterr().out
+
+    assert "\n  " not in compact
+    assert "\n  " in pretty
+    assert json.loads(compact) == json.loads(pretty)
+
+
+@pytest.mark.parametrize("stdlib_encoder", [False, True])
+def test_json_default_matches_across_encoders(stdlib_encoder: bool) -> None:
+    payload = {
+        "day": datetime.date(2024, 1, 2),
+        "at": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC),
+    }
+    encoded = dumps_json(
+        payload, sort_keys=False, indent=False, default=_json_default, stdlib_encoder=stdlib_encoder
+    )
+    assert json.loads(encoded) == {"day": "2024-01-02", "at": "2024-01-02T03:04:05+00:00"}
+
+    with pytest.raises(TypeError):
+        dumps_json(
+            {"value": object()},
+            default=_json_default,
+            stdlib_encoder=stdlib_encoder,
+        )
+
+
+def test_cli_list_does_not_import_tabular_dependencies(tmp_path: Path) -> None:
+    import subprocess
+
+    script = (
+        "import sys\n"
+        "from refua_data.cli import main\n"
+        f"main(['--cache-root', {str(tmp_path)!r}, 'list', '--json'])\n"
+        "assert 'pandas' not in sys.modules and 'pyarrow' not in sys.modules\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=False
+    )
+    assert completed.returncode == 0, completed.stderr
+
+
+def test_cli_list_ndjson_emits_one_dataset_per_line(
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    assert main(["--cache-root", str(tmp_path), "list", "--tag", "toxicity", "--ndjson"]) == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records
+    assert all("toxicity" in record["tags"] for record in records)
@@ -1,21 +1,43 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any
 from urllib.parse import parse_qs, urlparse
 
+import pytest
+import requests
+
+from refua_data import downloader
 from refua_data.cache import DataCache
 from refua_data.catalog import DatasetCatalog
+from refua_data.downloader import fetch_dataset
 from refua_data.models import ApiDatasetConfig, DatasetDefinition
 from refua_data.pipeline import DatasetManager
 
 
 class _ApiHandler(BaseHTTPRequestHandler):
     requests_seen: list[str] = []
+    heads_seen: list[str] = []
+    # Pages whose bodies never depend on the request are encoded once.
+    _CHEMBL_FIRST_PAGE = json.dumps(
+        {
+            "activities": [{"id": 1}, {"id": 2}],
+            "page_meta": {"next": "/chembl/activity.json?offset=2&limit=2"},
+        }
+    ).encode()
+    _CHEMBL_LAST_PAGE = json.dumps(
+        {"activities": [{"id": 3}], "page_meta": {"next": None}}
+    ).encode()
+    _UNIPROT_FIRST_PAGE = json.dumps(
+        {"results": [{"accession": "P00001"}, {"accession": "P00002"}]}
+    ).encode()
+    _UNIPROT_LAST_PAGE = json.dumps({"results": [{"accession": "P00003"}]}).encode()
 
     def do_GET(self) -> None:
         parsed = urlparse(self.path)
@@ -30,46 +52,97 @@ class _ApiHandler(BaseHTTPRequestHandler):
             self._serve_uniprot_page(query)
             return
 
+        if parsed.path == "/chembl/paged.json":
+            self._serve_chembl_counted_page(query)
+            return
+
+        if parsed.path == "/flaky/data.csv":
+            self._serve_flaky_csv()
+            return
+
+        if parsed.path == "/static/data.csv":
+            self._serve_static_csv()
+            return
+
         self.send_response(404)
         self.end_headers()
 
+    def do_HEAD(self) -> None:
+        parsed = urlparse(self.path)
+        self.__class__.heads_seen.append(parsed.path)
+        status = 200 if parsed.path == "/static/data.csv" else 404
+        self.send_response(status)
+        self.end_headers()
+
     def _serve_chembl_page(self, query: dict[str, list[str]]) -> None:
+        # Every ChEMBL fixture pages with limit=2, so only two pages are reachable.
+        if query.get("offset", ["0"])[0] != "0":
+            self._send_body(self._CHEMBL_LAST_PAGE)
+            return
+        self._send_body(self._CHEMBL_FIRST_PAGE)
+
+    def _serve_chembl_counted_page(self, query: dict[str, list[str]]) -> None:
+        total = 9
         offset = int(query.get("offset", ["0"])[0])
         limit = int(query.get("limit", ["2"])[0])
-
-        if offset == 0:
-            payload = {
-                "activities": [{"id": 1}, {"id": 2}],
-                "page_meta": {
-                    "next": f"/chembl/activity.json?offset={offset + limit}&limit={limit}",
-                },
-            }
-        else:
-            payload = {
-                "activities": [{"id": 3}],
-                "page_meta": {"next": None},
-            }
-
+        next_offset = offset + limit
+        next_link = None
+        if next_offset < total:
+            next_link = f"/chembl/paged.json?limit={limit}&offset={next_offset}"
+        payload = {
+            "activities": [{"id": index} for index in range(offset, min(total, next_offset))],
+            "page_meta": {"next": next_link, "total_count": total},
+        }
         self._send_json(payload)
 
     def _serve_uniprot_page(self, query: dict[str, list[str]]) -> None:
         cursor = query.get("cursor", [""])[0]
-        payload = {"results": [{"accession": "P00001"}, {"accession": "P00002"}]}
-        link_header = None
-        if cursor == "":
-            host, port = self.server.server_address
-            link_header = (
-                f'<http://{host}:{port}/uniprot/search?cursor=next&size=2>; rel="next"'
-            )
-        else:
-            payload = {"results": [{"accession": "P00003"}]}
-
-        self._send_json(payload, link_header=link_header)
+        if cursor != "":
+            self._send_body(self._UNIPROT_LAST_PAGE)
+            return
+
+        host, port = self.server.server_address
+        link_header = f'<http://{host}:{port}/uniprot/search?cursor=next&size=2>; rel="next"'
+        self._send_body(self._UNIPROT_FIRST_PAGE, link_header=link_header)
+
+    def _serve_static_csv(self) -> None:
+        etag = '"static-v1"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = b"smiles,label\nCCO,1\n"
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_flaky_csv(self) -> None:
+        body = b"smiles,label\n" + b"CCO,1\n" * 200
+        range_header = self.headers.get("Range")
+        if range_header is None:
+            # Advertise the full body but drop the connection halfway through.
+            self.send_response(200)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", '"flaky-v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body[: len(body) // 2])
+            return
+        start = int(range_header.removeprefix("bytes=").rstrip("-"))
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        self.wfile.write(body[start:])
 
     def _send_json(
         self, payload: dict[str, object], *, link_header: str | None = None
     ) -> None:
-        encoded = json.dumps(payload).encode("utf-8")
+        self._send_body(json.dumps(payload).encode("utf-8"), link_header=link_header)
+
+    def _send_body(self, encoded: bytes, *, link_header: str | None = None) -> None:
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(encoded)))
@@ -85,8 +158,12 @@ class _ApiHandler(BaseHTTPRequestHandler):
 @contextmanager
 def _api_server() -> Iterator[str]:
     _ApiHandler.requests_seen = []
+    _ApiHandler.heads_seen = []
     server = ThreadingHTTPServer(("127.0.0.1", 0), _ApiHandler)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    # shutdown() waits out a full poll, 0.5 s by default, on every teardown.
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
     thread.start()
     try:
         host, port = server.server_address
@@ -136,6 +213,7 @@ def test_fetch_chembl_api_with_pagination_and_cache(tmp_path: Path) -> None:
 
         lines = first.raw_path.read_text(encoding="utf-8").strip().splitlines()
         assert len(lines) == 3
+        assert lines[0] == '{"id":1}'
 
 
 def test_fetch_uniprot_api_link_header_pagination(tmp_path: Path) -> None:
@@ -172,3 +250,183 @@ def test_fetch_uniprot_api_link_header_pagination(tmp_path: Path) -> None:
         lines = fetched.raw_path.read_text(encoding="utf-8").strip().splitlines()
         assert len(lines) == 3
         assert len(_ApiHandler.requests_seen) == 2
+
+
+class _CountingSession(requests.Session):
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_calls = 0
+        self.closed = False
+
+    def get(self, *args: Any, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        self.get_calls += 1
+        return super().get(*args, **kwargs)
+
+    def close(self) -> None:
+        self.closed = True
+        super().close()
+
+
+def test_fetch_reuses_caller_session_without_closing_it(tmp_path: Path) -> None:
+    with _api_server() as base_url:
+        dataset = DatasetDefinition(
+            dataset_id="chembl_toy",
+            name="Chembl Toy",
+            description="Toy chembl api dataset",
+            source="unit-test",
+            homepage="https://example.test",
+            license_name="test",
+            license_url=None,
+            file_format="jsonl",
+            category="test",
+            api=ApiDatasetConfig(
+                endpoint=f"{base_url}/chembl/activity.json",
+                pagination="chembl",
+                items_path="activities",
+                page_size_param="limit",
+                page_size=2,
+            ),
+        )
+
+        session = _CountingSession()
+        fetched = fetch_dataset(
+            dataset, cache=DataCache(tmp_path / "cache"), session=session
+        )
+
+        assert fetched.cache_hit is False
+        assert session.get_calls == 2
+        assert session.closed is False
+        session.close()
+
+
+def test_fetch_refresh_revalidates_only_with_local_copy(tmp_path: Path) -> None:
+    with _api_server() as base_url:
+        dataset = DatasetDefinition(
+            dataset_id="static_csv",
+            name="Static CSV",
+            description="Static csv over http",
+            source="unit-test",
+            homepage="https://example.test",
+            license_name="test",
+            license_url=None,
+            file_format="csv",
+            category="test",
+            urls=(f"{base_url}/static/data.csv",),
+        )
+        manager = DatasetManager(
+            catalog=DatasetCatalog.from_entries([dataset]),
+            cache=DataCache(tmp_path / "cache"),
+        )
+
+        first = manager.fetch("static_csv")
+        # A 304 must backfill a missing checksum in the same metadata write.
+        stale_meta = json.loads(first.metadata_path.read_text(encoding="utf-8"))
+        del stale_meta["sha256"]
+        first.metadata_path.write_text(json.dumps(stale_meta), encoding="utf-8")
+        revalidated = manager.fetch("static_csv", refresh=True)
+        assert revalidated.cache_hit is True
+        assert revalidated.refreshed is True
+        assert revalidated.sha256 == first.sha256
+        meta = json.loads(revalidated.metadata_path.read_text(encoding="utf-8"))
+        assert meta["etag"] == '"static-v1"'
+        assert meta["sha256"] == first.sha256
+        assert "refreshed_at" in meta
+
+        # The raw file is gone but its validators remain: download in full.
+        first.raw_path.unlink()
+        refetched = manager.fetch("static_csv", refresh=True)
+        assert refetched.cache_hit is False
+        assert refetched.raw_path.read_bytes() == b"smiles,label\nCCO,1\n"
+
+
+def test_fetch_chembl_prefetches_counted_pages_in_order(tmp_path: Path) -> None:
+    with _api_server() as base_url:
+        dataset = DatasetDefinition(
+            dataset_id="chembl_paged",
+            name="Chembl Paged",
+            description="Toy chembl api dataset with total_count",
+            source="unit-test",
+            homepage="https://example.test",
+            license_name="test",
+            license_url=None,
+            file_format="jsonl",
+            category="test",
+            api=ApiDatasetConfig(
+                endpoint=f"{base_url}/chembl/paged.json",
+                pagination="chembl",
+                items_path="activities",
+                page_size_param="limit",
+                page_size=2,
+            ),
+        )
+        manager = DatasetManager(
+            catalog=DatasetCatalog.from_entries([dataset]),
+            cache=DataCache(tmp_path / "cache"),
+        )
+
+        fetched = manager.fetch("chembl_paged")
+
+        lines = fetched.raw_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == list(range(9))
+        offsets = sorted(
+            int(parse_qs(urlparse(path).query)["offset"][0])
+            for path in _ApiHandler.requests_seen
+        )
+        assert offsets == [0, 2, 4, 6, 8]
+
+
+def test_fetch_resumes_interrupted_download_with_range(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(downloader, "_RESUME_BACKOFF_SECONDS", 0.0)
+    with _api_server() as base_url:
+        dataset = DatasetDefinition(
+            dataset_id="flaky_csv",
+            name="Flaky CSV",
+            description="CSV whose first response is truncated",
+            source="unit-test",
+            homepage="https://example.test",
+            license_name="test",
+            license_url=None,
+            file_format="csv",
+            category="test",
+            urls=(f"{base_url}/flaky/data.csv",),
+        )
+        manager = DatasetManager(
+            catalog=DatasetCatalog.from_entries([dataset]),
+            cache=DataCache(tmp_path / "cache"),
+        )
+
+        fetched = manager.fetch("flaky_csv")
+
+        body = b"smiles,label\n" + b"CCO,1\n" * 200
+        assert fetched.raw_path.read_bytes() == body
+        assert fetched.sha256 == hashlib.sha256(body).hexdigest()
+        assert fetched.bytes_downloaded == len(body)
+        assert _ApiHandler.requests_seen == ["/flaky/data.csv"] * 2
+
+
+def test_fetch_mirrors_try_first_live_probe_before_declared_order(tmp_path: Path) -> None:
+    with _api_server() as base_url:
+        dataset = DatasetDefinition(
+            dataset_id="mirrored_csv",
+            name="Mirrored CSV",
+            description="CSV whose primary mirror is missing",
+            source="unit-test",
+            homepage="https://example.test",
+            license_name="test",
+            license_url=None,
+            file_format="csv",
+            category="test",
+            urls=(f"{base_url}/missing/data.csv", f"{base_url}/static/data.csv"),
+        )
+        manager = DatasetManager(
+            catalog=DatasetCatalog.from_entries([dataset]),
+            cache=DataCache(tmp_path / "cache"),
+        )
+
+        fetched = manager.fetch("mirrored_csv")
+
+        assert fetched.source_url == f"{base_url}/static/data.csv"
+        assert "/static/data.csv" in _ApiHandler.heads_seen
+        assert _ApiHandler.requests_seen == ["/static/data.csv"]
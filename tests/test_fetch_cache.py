@@ -1,13 +1,17 @@
+import hashlib
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
+from refua_data import downloader
 from refua_data.cache import DataCache
 from refua_data.catalog import DatasetCatalog
 from refua_data.models import DatasetDefinition
 from refua_data.pipeline import DatasetManager
 
+_CSV_SINGLE = b"smiles,label\nCCO,1\n"
+
 
 def _build_manager(source_path: Path, cache_root: Path) -> DatasetManager:
     dataset = DatasetDefinition(
@@ -75,7 +79,7 @@ def _build_bundle_manager(
 
 def test_fetch_uses_local_cache_when_available(tmp_path: Path) -> None:
     source = tmp_path / "source.csv"
-    source.write_text("smiles,label\nCCO,1\nCCC,0\n", encoding="utf-8")
+    source.write_bytes(b"smiles,label\nCCO,1\nCCC,0\n")
 
     manager = _build_manager(source, tmp_path / "cache")
 
@@ -95,12 +99,12 @@ def test_fetch_uses_local_cache_when_available(tmp_path: Path) -> None:
 
 def test_fetch_refresh_detects_updated_file_url(tmp_path: Path) -> None:
     source = tmp_path / "source.csv"
-    source.write_text("smiles,label\nCCO,1\n", encoding="utf-8")
+    source.write_bytes(_CSV_SINGLE)
 
     manager = _build_manager(source, tmp_path / "cache")
 
     first = manager.fetch("toy")
-    source.write_text("smiles,label\nCCO,1\nCCN,0\n", encoding="utf-8")
+    source.write_bytes(b"smiles,label\nCCO,1\nCCN,0\n")
     refreshed = manager.fetch("toy", refresh=True)
 
     assert first.sha256 != refreshed.sha256
@@ -110,7 +114,7 @@ def test_fetch_refresh_detects_updated_file_url(tmp_path: Path) -> None:
 
 def test_fetch_refresh_raises_if_source_is_unavailable(tmp_path: Path) -> None:
     source = tmp_path / "source.csv"
-    source.write_text("smiles,label\nCCO,1\n", encoding="utf-8")
+    source.write_bytes(_CSV_SINGLE)
 
     manager = _build_manager(source, tmp_path / "cache")
     manager.fetch("toy")
@@ -125,8 +129,8 @@ def test_fetch_concat_mode_merges_multiple_sources_and_skips_duplicate_headers(
 ) -> None:
     source_a = tmp_path / "part_a.csv"
     source_b = tmp_path / "part_b.csv"
-    source_a.write_text("smiles,label\nCCO,1\n", encoding="utf-8")
-    source_b.write_text("smiles,label\nCCC,0\n", encoding="utf-8")
+    source_a.write_bytes(_CSV_SINGLE)
+    source_b.write_bytes(b"smiles,label\nCCC,0\n")
 
     manager = _build_concat_manager((source_a, source_b), tmp_path / "cache")
     fetched = manager.fetch("toy_concat")
@@ -140,9 +144,9 @@ def test_fetch_concat_mode_preserves_declared_source_order(tmp_path: Path) -> No
     source_a = tmp_path / "part_a.csv"
     source_b = tmp_path / "part_b.csv"
     source_c = tmp_path / "part_c.csv"
-    source_a.write_text("smiles,label\nA,1\n", encoding="utf-8")
-    source_b.write_text("smiles,label\nB,2\n", encoding="utf-8")
-    source_c.write_text("smiles,label\nC,3\n", encoding="utf-8")
+    source_a.write_bytes(b"smiles,label\nA,1\n")
+    source_b.write_bytes(b"smiles,label\nB,2\n")
+    source_c.write_bytes(b"smiles,label\nC,3\n")
 
     manager = _build_concat_manager((source_b, source_c, source_a), tmp_path / "cache")
     fetched = manager.fetch("toy_concat")
@@ -151,6 +155,27 @@ def test_fetch_concat_mode_preserves_declared_source_order(tmp_path: Path) -> No
     assert merged_lines == ["smiles,label", "B,2", "C,3", "A,1"]
 
 
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_fetch_concat_mode_keeps_mismatched_headers_and_hashes_merged_bytes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, kernel_copy: bool
+) -> None:
+    source_a = tmp_path / "part_a.csv"
+    source_b = tmp_path / "part_b.csv"
+    source_c = tmp_path / "part_c.csv"
+    source_a.write_bytes(b"smiles,label\nA,1\n")
+    source_b.write_bytes(b"smiles,score\nB,2\n")
+    source_c.write_bytes(b"smiles,label\nC,3")
+    if not kernel_copy:
+        monkeypatch.setattr(downloader, "_kernel_copy", lambda *_args, **_kwargs: False)
+
+    manager = _build_concat_manager((source_a, source_b, source_c), tmp_path / "cache")
+    fetched = manager.fetch("toy_concat")
+
+    expected = b"smiles,label\nA,1\nsmiles,score\nB,2\nC,3"
+    assert fetched.raw_path.read_bytes() == expected
+    assert fetched.sha256 == hashlib.sha256(expected).hexdigest()
+
+
 def test_fetch_bundle_mode_downloads_multiple_parquet_parts(tmp_path: Path) -> None:
     source_a = tmp_path / "part_a.parquet"
     source_b = tmp_path / "part_b.parquet"
@@ -169,3 +194,51 @@ def test_fetch_bundle_mode_downloads_multiple_parquet_parts(tmp_path: Path) -> N
         "part_a.parquet",
         "part_b.parquet",
     ]
+
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_fetch_file_url_copy_matches_source_with_and_without_kernel_copy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, kernel_copy: bool
+) -> None:
+    source = tmp_path / "source.csv"
+    payload = b"smiles,label\n" + b"CCO,1\n" * 50_000
+    source.write_bytes(payload)
+    if not kernel_copy:
+        monkeypatch.setattr(downloader, "_kernel_copy", lambda *_args, **_kwargs: False)
+
+    fetched = _build_manager(source, tmp_path / "cache").fetch("toy")
+
+    assert fetched.raw_path.read_bytes() == payload
+    assert fetched.sha256 == hashlib.sha256(payload).hexdigest()
+    assert fetched.raw_path.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+
+def test_fetch_file_url_hard_links_when_allowed(tmp_path: Path) -> None:
+    source = tmp_path / "source.csv"
+    source.write_bytes(_CSV_SINGLE)
+    dataset = DatasetDefinition(
+        dataset_id="toy_link",
+        name="Toy Link",
+        description="Toy linked dataset",
+        source="unit-test",
+        homepage="https://example.test",
+        license_name="test",
+        license_url=None,
+        urls=(source.resolve().as_uri(),),
+        file_format="csv",
+        category="test",
+        allow_link=True,
+    )
+    manager = DatasetManager(
+        catalog=DatasetCatalog.from_entries([dataset]),
+        cache=DataCache(tmp_path / "cache"),
+    )
+
+    fetched = manager.fetch("toy_link")
+    meta = manager.cache.read_json(fetched.metadata_path)
+
+    assert isinstance(meta, dict)
+    assert meta["ingest_mode"] == "link"
+    assert fetched.raw_path.stat().st_ino == source.stat().st_ino
+    assert fetched.sha256 == hashlib.sha256(source.read_bytes()).hexdigest()
+    assert manager.fetch("toy_link").cache_hit is True
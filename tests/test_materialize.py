@@ -1,10 +1,21 @@
+import threading
+import zipfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
 
+from refua_data import io as io_module
+from refua_data import pipeline as pipeline_module
 from refua_data.cache import DataCache
 from refua_data.catalog import DatasetCatalog
-from refua_data.models import DatasetDefinition
+from refua_data.io import iter_dataset_chunks, iter_dataset_tables
+from refua_data.models import DatasetDefinition, MaterializeResult
 from refua_data.pipeline import DatasetManager
 
 
@@ -81,15 +92,19 @@ def test_materialize_writes_parquet_and_manifest(tmp_path: Path) -> None:
     assert first.cache_hit is False
     assert second.cache_hit is True
     assert first.row_count == 3
-    assert len(first.parts) == 2
+    # Chunks are row groups of one part until the part size target is reached.
+    assert len(first.parts) == 1
+    assert pq.ParquetFile(first.parts[0]).num_row_groups == 2
+    assert first.part_strs == tuple(str(part) for part in first.parts)
+    assert first.dataset is manager.catalog.get("toy")
+    assert second.dataset is manager.catalog.get("toy")
+    assert first.manifest == second.manifest == manager.cache.read_json(first.manifest_path)
     assert first.manifest_path.exists()
     manifest = manager.cache.read_json(first.manifest_path)
 
-    loaded = pd.concat(
-        [pd.read_parquet(part) for part in first.parts], ignore_index=True
-    )
-    assert len(loaded) == 3
-    assert set(loaded.columns) == {"smiles", "label"}
+    parquet = ds.dataset(first.part_strs, format="parquet")
+    assert set(parquet.schema.names) == {"smiles", "label"}
+    assert parquet.to_table(columns=["smiles"]).num_rows == 3
     assert isinstance(manifest, dict)
     dataset_meta = manifest.get("dataset")
     assert isinstance(dataset_meta, dict)
@@ -97,7 +112,40 @@ def test_materialize_writes_parquet_and_manifest(tmp_path: Path) -> None:
     assert dataset_meta.get("usage_notes") == ["Toy test dataset"]
 
 
-def test_materialize_reads_parquet_bundle_sources(tmp_path: Path) -> None:
+def test_materialize_memoizes_manifest_hits_until_parts_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pipeline_module, "_PART_TARGET_BYTES", 1)
+    source = tmp_path / "source.csv"
+    source.write_text("smiles,label\nCCO,1\nCCC,0\nCCN,1\n", encoding="utf-8")
+    manager = _build_manager(source, tmp_path / "cache")
+
+    manager.materialize("toy", chunksize=2)
+    second = manager.materialize("toy", chunksize=2)
+    third = manager.materialize("toy", chunksize=2)
+    assert third is second
+
+    # A manifest rewritten without touching the parquet directory is re-read.
+    parquet_dir_mtime_ns = second.parquet_dir.stat().st_mtime_ns
+    manifest = manager.cache.read_json(second.manifest_path)
+    assert isinstance(manifest, dict)
+    manager.cache.write_json(second.manifest_path, {**manifest, "parts": manifest["parts"][:1]})
+    assert second.parquet_dir.stat().st_mtime_ns == parquet_dir_mtime_ns
+    narrowed = manager.materialize("toy", chunksize=2)
+    assert narrowed.cache_hit is True
+    assert narrowed.parts == second.parts[:1]
+    manager.cache.write_json(second.manifest_path, manifest)
+
+    second.parts[1].unlink()
+    rebuilt = manager.materialize("toy", chunksize=2)
+    assert rebuilt.cache_hit is False
+    assert all(part.exists() for part in rebuilt.parts)
+
+
+def test_materialize_reads_parquet_bundle_sources(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pipeline_module, "_PART_TARGET_BYTES", 1)
     source_a = tmp_path / "part_a.parquet"
     source_b = tmp_path / "part_b.parquet"
     pd.DataFrame({"target": ["SRC"], "score": [0.8]}).to_parquet(source_a, index=False)
@@ -107,12 +155,10 @@ def test_materialize_reads_parquet_bundle_sources(tmp_path: Path) -> None:
 
     result = manager.materialize("toy_bundle", chunksize=1)
 
-    loaded = pd.concat(
-        [pd.read_parquet(part) for part in result.parts], ignore_index=True
-    )
+    targets = [pq.read_table(part, columns=["target"]) for part in result.parts]
     assert result.row_count == 2
     assert len(result.parts) == 2
-    assert set(loaded["target"]) == {"SRC", "EGFR"}
+    assert set(pa.concat_tables(targets).column("target").to_pylist()) == {"SRC", "EGFR"}
 
 
 def test_materialize_reads_excel_sources(tmp_path: Path) -> None:
@@ -125,9 +171,227 @@ def test_materialize_reads_excel_sources(tmp_path: Path) -> None:
 
     result = manager.materialize("toy_excel", chunksize=1)
 
-    loaded = pd.concat(
-        [pd.read_parquet(part) for part in result.parts], ignore_index=True
-    )
+    (part,) = result.parts
     assert result.row_count == 2
-    assert len(result.parts) == 2
-    assert set(loaded["cell_line"]) == {"A673", "PFSK-1"}
+    assert pq.read_table(part, columns=["cell_line"]).column("cell_line").to_pylist() == [
+        "A673",
+        "PFSK-1",
+    ]
+
+
+def test_materialize_starts_new_part_when_chunk_schema_drifts(tmp_path: Path) -> None:
+    source_a = tmp_path / "part_a.parquet"
+    source_b = tmp_path / "part_b.parquet"
+    source_c = tmp_path / "part_c.parquet"
+    pd.DataFrame({"target": ["SRC"], "score": [1]}).to_parquet(source_a, index=False)
+    pd.DataFrame({"target": ["ABL1"], "score": [None]}).to_parquet(source_b, index=False)
+    pd.DataFrame({"target": ["EGFR"], "score": ["high"]}).to_parquet(source_c, index=False)
+
+    manager = _build_bundle_manager((source_a, source_b, source_c), tmp_path / "cache")
+    result = manager.materialize("toy_bundle")
+
+    # Nulls cast into the open part; a string score needs a part of its own.
+    assert result.row_count == 3
+    assert [pq.ParquetFile(part).metadata.num_rows for part in result.parts] == [2, 1]
+    assert pq.read_table(result.parts[1]).column("score").to_pylist() == ["high"]
+
+
+def test_materialize_keeps_drifted_values_a_cast_would_coerce(tmp_path: Path) -> None:
+    source_a = tmp_path / "part_a.parquet"
+    source_b = tmp_path / "part_b.parquet"
+    source_c = tmp_path / "part_c.parquet"
+    pq.write_table(pa.table({"code": pa.array([1], pa.int32()), "flag": [1]}), source_a)
+    pq.write_table(pa.table({"code": ["007"], "flag": [True]}), source_b)
+    pq.write_table(pa.table({"code": pa.array([2], pa.int32()), "flag": [0]}), source_c)
+
+    manager = _build_bundle_manager((source_a, source_b, source_c), tmp_path / "cache")
+    result = manager.materialize("toy_bundle")
+
+    rows = [pq.read_table(part).to_pylist() for part in result.parts]
+    assert rows == [
+        [{"code": 1, "flag": 1}],
+        [{"code": "007", "flag": True}],
+        [{"code": 2, "flag": 0}],
+    ]
+
+
+def test_widens_losslessly_allows_only_value_preserving_casts() -> None:
+    widens = pipeline_module._widens_losslessly
+    assert widens(pa.null(), pa.string())
+    assert widens(pa.int32(), pa.int64())
+    assert widens(pa.uint8(), pa.int16())
+    assert widens(pa.int32(), pa.float64())
+    assert widens(pa.string(), pa.large_string())
+    assert not widens(pa.string(), pa.int64())
+    assert not widens(pa.bool_(), pa.int64())
+    assert not widens(pa.int64(), pa.int32())
+    assert not widens(pa.int64(), pa.float64())
+    assert not widens(pa.int8(), pa.uint64())
+
+
+def test_materialize_many_runs_concurrently_in_input_order(tmp_path: Path) -> None:
+    datasets = []
+    for index in range(3):
+        source = tmp_path / f"source{index}.csv"
+        source.write_text("smiles,label\n" + "CCO,1\n" * (index + 1), encoding="utf-8")
+        datasets.append(
+            DatasetDefinition(
+                dataset_id=f"toy{index}",
+                name=f"Toy {index}",
+                description="Toy test dataset",
+                source="unit-test",
+                homepage="https://example.test",
+                license_name="test",
+                license_url=None,
+                urls=(source.resolve().as_uri(),),
+                file_format="csv",
+                category="test",
+                tags=("unit",),
+            )
+        )
+    manager = DatasetManager(
+        catalog=DatasetCatalog.from_entries(datasets),
+        cache=DataCache(tmp_path / "cache"),
+    )
+
+    results = manager.materialize_many([datasets[2], "toy0", "toy1"], max_workers=3)
+
+    assert [result.dataset_id for result in results] == ["toy2", "toy0", "toy1"]
+    assert [result.row_count for result in results] == [3, 1, 2]
+
+    fetched = manager.fetch_many(["toy1", "toy2", "toy0"], max_workers=3)
+    assert [result.dataset_id for result in fetched] == ["toy1", "toy2", "toy0"]
+    assert all(result.cache_hit for result in fetched)
+
+    # Repeated IDs share one fetch instead of racing on the same raw tmp file.
+    forced = manager.fetch_many(["toy0", "toy0", "toy1", "toy0"], force=True, max_workers=4)
+    assert [result.dataset_id for result in forced] == ["toy0", "toy0", "toy1", "toy0"]
+    assert forced[0] is forced[1] is forced[3]
+
+
+def test_materialize_many_builds_repeated_datasets_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "source.csv"
+    source.write_text("smiles,label\n" + "CCO,1\n" * 50, encoding="utf-8")
+    manager = _build_manager(source, tmp_path / "cache")
+    builds: list[str] = []
+    materialize_dataset = manager._materialize_dataset
+
+    def counting(dataset: DatasetDefinition, **kwargs: Any) -> MaterializeResult:
+        builds.append(dataset.dataset_id)
+        return materialize_dataset(dataset, **kwargs)
+
+    monkeypatch.setattr(manager, "_materialize_dataset", counting)
+    results = manager.materialize_many(["toy", "toy", "toy"], force=True, chunksize=7)
+
+    assert builds == ["toy"]
+    assert [result.row_count for result in results] == [50, 50, 50]
+    assert results[0] is results[1] is results[2]
+
+
+def test_iter_materialize_yields_results_lazily(tmp_path: Path) -> None:
+    source = tmp_path / "source.csv"
+    source.write_text("smiles,label\nCCO,1\nCCC,0\n", encoding="utf-8")
+    manager = _build_manager(source, tmp_path / "cache")
+
+    results = manager.iter_materialize(["toy"], max_workers=1)
+    assert not manager.cache.parquet_manifest(manager.catalog.get("toy")).exists()
+
+    first = next(results)
+    assert first.dataset_id == "toy"
+    assert first.row_count == 2
+    assert list(results) == []
+
+
+@pytest.mark.parametrize("block_size", [16 << 20, 256])
+def test_iter_dataset_chunks_matches_pandas_csv_reader(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, block_size: int
+) -> None:
+    # A small Arrow block infers `value` as int64 from the first rows and then
+    # hits a string mid-file, exercising the pandas resume path.
+    monkeypatch.setattr(io_module, "_ARROW_CSV_BLOCK_SIZE", block_size)
+    rows = ["smiles,value,assayed_on,note,tag,flag"]
+    for index in range(120):
+        value = "pending" if index == 100 else str(index)
+        note = "" if index % 3 else "ok"
+        # pandas-only NA tokens ("None", "<NA>") and pandas boolean spellings.
+        tag = ("None", "<NA>", "n/a", "kinase")[index % 4]
+        flag = "true" if index % 2 else "False"
+        rows.append(f"C{index},{value},2024-01-{index % 28 + 1:02d},{note},{tag},{flag}")
+    source = tmp_path / "source.csv"
+    source.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    dataset = _build_manager(source, tmp_path / "cache").catalog.get("toy")
+
+    chunks = list(iter_dataset_chunks(source, dataset=dataset, chunksize=50))
+
+    expected = io_module.prepare_dataframe(pd.read_csv(source, low_memory=False))
+    combined = pd.concat(chunks, ignore_index=True)
+    assert [len(chunk) for chunk in chunks] == [50, 50, 20]
+    assert combined["smiles"].tolist() == expected["smiles"].tolist()
+    assert combined["value"].astype(str).tolist() == expected["value"].astype(str).tolist()
+    assert combined["assayed_on"].tolist() == expected["assayed_on"].tolist()
+    assert combined["note"].isna().tolist() == expected["note"].isna().tolist()
+    assert combined["tag"].isna().tolist() == expected["tag"].isna().tolist()
+    assert combined["tag"].dropna().tolist() == expected["tag"].dropna().tolist()
+    assert combined["flag"].dtype == expected["flag"].dtype == bool
+    assert combined["flag"].tolist() == expected["flag"].tolist()
+
+
+def test_iter_dataset_tables_streams_arrow_without_pandas_roundtrip(tmp_path: Path) -> None:
+    source = tmp_path / "source.csv"
+    source.write_text("smiles,label\nCCO,1\nCCN,\nCCC,0\n", encoding="utf-8")
+    dataset = _build_manager(source, tmp_path / "cache").catalog.get("toy")
+
+    tables = list(iter_dataset_tables(source, dataset=dataset, chunksize=2))
+
+    assert [table.num_rows for table in tables] == [2, 1]
+    assert tables[0].schema.metadata is None
+    assert tables[0].column("label").to_pylist() == [1, None]
+
+
+def test_choose_zip_member_prefers_suffix_order_then_first_file(tmp_path: Path) -> None:
+    archive_path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("docs/", "")
+        archive.writestr("docs/README", "readme")
+        archive.writestr("notes.TXT", "notes")
+        archive.writestr("data/rows.CSV", "smiles\nCCO\n")
+        archive.writestr("data/other.csv", "smiles\nCCC\n")
+    with zipfile.ZipFile(archive_path) as archive:
+        assert io_module._choose_zip_member(archive) == "data/rows.CSV"
+
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("docs/", "")
+        archive.writestr("docs/README", "readme")
+        archive.writestr("data.bin", "binary")
+    with zipfile.ZipFile(archive_path) as archive:
+        assert io_module._choose_zip_member(archive) == "docs/README"
+
+
+def test_prefetched_preserves_order_and_reraises_producer_errors() -> None:
+    assert list(pipeline_module._prefetched(range(10), 2)) == list(range(10))
+
+    def failing() -> Iterator[int]:
+        yield 1
+        raise ValueError("bad chunk")
+
+    seen: list[int] = []
+    with pytest.raises(ValueError, match="bad chunk"):
+        for item in pipeline_module._prefetched(failing(), 2):
+            seen.append(item)
+    assert seen == [1]
+
+    closed = threading.Event()
+
+    def endless() -> Iterator[int]:
+        try:
+            while True:
+                yield 0
+        finally:
+            closed.set()
+
+    prefetched = pipeline_module._prefetched(endless(), 1)
+    assert next(prefetched) == 0
+    prefetched.close()
+    assert closed.is_set()
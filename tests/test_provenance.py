@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
+from refua_data import cache as cache_module
 from refua_data.provenance import (
     build_data_provenance_record,
     load_materialized_manifest,
@@ -57,3 +60,18 @@ def test_load_materialized_manifest_rejects_missing(tmp_path: Path) -> None:
         assert "does not exist" in str(exc)
     else:
         raise AssertionError("expected ValueError for missing manifest")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_materialized_manifest_rejects_invalid_json_with_either_parser(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(cache_module, "_orjson", None)
+    manifest = tmp_path / "manifest.json"
+    manifest.write_bytes(b'{"dataset_id": "x", "parts": []}')
+    assert load_materialized_manifest(manifest)["dataset_id"] == "x"
+
+    manifest.write_bytes(b"{not json")
+    with pytest.raises(ValueError, match="not valid JSON"):
+        load_materialized_manifest(manifest)
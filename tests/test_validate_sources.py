@@ -7,38 +7,71 @@ from contextlib import contextmanager
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import requests
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from refua_data import cache as cache_module
+from refua_data import validation as validation_module
 from refua_data.cache import DataCache
 from refua_data.catalog import DatasetCatalog
+from refua_data.cli import _print_json
 from refua_data.models import ApiDatasetConfig, DatasetDefinition
 from refua_data.pipeline import DatasetManager
+from refua_data.validation import SourceValidationResult
+
+_OK_CSV = b"smiles,label\nCCO,1\n"
+_OK_CSV_LENGTH = str(len(_OK_CSV))
+_SEARCH_PAYLOAD = json.dumps({"results": [{"id": "P1"}]}).encode("utf-8")
 
 
 class _ValidationHandler(BaseHTTPRequestHandler):
+    # Keep-alive lets the per-thread validation sessions reuse their connections.
+    protocol_version = "HTTP/1.1"
+    rendezvous: threading.Barrier | None = None
+
     def do_GET(self) -> None:
         if self.path.startswith("/ok.csv"):
-            payload = b"smiles,label\nCCO,1\n"
             self.send_response(200)
             self.send_header("Content-Type", "text/csv")
-            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("Content-Length", _OK_CSV_LENGTH)
             self.end_headers()
-            self.wfile.write(payload)
+            self.wfile.write(_OK_CSV)
             return
 
-        if self.path.startswith("/missing.csv"):
-            self.send_response(404)
+        if self.path.startswith("/api/search"):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(_SEARCH_PAYLOAD)))
             self.end_headers()
+            self.wfile.write(_SEARCH_PAYLOAD)
             return
 
-        if self.path.startswith("/api/search"):
-            payload = json.dumps({"results": [{"id": "P1"}]}).encode("utf-8")
+        self._send_empty(404)
+
+    def do_HEAD(self) -> None:
+        if self.path.startswith("/rendezvous.csv") and self.rendezvous is not None:
+            # Only answers once every probe is in flight at the same time.
+            try:
+                self.rendezvous.wait()
+            except threading.BrokenBarrierError:
+                self._send_empty(503)
+                return
+            self._send_empty(200)
+            return
+
+        if self.path.startswith("/ok.csv") or self.path.startswith("/head-only.csv"):
             self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("Content-Type", "text/csv")
+            self.send_header("Content-Length", _OK_CSV_LENGTH)
             self.end_headers()
-            self.wfile.write(payload)
             return
 
-        self.send_response(404)
+        self._send_empty(405)
+
+    def _send_empty(self, status: int) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
     def log_message(self, format: str, *args: object) -> None:
@@ -48,7 +81,10 @@ class _ValidationHandler(BaseHTTPRequestHandler):
 @contextmanager
 def _server() -> Iterator[str]:
     server = ThreadingHTTPServer(("127.0.0.1", 0), _ValidationHandler)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    # shutdown() waits out a full poll, 0.5 s by default, on every teardown.
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
     thread.start()
     try:
         host, port = server.server_address
@@ -61,7 +97,7 @@ def _server() -> Iterator[str]:
 
 def test_validate_sources_for_file_http_and_api(tmp_path: Path) -> None:
     local_file = tmp_path / "local.csv"
-    local_file.write_text("smiles,label\nCCC,0\n", encoding="utf-8")
+    local_file.write_bytes(b"smiles,label\nCCC,0\n")
 
     with _server() as base:
         datasets = [
@@ -101,6 +137,18 @@ def test_validate_sources_for_file_http_and_api(tmp_path: Path) -> None:
                 category="test",
                 urls=(f"{base}/missing.csv",),
             ),
+            DatasetDefinition(
+                dataset_id="http_head_only",
+                name="HTTP HEAD only",
+                description="answers HEAD but not GET",
+                source="unit",
+                homepage="https://example.test",
+                license_name="test",
+                license_url=None,
+                file_format="csv",
+                category="test",
+                urls=(f"{base}/head-only.csv",),
+            ),
             DatasetDefinition(
                 dataset_id="http_mirror",
                 name="HTTP Mirror",
@@ -164,8 +212,9 @@ def test_validate_sources_for_file_http_and_api(tmp_path: Path) -> None:
             cache=DataCache(tmp_path / "cache"),
         )
 
-        results = manager.validate_sources(timeout_seconds=5)
+        results = manager.validate_sources(timeout_seconds=5, max_workers=2)
         by_id = {result.dataset_id: result for result in results}
+        assert [result.dataset_id for result in results] == sorted(by_id)
 
         assert by_id["local_file"].ok is True
         assert by_id["local_file"].source_type == "file"
@@ -173,6 +222,10 @@ def test_validate_sources_for_file_http_and_api(tmp_path: Path) -> None:
         assert by_id["http_ok"].ok is True
         assert by_id["http_ok"].source_type == "http"
 
+        assert by_id["http_head_only"].ok is True
+        assert by_id["http_head_only"].details.get("content_length") == "19"
+
+        # HEAD is rejected with 405, so the ranged GET decides the outcome.
         assert by_id["http_bad"].ok is False
         assert by_id["http_bad"].status_code == 404
 
@@ -195,3 +248,101 @@ def test_validate_sources_for_file_http_and_api(tmp_path: Path) -> None:
         assert by_id["api_ok"].ok is True
         assert by_id["api_ok"].source_type == "api"
         assert by_id["api_ok"].details.get("sample_items") == 1
+
+
+def test_validate_sources_probes_datasets_concurrently(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_ValidationHandler, "rendezvous", threading.Barrier(4, timeout=5))
+    with _server() as base:
+        datasets = [
+            DatasetDefinition(
+                dataset_id=f"slow_{index}",
+                name=f"Slow {index}",
+                description="slow http",
+                source="unit",
+                homepage="https://example.test",
+                license_name="test",
+                license_url=None,
+                file_format="csv",
+                category="test",
+                urls=(f"{base}/rendezvous.csv?dataset={index}",),
+            )
+            for index in range(4)
+        ]
+        manager = DatasetManager(
+            catalog=DatasetCatalog.from_entries(datasets),
+            cache=DataCache(tmp_path / "cache"),
+        )
+        results = manager.validate_sources(timeout_seconds=10.0, max_workers=4)
+
+    assert [result.dataset_id for result in results] == [f"slow_{i}" for i in range(4)]
+    assert all(result.ok for result in results)
+
+
+def test_validate_concat_parts_reuse_one_session_per_worker(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    built: list[object] = []
+    build_session = validation_module._build_session
+
+    def counting_build_session() -> requests.Session:
+        session = build_session()
+        built.append(session)
+        return session
+
+    monkeypatch.setattr(validation_module, "_MAX_VALIDATION_WORKERS", 2)
+    monkeypatch.setattr(validation_module, "_build_session", counting_build_session)
+
+    with _server() as base:
+        dataset = DatasetDefinition(
+            dataset_id="many_parts",
+            name="many parts",
+            description="http concat",
+            source="unit-test",
+            homepage="https://example.test",
+            license_name="test",
+            license_url=None,
+            file_format="csv",
+            category="test",
+            urls=tuple(f"{base}/ok.csv?part={index}" for index in range(6)),
+            url_mode="concat",
+        )
+        (result,) = validation_module.validate_dataset_sources(dataset, timeout_seconds=5.0)
+
+    assert result.ok is True
+    assert 1 <= len(built) <= 2
+
+
+def test_validation_results_serialize_without_intermediate_dicts(
+    monkeypatch: MonkeyPatch,
+    capsys: CaptureFixture[str],
+) -> None:
+    result = SourceValidationResult(
+        dataset_id="demo",
+        source_type="http",
+        source="https://example.test/demo.csv",
+        ok=True,
+        status_code=200,
+        latency_ms=12.345678,
+        details={"content_length": 10},
+    )
+    assert result.latency_ms == 12.346
+
+    _print_json({"results": [result]}, pretty=False)
+    native = capsys.readouterr().out
+    monkeypatch.setattr(cache_module, "_orjson", None)
+    _print_json({"results": [result]}, pretty=False)
+    fallback = capsys.readouterr().out
+
+    assert json.loads(native) == json.loads(fallback)
+    assert json.loads(fallback)["results"][0] == {
+        "dataset_id": "demo",
+        "source_type": "http",
+        "source": "https://example.test/demo.csv",
+        "ok": True,
+        "status_code": 200,
+        "latency_ms": 12.346,
+        "error": None,
+        "details": {"content_length": 10},
+    }